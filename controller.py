@@ -42,6 +42,11 @@ class Controller:
         self.view = view
         self.view.controller = self
         self.truststore={}
+        # Secret headers already read from the card, None while they must be read again
+        # (declared before the CardConnector, which may already report an inserted card)
+        self._secrets_cache: Optional[Dict[str, Any]] = None
+        # Result of card_verify_authenticity for the inserted card
+        self._auth_cache: Optional[Tuple[Any, ...]] = None
 
         try:
             self.cc = CardConnector(self, loglevel=loglevel)
@@ -159,6 +164,8 @@ class Controller:
             self.view.show("ERROR", "An unexpected error occurred during PIN setup", "Ok", None,
                            "./pictures_db/change_pin_popup_icon.jpg")
             raise ControllerError(f"008 Failed to set up native PIN: {e}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     @log_method
     def verify_pin(self, pin: str):
@@ -329,6 +336,8 @@ class Controller:
                 "./pictures_db/edit_label_icon_ws.jpg"
             )
             raise ControllerError(f"007 Failed to edit label: {e}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     @log_method
     def get_card_label_infos(self) -> Optional[str]:
@@ -569,6 +578,8 @@ class Controller:
         except Exception as e:
             logger.error(f"Unexpected error during backup: {str(e)}", exc_info=True)
             raise ValueError(f"Failed to make backup: {str(e)}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     ####################################################################################################################
     """MY SECRETS MANAGEMENT"""
@@ -576,13 +587,45 @@ class Controller:
     @log_method
     def retrieve_secrets_stored_into_the_card(self) -> Dict[str, Any]:
         try:
+            if self._secrets_cache is not None:
+                logger.debug("Secrets served from cache")
+                return self._secrets_cache
             headers = self.cc.seedkeeper_list_secret_headers()
             logger.log(SUCCESS, f"Secrets retrieved successfully: {headers}")
-            return self._format_secret_headers(headers)
+            self._secrets_cache = self._format_secret_headers(headers)
+            return self._secrets_cache
         except Exception as e:
             logger.error(f"Error retrieving secrets: {e}")
             raise ControllerError(f"Failed to retrieve secrets: {e}")
 
+    def invalidate_secrets_cache(self):
+        # Every method that writes to the card calls this in a finally, once the write has returned or failed:
+        # the imports run off the Tk thread, so a listing taken during the write must not outlive it
+        if self._secrets_cache is not None:
+            logger.debug("Secrets cache invalidated")
+        self._secrets_cache = None
+
+    def invalidate_card_caches(self):
+        # Card inserted, removed or disconnected: everything read from the previous card is stale
+        self.invalidate_secrets_cache()
+        self._auth_cache = None
+
+    @log_method
+    def get_cached_authenticity(self) -> Tuple[Any, ...]:
+        # The certificate chain check is a long APDU exchange and its result only changes with the card
+        if self._auth_cache is None:
+            self._auth_cache = tuple(self.cc.card_verify_authenticity())
+        else:
+            logger.debug("Card authenticity served from cache")
+        return self._auth_cache
+
+    @log_method
+    def reset_secret(self, secret_id):
+        try:
+            return self.cc.seedkeeper_reset_secret(secret_id)
+        finally:
+            self.invalidate_secrets_cache()
+
     def _format_secret_headers(self, headers: List[Dict[str, Any]]) -> Dict[str, Any]:
 
         formatted_headers = []
@@ -791,6 +834,8 @@ class Controller:
         except Exception as e:
             logger.error(f"Unexpected error during password import: {str(e)}")
             raise ControllerError(f"Failed to import password: {str(e)}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     @log_method
     def import_masterseed(self, label: str, mnemonic: str, passphrase: Optional[str] = None):
@@ -853,6 +898,8 @@ class Controller:
         except Exception as e:
             logger.error(f"006 Unexpected error during masterseed import: {str(e)}")
             raise ControllerError(f"007 Failed to import masterseed: {str(e)}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     @log_method
     def import_free_text(self, label: str, free_text: str):
@@ -892,6 +939,8 @@ class Controller:
         except Exception as e:
             logger.error(f"Unexpected error during free text import: {str(e)}")
             raise ControllerError(f"Failed to import free text: {str(e)}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     @log_method
     def import_wallet_descriptor(self, label: str, wallet_descriptor: str):
@@ -934,6 +983,8 @@ class Controller:
         except Exception as e:
             logger.error(f"Unexpected error during wallet descriptor import: {str(e)}")
             raise ControllerError(f"Failed to import wallet descriptor: {str(e)}") from e
+        finally:
+            self.invalidate_secrets_cache()
 
     """
     IMPORT BACKUP
@@ -1021,6 +1072,8 @@ class Controller:
             logger.error(f"Unexpected error during backup import: {e}", exc_info=True)
             self.view.show('ERROR', f"An unexpected error occurred: {str(e)}", 'Ok', None)
             return None
+        finally:
+            self.invalidate_secrets_cache()
 
     @log_method
     def parse_secret_header(self, secret_dic):
@@ -70,25 +70,32 @@ class ColoredFormatter(logging.Formatter):
 
 
 def log_method(func):
+    logger = logging.getLogger(func.__module__)
+    name_upper = func.__name__.upper()
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
+        # The level is read on every call (setup_logging may run after the decoration);
+        # the logger caches isEnabledFor
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Log entry with a distinct format
-        logger.debug(f"{Fore.CYAN}▼ ENTERING IN {func.__name__.upper()} ▼{Style.RESET_ALL}")
+        if debug:
+            logger.debug(f"{Fore.CYAN}▼ ENTERING IN {name_upper} ▼{Style.RESET_ALL}")
 
         try:
             result = func(*args, **kwargs)
-
-            # Log exit with a different distinct format
-            logger.debug(f"{Fore.MAGENTA}▲ EXITING FROM {func.__name__.upper()} ▲{Style.RESET_ALL}")
-
-            return result
         except Exception as e:
             # Log exception with a different color
             logger.exception(f"{Fore.RED + Back.YELLOW}! Exception in {func.__name__}: {e}{Style.RESET_ALL}")
             raise
 
+        # Log exit with a different distinct format
+        if debug:
+            logger.debug(f"{Fore.MAGENTA}▲ EXITING FROM {name_upper} ▲{Style.RESET_ALL}")
+
+        return result
+
     return wrapper
 
 
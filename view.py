@@ -3,13 +3,20 @@ import sys
 import os
 from typing import Optional, Dict, Callable, Any, Tuple
 import gc
-import webbrowser
+import logging
+import functools
+import secrets
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import customtkinter
 import tkinter
-from tkinter import StringVar
+from tkinter import StringVar, ttk
 
 from PIL import Image, ImageTk
+# Only PNG and JPEG pictures are shipped: load those plugins now rather than on the first open
+from PIL import JpegImagePlugin, PngImagePlugin  # noqa: F401
 from customtkinter import CTkOptionMenu
 
 from controller import Controller
@@ -18,10 +25,13 @@ from log_config import log_method, setup_logging
 from exceptions import *
 
 from pysatochip.version import PYSATOCHIP_VERSION
+from version import VERSION
 from pysatochip.CardConnector import UninitializedSeedError, SeedKeeperError, UnexpectedSW12Error, CardError
 
 logger = get_logger(__name__)
 
+Image.preinit()
+
 # Constants
 BG_MAIN_MENU = "#21283b"
 BG_BUTTON = "#e1e1e0"
@@ -32,6 +42,193 @@ DEFAULT_BG_COLOR = "whitesmoke"
 ICON_PATH = "./pictures_db/"
 APP_VERSION = "0.1.0"
 HIGHLIGHT_COLOR = "#D3D3D3"
+# (fg_color, text_color) of the even and odd rows of the tables, indexed by row_index & 1
+_ROW_STYLES = ((DEFAULT_BG_COLOR, TEXT_COLOR), (BG_HOVER_BUTTON, BUTTON_TEXT_COLOR))
+# Card picture for each card_type reported by pysatochip
+CARD_IMAGE_PATHS = {
+    "Satochip": "./pictures_db/card_satochip.png",
+    "SeedKeeper": "./pictures_db/card_seedkeeper.png",
+    "Satodime": "./pictures_db/card_satodime.png",
+}
+INSERT_CARD_IMAGE_PATH = "./pictures_db/insert_card.png"
+
+# Settings forms built by View._build_form_view: header, instruction lines ({card_type} is filled in),
+# then (label, rely, View attribute, masked) for each entry; the first entry gets the focus
+_FORM_VIEW_SPECS = {
+    "change_pin": {
+        "header": ("Change PIN", "change_pin_popup_icon.jpg"),
+        "instructions": (
+            "Change your personal PIN code.",
+            "We strongly encourage you to set up a strong password between 4 and 16",
+            "characters. You can use symbols, lower and upper cases, letters and",
+            "numbers.",
+        ),
+        "entries": (
+            ("Current PIN:", 0.40, "current_pin_entry", True),
+            ("New PIN code:", 0.55, "new_pin_entry", True),
+            ("Repeat new PIN code:", 0.70, "confirm_new_pin_entry", True),
+        ),
+    },
+    "edit_label": {
+        "header": ("Edit Label", "edit_label_icon_ws.jpg"),
+        "instructions": (
+            "Edit the label of your {card_type}.",
+            "The label is a tag that identifies your card. It can be used to distinguish",
+            "several cards, or to associate it with a person, a name or a story.",
+        ),
+        "entries": (
+            ("Label:", 0.40, "edit_card_entry", False),
+        ),
+    },
+}
+
+# Layout of the two seed detail frames of view_my_secrets: a raw masterseed shows its secret type and the
+# mnemonic only, a mnemonic adds the passphrase and the SeedQR button
+_SEED_FRAME_VARIANTS = {
+    'masterseed': dict(type_text=None, entry_rely=0.27, with_passphrase=False, mnemonic_rely=(0.65, 0.8),
+                       delete_place=dict(rely=0.98, anchor="se")),
+    'mnemonic': dict(type_text='Mnemonic seedphrase', entry_rely=0.255, with_passphrase=True,
+                     mnemonic_rely=(0.63, 0.77), delete_place=dict(rely=0.95, anchor="e")),
+}
+
+# (text, relx, rely, bold) of the warning shown under a card that failed the authenticity check
+_AUTHENTICITY_WARNING_LABELS = (
+    ("Warning!", 0.045, 0.7, True),
+    ("We could not authenticate the issuer of this card.", 0.045, 0.75, False),
+    ("If you did not load the card applet by yourself, be extremely careful!", 0.045, 0.8, False),
+    ("Contact support@satochip.io to report any suspicious device.", 0.045, 0.85, False),
+)
+
+# Widget options shared by every lateral menu frame and view canvas
+_MENU_FRAME_KW = dict(width=250, height=600, bg_color=BG_MAIN_MENU, fg_color=BG_MAIN_MENU, corner_radius=0,
+                      border_color="black", border_width=0)
+_CANVAS_KW = dict(bg=DEFAULT_BG_COLOR, width=750, height=600)
+
+# Icons drawn by the two lateral menus, warmed into the _load_icon cache once the app is idle
+_MENU_ICON_NAMES = (
+    "secrets_icon.png", "insert_card_icon.jpg", "generate_icon.png", "generate_locked_icon.png",
+    "import_icon.png", "import_locked_icon.png", "logs_icon.png", "settings_icon.png",
+    "settings_locked_icon.png", "help_icon.png", "webshop_icon.png", "setup_my_card_icon.png",
+    "setup_done_icon.jpg", "seed.png", "change_pin_icon.png", "change_pin_locked_icon.jpg",
+    "edit_label_icon.png", "edit_label_locked_icon.jpg", "check_authenticity_icon.png",
+    "check_authenticity_locked_icon.jpg", "back_to_seedkeeper_icon.png", "about_locked_icon.jpg",
+)
+_MENU_ICON_SIZE = (20, 20)
+
+# Success-path logs in the widget factories are only emitted in dev runs (SEEDKEEPER_DEV=1)
+_PROD = os.environ.get("SEEDKEEPER_DEV") != "1"
+
+
+def _read_image(path: str) -> Image.Image:
+    # Decode into a standalone image so the file descriptor is released right away
+    with Image.open(path) as source:
+        source.load()
+        return source.copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _load_icon(path: str, size: Tuple[int, int]) -> customtkinter.CTkImage:
+    # Decoded once at the displayed size; the source file is closed right after decoding
+    with Image.open(path) as source:
+        source.load()
+        image = source.convert("RGBA")
+    if image.size != size:
+        image.thumbnail(size, Image.Resampling.BILINEAR)
+    logger.debug("Icon loaded and cached: %s %s", path, size)
+    return customtkinter.CTkImage(image, size=size)
+
+
+@functools.lru_cache(maxsize=16)
+def _font(family: Optional[str], size: int, weight: str = "normal") -> customtkinter.CTkFont:
+    # Shared named fonts: needs a Tk root, so only call once the View exists (family None = theme font)
+    return customtkinter.CTkFont(family=family, size=size, weight=weight)
+
+
+# Character classes of the login/password generator, in the order of its checkboxes
+_PASSWORD_CHARSETS = (
+    "abcdefghijklmnopqrstuvwxyz",
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "0123456789",
+    "!@#$%^&*()-_=+[]{}|;:,.<>?/~`",
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _password_pool(selection: Tuple[bool, ...]) -> str:
+    # One pool per combination of checkboxes, joined once
+    return "".join(charset for charset, selected in zip(_PASSWORD_CHARSETS, selection) if selected)
+
+
+# Attributes of the cached views restored with their frame (see _cache_current_view).
+# The generator forms do not depend on the card: built once, and emptied by their on_hide hook each time they are hidden
+_HELP_ATTRS = ('header', 'text_box', 'language_radio_value')
+_GENERATE_MNEMONIC_ATTRS = ('header', 'mnemonic_label_name', 'radio_value', 'use_passphrase', 'mnemonic_textbox',
+                            'passphrase_entry', 'generate_save_button')
+_GENERATE_PASSWORD_ATTRS = ('header', 'generate_label_name', 'generate_login', 'generate_login_name',
+                            'generate_url', 'generate_url_name', 'length_slider', 'var_abc', 'var_ABC',
+                            'var_numeric', 'var_symbolic', 'password_text_box', 'generate_save_button')
+
+
+# Handles released by _clear_current_frame on every view switch, with their known kind:
+# widgets are destroyed, images are simply dropped
+_CLEAR_HANDLERS = {
+    'header': 'widget',
+    'canvas': 'widget',
+    'background_photo': 'image',
+    'text_box': 'widget',
+    'button': 'widget',
+    'finish_button': 'widget',
+    'menu': 'widget',
+}
+
+# Base directory of the bundled resources, resolved once at import
+_APPLICATION_PATH = sys._MEIPASS if getattr(sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_bg_path(picture_path: str) -> str:
+    return os.path.normpath(os.path.join(_APPLICATION_PATH, picture_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _form_label_specs(form: str, card_type: Optional[str]) -> Tuple[Tuple[str, float, float, bool], ...]:
+    # Static labels of a settings form laid out once per card type, ready for View._create_labels_bulk
+    spec = _FORM_VIEW_SPECS[form]
+    instructions = tuple((text.format(card_type=card_type), 0.05, 0.20 + i * 0.05, False)
+                         for i, text in enumerate(spec["instructions"]))
+    return instructions + tuple((label_text, 0.05, rely, True) for label_text, rely, _, _ in spec["entries"])
+
+
+def _open_webshop():
+    # webbrowser is only needed if the user actually follows the link
+    import webbrowser
+    webbrowser.open("https://satochip.io/shop/", new=2)
+
+
+class _LazyBackgroundPhoto:
+    """Opened background image whose PhotoImage is only built when first displayed."""
+
+    def __init__(self, image: Image.Image):
+        self._image = image
+        self._photo: Optional[ImageTk.PhotoImage] = None
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        # Read from the header, no pixel decode needed
+        return self._image.size
+
+    @property
+    def photo(self) -> ImageTk.PhotoImage:
+        if self._photo is None:
+            self._photo = ImageTk.PhotoImage(self._image)
+            logger.debug("Background photo converted to PhotoImage")
+        return self._photo
+
+
+@functools.lru_cache(maxsize=16)
+def _background_photo(path: str) -> _LazyBackgroundPhoto:
+    # The app only ships a handful of backgrounds: keep each decoded image and its PhotoImage for the app lifetime
+    return _LazyBackgroundPhoto(_read_image(path))
 
 
 class View(customtkinter.CTk):
@@ -83,6 +280,14 @@ class View(customtkinter.CTk):
                 logger.error(f"Failed to initialize controller: {e}")
                 raise InitializationError("Controller initialization failed") from e
 
+            # PIL decodes of the background pictures run here, PhotoImages are still built on the Tk thread
+            self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="view-io")
+            # Card imports leave the Tk thread too; a single worker keeps the APDU exchanges serialized
+            self._card_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="view-card")
+
+            # Decode the menu icons one per idle slot so the first menu draw finds them ready
+            self.after_idle(self._preload_menu_icons, iter(_MENU_ICON_NAMES))
+
             logger.log(SUCCESS, "View initialization completed successfully")
         except InitializationError as e:
             logger.critical(f"View initialization failed: {e}", exc_info=True)
@@ -129,9 +334,12 @@ class View(customtkinter.CTk):
             self.mnemonic_textbox: Optional[customtkinter.CTkTextbox] = None
             self.password_text_box_active: bool = False
             self.password_text_box: Optional[customtkinter.CTkTextbox] = None
+            # Bumped on each mnemonic request: a result coming back for an older one is dropped
+            self.mnemonic_generation: int = 0
             logger.debug("Application state attributes initialized")
 
-            logger.log(SUCCESS, "All attributes initialized successfully to their default values")
+            if not _PROD:
+                logger.log(SUCCESS, "All attributes initialized successfully to their default values")
         except AttributeError as e:
             logger.error(f"AttributeError in _initialize_attributes: {e}", exc_info=True)
             raise AttributeInitializationError(f"007 Failed to initialize attributes: {e}") from e
@@ -156,7 +364,9 @@ class View(customtkinter.CTk):
                 self.pkg_dir = os.path.split(os.path.realpath(__file__))[0]
                 logger.debug("Running live, setting pkg_dir to script directory")
 
-            logger.debug(f"PKGDIR set to: {self.pkg_dir}")
+            logger.debug("PKGDIR set to: %s", self.pkg_dir)
+            self._icons_dir = os.path.normpath(os.path.join(self.pkg_dir, "pictures_db"))
+            logger.debug("Icons directory set to: %s", self._icons_dir)
             logger.log(SUCCESS, "Package directory set successfully")
         except Exception as e:
             logger.error(f"Error setting package directory: {e}", exc_info=True)
@@ -176,10 +386,11 @@ class View(customtkinter.CTk):
             try:
                 window_width = 1000
                 window_height = 600
-                screen_width = self.winfo_screenwidth()
-                screen_height = self.winfo_screenheight()
-                center_x = int((screen_width - window_width) / 2)
-                center_y = int((screen_height - window_height) / 2)
+                # Screen size read once, reused to center the popups
+                self._screen_w = self.winfo_screenwidth()
+                self._screen_h = self.winfo_screenheight()
+                center_x = int((self._screen_w - window_width) / 2)
+                center_y = int((self._screen_h - window_height) / 2)
                 self.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
                 logger.debug(
                     f"Window geometry set successfully to {window_width}x{window_height}, centered on screen")
@@ -191,11 +402,25 @@ class View(customtkinter.CTk):
                 self.main_frame = customtkinter.CTkFrame(self, width=1000, height=600, bg_color='black',
                                                          fg_color='black')
                 self.main_frame.place(relx=0.5, rely=0.5, anchor="center")
+                # Fixed size frame: stop Tk from recomputing its size from its children
+                self.main_frame.pack_propagate(False)
+                self.main_frame.grid_propagate(False)
                 logger.debug("Main frame created and placed successfully")
             except tkinter.TclError as e:
                 logger.error(f"Failed to create or place main frame: {e}")
                 raise FrameCreationError("010 Failed to create or place main frame") from e
 
+            # Colours of the secrets table (the only ttk widget of the app), configured once on its own
+            # style names so the application theme is left untouched; sizes are scaled per table build
+            style = ttk.Style(self)
+            style.configure("Secrets.Treeview", background=DEFAULT_BG_COLOR, fieldbackground=DEFAULT_BG_COLOR,
+                            borderwidth=0)
+            style.configure("Secrets.Treeview.Heading", background=BG_MAIN_MENU, foreground=BUTTON_TEXT_COLOR,
+                            relief="flat")
+            style.map("Secrets.Treeview.Heading", background=[("active", BG_MAIN_MENU)])
+            style.map("Secrets.Treeview", background=[("selected", HIGHLIGHT_COLOR)],
+                      foreground=[("selected", TEXT_COLOR)])
+
             logger.log(SUCCESS, "Main window setup completed successfully")
         except (WindowSetupError, FrameCreationError) as e:
             logger.error(f"Error in _setup_main_window: {e}", exc_info=True)
@@ -208,10 +433,11 @@ class View(customtkinter.CTk):
         try:
             logger.info("Starting widget declaration")
             self.current_frame: Optional[customtkinter.CTkFrame] = None
+            self.welcome_frame: Optional[customtkinter.CTkFrame] = None
             logger.debug("Current frame initialized")
 
             self.canvas: Optional[customtkinter.CTkCanvas] = None
-            self.background_photo: Optional[ImageTk.PhotoImage] = None
+            self.background_photo: Optional[_LazyBackgroundPhoto] = None
             self.create_background_photo: Optional[callable] = None
             logger.debug("Canvas and background photo attributes initialized")
 
@@ -224,11 +450,26 @@ class View(customtkinter.CTk):
             logger.debug("Button attributes initialized")
 
             self.menu: Optional[customtkinter.CTkFrame] = None
+            self._seedkeeper_menu: Optional[customtkinter.CTkFrame] = None
+            self.__logo_photo: Optional[ImageTk.PhotoImage] = None
+            self._seedkeeper_menu_buttons: Dict[str, customtkinter.CTkButton] = {}
+            # Satochip-utils menu kept between views as long as the card state does not change
+            self._utils_menu: Optional[customtkinter.CTkFrame] = None
+            self._utils_menu_sig: Optional[tuple] = None
             self.counter: Optional[int] = None
             self.display_menu: bool = False
             logger.debug("Menu attributes initialized")
 
-            logger.log(SUCCESS, "All widgets declared successfully")
+            self._geometry_deferred: bool = False
+            self._pending_places: list = []
+            logger.debug("Deferred geometry attributes initialized")
+
+            # Static views kept hidden between visits: key -> (frame, handles, on_hide)
+            self._view_cache: Dict[str, Tuple[customtkinter.CTkFrame, Dict[str, Any], Optional[Callable]]] = {}
+            logger.debug("View cache initialized")
+
+            if not _PROD:
+                logger.log(SUCCESS, "All widgets declared successfully")
         except AttributeError as e:
             logger.error(f"AttributeError in _declare_widgets: {e}", exc_info=True)
             raise UIElementError(f"Failed to declare widgets: {e}") from e
@@ -240,7 +481,8 @@ class View(customtkinter.CTk):
         try:
             logger.info("Starting close protocol setup")
             self.protocol("WM_DELETE_WINDOW", self._on_close_app)
-            logger.log(SUCCESS, "Close protocol set successfully")
+            if not _PROD:
+                logger.log(SUCCESS, "Close protocol set successfully")
         except tkinter.TclError as e:
             logger.error(f"TclError in _set_close_protocol: {e}", exc_info=True)
             raise UIElementError(f"004 Failed to set close protocol: {e}") from e
@@ -254,10 +496,13 @@ class View(customtkinter.CTk):
             logger.info("Starting application closure")
             self.app_open = False
             logger.debug("App open flag set to False")
-            self.controller.cc.card_disconnect()
-            logger.debug("Card disconnected successfully")
-            self.destroy()
-            logger.debug("Application closed successfully")
+            # Hide the window right away; a stuck PC/SC daemon must not freeze the UI on exit
+            self.withdraw()
+            self._io_pool.shutdown(wait=False)
+            self._card_pool.shutdown(wait=False)
+            threading.Thread(target=self._background_disconnect, daemon=True).start()
+            self.after(200, self.destroy)
+            logger.debug("Application closure scheduled")
             logger.log(SUCCESS, 'Application closed successfully')
         except tkinter.TclError as e:
             logger.error(f"TclError while closing application: {e}", exc_info=True)
@@ -270,9 +515,24 @@ class View(customtkinter.CTk):
             self.quit()
             logger.warning("Forced application quit due to unexpected error during closure")
 
-    def _restart_app(self):
+    def _background_disconnect(self):
+        try:
+            self.controller.cc.card_disconnect()
+            logger.debug("Card disconnected successfully")
+        except Exception as e:
+            logger.warning(f"Error while disconnecting card: {e}")
+
+    def _restart_app(self, hard: bool = False):
         try:
             logger.info("Starting application restart")
+            if not hard:
+                try:
+                    self._soft_reset()
+                    logger.log(SUCCESS, "Application soft restart started")
+                    return
+                except Exception as e:
+                    logger.error(f"Soft reset failed, falling back to hard restart: {e}", exc_info=True)
+            self.withdraw()
             self.destroy()
             logger.debug("Current application instance destroyed")
             logger.log(SUCCESS, "Application restart successfully")
@@ -284,10 +544,50 @@ class View(customtkinter.CTk):
             logger.error(f"Unexpected error during application restart: {e}", exc_info=True)
             raise ApplicationRestartError(f"Unexpected error during application restart: {e}") from e
 
+    def _soft_reset(self):
+        # Reset UI state and card connection without leaving the interpreter
+        logger.info("Starting application soft reset")
+        self._clear_current_frame()
+        self._clear_welcome_frame()
+        self._delete_seedkeeper_menu()
+        for menu in (self._seedkeeper_menu, self._utils_menu):
+            if menu is not None:
+                menu.destroy()
+        self._seedkeeper_menu = None
+        self._utils_menu = None
+        self._utils_menu_sig = None
+        self._invalidate_view()
+        logger.debug("Frames and menu destroyed")
+
+        self.controller.invalidate_card_caches()
+        self.in_backup_process = False
+        self.in_start_backup_process = False
+        self.in_step_1_backup_process = False
+        self.in_step_2_backup_process = False
+        self._initialize_attributes()
+        logger.debug("Attributes reset to their default values")
+
+        def _rebuild_welcome(_):
+            self.view_welcome()
+            logger.log(SUCCESS, "Application soft reset completed")
+
+        # The card worker runs the disconnect after any import still in flight, and the welcome
+        # screen is only rebuilt once it has returned; _background_disconnect logs its own errors
+        self._run_in_background(self._background_disconnect, _rebuild_welcome, _rebuild_welcome,
+                                pool=self._card_pool)
+
     ########################################
     # FOR UI MANAGEMENT
     ########################################
 
+    @property
+    def _logo_photo(self) -> ImageTk.PhotoImage:
+        # Shared by both lateral menus; a PhotoImage needs the Tk root, hence per instance
+        if self.__logo_photo is None:
+            self.__logo_photo = ImageTk.PhotoImage(_read_image(os.path.join(self._icons_dir, "logo.png")))
+            logger.debug("Menu logo decoded")
+        return self.__logo_photo
+
     def _create_label(
             self,
             text,
@@ -300,11 +600,10 @@ class View(customtkinter.CTk):
 
             if bg_fg_color is not None:
                 try:
-                    logger.debug(f"Creating label with background color: {bg_fg_color}")
+                    logger.debug("Creating label with background color: %s", bg_fg_color)
                     label = customtkinter.CTkLabel(self.current_frame, text=text, bg_color=bg_fg_color,
                                                    fg_color=bg_fg_color,
-                                                   font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                              weight="normal"))
+                                                   font=_font("Outfit", 18, "normal"))
                     logger.debug("Label created with specified background color")
                 except Exception as e:
                     logger.warning(f"ThemeError while creating label with background color: {e}")
@@ -315,8 +614,7 @@ class View(customtkinter.CTk):
                     logger.debug("Creating label with default whitesmoke background")
                     label = customtkinter.CTkLabel(self.current_frame, text=text, bg_color="whitesmoke",
                                                    fg_color="whitesmoke",
-                                                   font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                              weight="normal"))
+                                                   font=_font("Outfit", 18, "normal"))
                     logger.debug("Label created with default background")
                 except Exception as e:
                     logger.warning(f"ThemeError while creating label with default background: {e}")
@@ -326,43 +624,72 @@ class View(customtkinter.CTk):
                 logger.debug("Creating label with transparent background")
                 label = customtkinter.CTkLabel(self.current_frame, text=text, bg_color="transparent",
                                                fg_color="transparent",
-                                               font=customtkinter.CTkFont(family="Outfit", size=16,
-                                                                          weight="normal"))
+                                               font=_font("Outfit", 16, "normal"))
                 logger.debug("Label created with transparent background")
 
-            logger.log(SUCCESS, f"Label created successfully with text: '{text}'")
+            if not _PROD:
+                logger.log(SUCCESS, f"Label created successfully with text: '{text}'")
             return label
         except Exception as e:
             logger.error(f"Unexpected error in _create_label: {e}", exc_info=True)
             raise LabelCreationError(f"Failed to create label: {e}") from e
 
+    def _create_labels_bulk(self, specs, anchor: str = "w") -> list:
+        # specs: (text, relx, rely, bold); placements are flushed together by _defer_geometry
+        labels = []
+        bold_font = None
+        with self._defer_geometry():
+            for text, relx, rely, bold in specs:
+                label = self._create_label(text)
+                if bold:
+                    if bold_font is None:
+                        bold_font = self._make_text_bold()
+                    label.configure(font=bold_font)
+                self._place_later(label, relx=relx, rely=rely, anchor=anchor)
+                labels.append(label)
+        return labels
+
+    def _create_labeled_entry(
+            self,
+            text,
+            relx: float,
+            rely_label: float,
+            rely_entry: float,
+            value: Optional[str] = None,
+            show_option: Optional[str] = None,
+            width: Optional[int] = None,
+            anchor: str = "nw",
+            entry_relx: Optional[float] = None
+    ) -> Tuple[customtkinter.CTkLabel, customtkinter.CTkEntry]:
+        # Label above its entry, both placed through _place_later (flushed together inside _defer_geometry)
+        try:
+            label = self._create_label(text)
+            self._place_later(label, relx=relx, rely=rely_label, anchor=anchor)
+            entry = self._create_entry(show_option=show_option)
+            if width is not None:
+                entry.configure(width=width)
+            if value is not None:
+                entry.insert(0, value)
+            self._place_later(entry, relx=relx if entry_relx is None else entry_relx, rely=rely_entry, anchor=anchor)
+            return label, entry
+        except Exception as e:
+            logger.error(f"Error creating labeled entry '{text}': {e}", exc_info=True)
+            raise EntryCreationError(f"Failed to create labeled entry '{text}': {e}") from e
+
     def _make_text_bold(
             self,
             size=None
     ) -> customtkinter.CTkFont:
         try:
-            logger.info("Entering make_text_bold method")
-
-            logger.debug("Configuring bold font")
-            try:
-                if size is not None:
-                    logger.debug(f"Setting bold font with size: {size}")
-                    result = customtkinter.CTkFont(weight="bold", size=size)
-                else:
-                    logger.debug("Setting bold font with default size")
-                    result = customtkinter.CTkFont(weight="bold", size=18)
-            except Exception as e:
-                logger.error(f"An error occurred while setting the bold font: {e}", exc_info=True)
-                raise
-
-            logger.log(SUCCESS, "make_text_bold method completed successfully")
-            return result
+            # Font shared through the _font cache: same object for every view and size
+            return _font(None, 18 if size is None else size, "bold")
         except Exception as e:
             logger.error(f"An unexpected error occurred in make_text_bold: {e}", exc_info=True)
 
     def _create_entry(
             self,
-            show_option: Optional[str] = None
+            show_option: Optional[str] = None,
+            textvariable: Optional[StringVar] = None
     ) -> customtkinter.CTkEntry:
         try:
             logger.info("Starting entry creation")
@@ -370,19 +697,21 @@ class View(customtkinter.CTk):
 
             try:
                 if show_option is not None:
-                    logger.debug(f"Creating entry with secure write option: {show_option}")
+                    logger.debug("Creating entry with secure write option: %s", show_option)
                     entry = customtkinter.CTkEntry(self.current_frame, width=555, height=37, corner_radius=10,
                                                    bg_color='white', fg_color=BG_BUTTON, border_color=BG_BUTTON,
-                                                   show=f"{show_option}", text_color='black')
+                                                   show=f"{show_option}", text_color='black',
+                                                   textvariable=textvariable)
                     logger.debug("Entry created with secure write option")
                 else:
                     logger.debug("Creating entry without secure write option")
                     entry = customtkinter.CTkEntry(self.current_frame, width=555, height=37, corner_radius=10,
                                                    bg_color='white', fg_color=BG_BUTTON, border_color=BG_BUTTON,
-                                                   text_color='black')
+                                                   text_color='black', textvariable=textvariable)
                     logger.debug("Entry created without secure write option")
 
-                logger.log(SUCCESS, "Entry created successfully")
+                if not _PROD:
+                    logger.log(SUCCESS, "Entry created successfully")
                 return entry
             except Exception as e:
                 logger.error(f"ThemeError while creating entry: {e}", exc_info=True)
@@ -408,7 +737,8 @@ class View(customtkinter.CTk):
                 textbox.configure(pady=40)  # Ajustez le nombre pour mieux centrer
 
                 logger.debug("Textbox created successfully")
-                logger.log(SUCCESS, "Textbox created successfully")
+                if not _PROD:
+                    logger.log(SUCCESS, "Textbox created successfully")
                 return textbox
             except Exception as e:
                 logger.error(f"ThemeError while creating textbox: {e}", exc_info=True)
@@ -441,8 +771,8 @@ class View(customtkinter.CTk):
                 dropdown_hover_color=BG_HOVER_BUTTON,  # Couleur au survol des options
                 dropdown_text_color="white",  # Couleur du texte des options
                 text_color="grey",  # Couleur du texte sélectionné
-                font=customtkinter.CTkFont(family="Outfit", size=13, weight="normal"),
-                dropdown_font=customtkinter.CTkFont(family="Outfit", size=13, weight="normal"),
+                font=_font("Outfit", 13, "normal"),
+                dropdown_font=_font("Outfit", 13, "normal"),
                 corner_radius=10,  # Même rayon de coin que les entrées
             )
 
@@ -466,7 +796,7 @@ class View(customtkinter.CTk):
                 text=text,
                 command=command,
                 corner_radius=100,
-                font=customtkinter.CTkFont(family="Outfit", size=18, weight="normal"),
+                font=_font("Outfit", 18, "normal"),
                 bg_color=DEFAULT_BG_COLOR,
                 fg_color=BG_MAIN_MENU,
                 hover_color=BG_HOVER_BUTTON,
@@ -474,7 +804,8 @@ class View(customtkinter.CTk):
                 width=120,
                 height=35
             )
-            logger.log(SUCCESS, f"Welcome button '{text}' created successfully")
+            if not _PROD:
+                logger.log(SUCCESS, f"Welcome button '{text}' created successfully")
             return button
         except Exception as e:
             error_msg = f"Failed to create welcome button '{text}': {e}"
@@ -495,22 +826,21 @@ class View(customtkinter.CTk):
                 if command is None:
                     logger.debug("Creating button without command")
                     button = customtkinter.CTkButton(self.current_frame, text=text, corner_radius=100,
-                                                     font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                                weight="normal"),
+                                                     font=_font("Outfit", 18, "normal"),
                                                      bg_color='white', fg_color=BG_MAIN_MENU,
                                                      hover_color=BG_HOVER_BUTTON, cursor="hand2", width=120, height=35)
                     logger.debug("Button created without command")
                 else:
                     logger.debug(" Creating button with command")
                     button = customtkinter.CTkButton(self.current_frame, text=text, corner_radius=100,
-                                                     font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                                weight="normal"),
+                                                     font=_font("Outfit", 18, "normal"),
                                                      bg_color='white', fg_color=BG_MAIN_MENU,
                                                      hover_color=BG_HOVER_BUTTON, cursor="hand2", width=120, height=35,
                                                      command=command)
                     logger.debug("Button created with command")
 
-                logger.log(SUCCESS, f"Button created successfully with text: '{text}'")
+                if not _PROD:
+                    logger.log(SUCCESS, f"Button created successfully with text: '{text}'")
                 return button
             except Exception as e:
                 logger.error(f"Error while creating button: {e}", exc_info=True)
@@ -534,18 +864,15 @@ class View(customtkinter.CTk):
             logger.debug("002 Header frame created")
 
             if title_text and icon_name:
-                icon_path = f"{ICON_PATH}{icon_name}"
+                icon_path = os.path.join(self._icons_dir, icon_name)
                 try:
-                    image = Image.open(icon_path)
-                    photo_image = customtkinter.CTkImage(image, size=(40, 40))
+                    photo_image = _load_icon(icon_path, (40, 40))
                     logger.debug("003 Icon loaded and resized")
 
                     button = customtkinter.CTkButton(header_frame, text=f"   {title_text}", image=photo_image,
-                                                     font=customtkinter.CTkFont(family="Outfit", size=25,
-                                                                                weight="bold"),
+                                                     font=_font("Outfit", 25, "bold"),
                                                      bg_color="whitesmoke", fg_color="whitesmoke", text_color="black",
                                                      hover_color="whitesmoke", compound="left")
-                    button.image = photo_image
                     button.place(rely=0.5, relx=0, anchor="w")
                     logger.debug("004 Header button created and placed")
                 except FileNotFoundError:
@@ -555,7 +882,8 @@ class View(customtkinter.CTk):
                     logger.error(f"007 Error while creating header button: {e}")
                     raise HeaderCreationError(f"008 Failed to create header button: {e}")
 
-            logger.log(SUCCESS, "009 Header created successfully")
+            if not _PROD:
+                logger.log(SUCCESS, "009 Header created successfully")
             return header_frame
         except Exception as e:
             logger.error(f"010 Unexpected error in _create_an_header: {e}", exc_info=True)
@@ -571,11 +899,108 @@ class View(customtkinter.CTk):
                                                         fg_color=DEFAULT_BG_COLOR,
                                                         bg_color=DEFAULT_BG_COLOR)
             self.current_frame.place(relx=0.250, rely=0.5, anchor='w')
-            logger.log(SUCCESS, "003 New frame created and placed successfully")
+            self.current_frame.pack_propagate(False)
+            self.current_frame.grid_propagate(False)
+            if not _PROD:
+                logger.log(SUCCESS, "003 New frame created and placed successfully")
         except Exception as e:
             logger.error(f"004 Error in _create_frame: {e}", exc_info=True)
             raise FrameCreationError(f"005 Failed to create frame: {e}") from e
 
+    def _cache_current_view(self, key: str, attrs: Tuple[str, ...], on_hide: Optional[Callable] = None):
+        # Keep the frame alive, with the handles the view reads back through self;
+        # attrs names every widget and variable of the view, shared handles like 'header' included;
+        # on_hide runs each time the frame leaves the screen, while those handles are still current
+        frame = self.current_frame
+        if frame is None:
+            return
+        handles = {attr: self.__dict__.get(attr) for attr in attrs}
+        self._view_cache[key] = (frame, handles, on_hide)
+        logger.debug("View '%s' cached with handles %s", key, list(handles))
+
+    def _show_cached_view(self, key: str) -> bool:
+        cached = self._view_cache.get(key)
+        if cached is None:
+            return False
+        frame, handles, _ = cached
+        self.current_frame = frame
+        self.__dict__.update(handles)
+        frame.place(relx=0.250, rely=0.5, anchor='w')
+        logger.debug("View '%s' restored from cache", key)
+        return True
+
+    def _invalidate_view(self, key: Optional[str] = None):
+        # Drop one cached view, or all of them when no key is given
+        keys = [key] if key is not None else list(self._view_cache)
+        for k in keys:
+            cached = self._view_cache.pop(k, None)
+            if cached is None:
+                continue
+            frame, handles, _ = cached
+            if frame is self.current_frame:
+                # Its handles are the live ones: nothing may reach the destroyed widgets through self
+                for attr in handles:
+                    self.__dict__[attr] = None
+                self.current_frame = None
+            frame.destroy()
+            logger.debug("Cached view '%s' destroyed", k)
+
+    def _is_cached_view(self, widget) -> bool:
+        return any(widget is frame for frame, _, _ in self._view_cache.values())
+
+    def _hide_cached_view(self, widget):
+        for frame, _, on_hide in self._view_cache.values():
+            if widget is frame and on_hide is not None:
+                on_hide()
+        widget.place_forget()
+
+    @contextmanager
+    def _defer_geometry(self):
+        # Queue the place()/pack()/grid() calls made through _place_later/_pack_later/_grid_later
+        # and flush them in one pass
+        if self._geometry_deferred:
+            # Nested block (e.g. a menu built inside a view): the outermost block flushes
+            yield
+            return
+        logger.debug("Deferring geometry management")
+        self._geometry_deferred = True
+        try:
+            yield
+        except BaseException:
+            # The view failed half-built: drop its pending calls so the original error propagates unmasked
+            self._geometry_deferred = False
+            logger.debug("Deferred geometry dropped for %s widgets", len(self._pending_places))
+            self._pending_places = []
+            raise
+        self._geometry_deferred = False
+        pending, self._pending_places = self._pending_places, []
+        # Issued in call order, which pack relies on for the stacking of siblings
+        for geometry_call, kwargs in pending:
+            geometry_call(**kwargs)
+        self.update_idletasks()
+        logger.debug("Geometry flushed for %s deferred widgets", len(pending))
+
+    def _place_later(self, widget, **kwargs):
+        if self._geometry_deferred:
+            self._pending_places.append((widget.place, kwargs))
+        else:
+            widget.place(**kwargs)
+        return widget
+
+    def _pack_later(self, widget, **kwargs):
+        if self._geometry_deferred:
+            self._pending_places.append((widget.pack, kwargs))
+        else:
+            widget.pack(**kwargs)
+        return widget
+
+    def _grid_later(self, widget, **kwargs):
+        if self._geometry_deferred:
+            self._pending_places.append((widget.grid, kwargs))
+        else:
+            widget.grid(**kwargs)
+        return widget
+
     def _create_scrollable_frame(
             self,
             parent_frame,
@@ -589,7 +1014,7 @@ class View(customtkinter.CTk):
 
             # Create a frame to hold the canvas and scrollbar
             container = customtkinter.CTkFrame(parent_frame, width=width, height=height, fg_color=DEFAULT_BG_COLOR)
-            container.place(x=x, y=y)
+            self._place_later(container, x=x, y=y)
             container.pack_propagate(False)  # Prevent the frame from shrinking to fit its contents
 
             # Create a canvas with specific dimensions
@@ -613,9 +1038,14 @@ class View(customtkinter.CTk):
             # Add that frame to a window in the canvas
             canvas_window = canvas.create_window((0, 0), window=inner_frame, anchor="nw")
 
+            canvas._scroll_height = 0
+
             def _configure_inner_frame(event):
                 # Update the scrollregion to encompass the inner frame
-                canvas.configure(scrollregion=canvas.bbox("all"))
+                bbox = canvas.bbox("all")
+                canvas.configure(scrollregion=bbox)
+                # Cache the scrollable height so the wheel handler doesn't walk the canvas items
+                canvas._scroll_height = bbox[3] if bbox else 0
 
                 # Resize the inner frame to fit the canvas width
                 canvas.itemconfig(canvas_window, width=canvas.winfo_width())
@@ -630,21 +1060,28 @@ class View(customtkinter.CTk):
 
             def _on_mousewheel(event):
                 # Check if there's actually something to scroll
-                if canvas.bbox("all")[3] <= canvas.winfo_height():
+                if canvas._scroll_height <= canvas.winfo_height() or not event.delta:
                     return  # No scrolling needed, so do nothing
 
-                if event.delta > 0:
-                    canvas.yview_scroll(-1, "units")
-                elif event.delta < 0:
-                    canvas.yview_scroll(1, "units")
+                # Windows reports multiples of 120 per notch (multi-notch scrolls included), macOS small deltas
+                canvas.yview_scroll(-event.delta // 120 or (-1 if event.delta > 0 else 1), "units")
 
-            # Bind mouse wheel to the canvas
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            # Route the mouse wheel to this canvas only while the pointer is over it
+            canvas.bind("<MouseWheel>", _on_mousewheel)
+            canvas.bind("<Enter>", lambda event: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+
+            def _on_leave_canvas(event):
+                # Crossing onto an embedded row widget also fires <Leave>: only unbind once the pointer is outside
+                hovered = canvas.winfo_containing(event.x_root, event.y_root)
+                if hovered is None or not str(hovered).startswith(str(canvas)):
+                    canvas.unbind_all("<MouseWheel>")
+
+            canvas.bind("<Leave>", _on_leave_canvas)
 
             logger.log(SUCCESS, "002 Scrollable frame created successfully")
             return inner_frame
         except Exception as e:
-            logger.error(f"003 Error in _create_scrollable_frame: {e}", exc_info=True)
+            logger.error("003 Error in _create_scrollable_frame: %s", e, exc_info=True)
             raise FrameCreationError(f"004 Failed to create scrollable frame: {e}") from e
 
     def _clear_current_frame(self):
@@ -658,11 +1095,15 @@ class View(customtkinter.CTk):
             if self.app_open is True and self.current_frame is not None:
                 logger.info("001 Starting current frame clearing process")
                 if hasattr(self, 'current_frame') and self.current_frame:
-                    for widget in self.current_frame.winfo_children():
-                        widget.destroy()
-                        logger.debug("002 Widget destroyed")
-                    self.current_frame.destroy()
-                    logger.debug("003 Current frame destroyed")
+                    if self._is_cached_view(self.current_frame):
+                        # Cached view: emptied then hidden, it is placed again on the next visit
+                        self._hide_cached_view(self.current_frame)
+                        logger.debug("003 Cached frame hidden")
+                    else:
+                        # Destroying the frame tears down all its descendants in a single Tk call
+                        self.current_frame.destroy()
+                        self.current_frame.master = None
+                        logger.debug("003 Current frame destroyed")
                     self.current_frame = None
                     if self.mnemonic_textbox_active is True and self.mnemonic_textbox is not None:
                         self.mnemonic_textbox.destroy()
@@ -677,102 +1118,154 @@ class View(customtkinter.CTk):
                     pass
 
             # Nettoyage des attributs spécifiques
-            attributes_to_clear = ['header', 'canvas', 'background_photo', 'text_box', 'button', 'finish_button',
-                                   'menu']
-            for attr in attributes_to_clear:
-                if hasattr(self, attr):
-                    attr_value = getattr(self, attr)
-                    if attr_value:
-                        if isinstance(attr_value, (customtkinter.CTkBaseClass, tkinter.BaseWidget)):
-                            attr_value.destroy()
-                            logger.debug(f"005 Attribute {attr} destroyed")
-                        elif isinstance(attr_value, ImageTk.PhotoImage):
-                            del attr_value
-                            logger.debug(f"006 ImageTk.PhotoImage {attr} deleted")
-                    setattr(self, attr, None)
-                    logger.debug(f"007 Attribute {attr} set to None")
+            attributes = self.__dict__
+            cached_handles = [value for _, handles, _ in self._view_cache.values() for value in handles.values()]
+            for attr, kind in _CLEAR_HANDLERS.items():
+                attr_value = attributes.get(attr)
+                # Reset to None rather than removing: the views read these handles after a clear
+                attributes[attr] = None
+                if attr_value is None or any(attr_value is value for value in cached_handles):
+                    continue
+                if attr == 'menu':
+                    if attr_value is self._utils_menu:
+                        # Left on screen: the next settings view takes it back without a new place()
+                        self.after_idle(self._hide_unclaimed_utils_menu)
+                    else:
+                        self._dispose_menu(attr_value)
+                elif kind == 'widget':
+                    attr_value.destroy()
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("005 Attribute %s destroyed", attr)
 
             # Réinitialisation des variables d'état si nécessaire
             self.display_menu = False
             self.counter = None
             logger.debug("008 State variables reset")
 
-            # Forcer le garbage collector
-            gc.collect()
-            logger.debug("009 Garbage collection forced")
+            # Refcounting already frees the destroyed widgets; only sweep the youngest generation when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                gc.collect(generation=0)
+                logger.debug("009 Young generation garbage collection done")
 
             logger.log(SUCCESS, "010 Current frame and associated objects cleared successfully")
         except Exception as e:
-            logger.error(f"011 Unexpected error in _clear_current_frame: {e}", exc_info=True)
+            logger.error("011 Unexpected error in _clear_current_frame: %s", e, exc_info=True)
             raise FrameClearingError(f"012 Failed to clear current frame: {e}") from e
 
+    def _reset_frames(self):
+        # Always in the same order: welcome screen, then current view
+        if self.welcome_frame is not None:
+            self._clear_welcome_frame()
+        self._clear_current_frame()
+
     def _clear_welcome_frame(self):
         try:
             logger.info("Starting to clear welcome frame")
-            if hasattr(self, 'welcome_frame'):
+            if self.welcome_frame is not None:
                 try:
                     self.welcome_frame.destroy()
                     logger.debug("frame destroyed")
-                    delattr(self, 'welcome_frame')
-                    logger.debug("attribute removed")
+                    self.welcome_frame = None
+                    logger.debug("attribute reset")
                     logger.log(SUCCESS, "Welcome frame cleared successfully")
                 except Exception as e:
-                    logger.error(f"Error while clearing welcome frame: {e}", exc_info=True)
+                    logger.error("Error while clearing welcome frame: %s", e, exc_info=True)
                     raise FrameClearingError(f"Failed to clear welcome frame: {e}") from e
             else:
                 logger.warning("No welcome frame to clear")
         except Exception as e:
-            logger.error(f"Unexpected error in _clear_welcome_frame: {e}", exc_info=True)
+            logger.error("Unexpected error in _clear_welcome_frame: %s", e, exc_info=True)
             raise FrameClearingError(f"009 Unexpected error during welcome frame clearing: {e}") from e
 
     @staticmethod
     def _create_background_photo(
-            self,
             picture_path
-    ) -> ImageTk.PhotoImage:
+    ) -> _LazyBackgroundPhoto:
         try:
-            logger.info(f"001 Starting background photo creation with path: {picture_path}")
+            logger.info("001 Starting background photo creation with path: %s", picture_path)
 
-            try:
-                if getattr(sys, 'frozen', False):
-                    application_path = sys._MEIPASS
-                    logger.debug(f"002 Running in a bundled application, application path: {application_path}")
-                else:
-                    application_path = os.path.dirname(os.path.abspath(__file__))
-                    logger.debug(f"003 Running in a regular script, application path: {application_path}")
-            except Exception as e:
-                logger.error(f"004 Error determining application path: {e}", exc_info=True)
-                raise BackgroundPhotoError("005 Failed to determine application path") from e
+            pictures_path = _resolve_bg_path(picture_path)
+            logger.debug("006 Full path to background photo: %s", pictures_path)
 
-            try:
-                pictures_path = os.path.join(application_path, picture_path)
-                logger.debug(f"006 Full path to background photo: {pictures_path}")
-            except Exception as e:
-                logger.error(f"007 Error constructing full path: {e}", exc_info=True)
-                raise BackgroundPhotoError("008 Failed to construct full path to background photo") from e
+            # PhotoImage conversion is deferred until the caller actually displays the image, then reused
+            photo_image = _background_photo(pictures_path)
+            logger.debug("014 Background photo prepared, size: %s", photo_image.size)
+
+            logger.log(SUCCESS, "017 Background photo created successfully")
+            return photo_image
+        except Exception as e:
+            logger.error("018 Unexpected error in _create_background_photo: %s", e, exc_info=True)
+            raise BackgroundPhotoError(f"019 Unexpected error during background photo creation: {e}") from e
+
+    def _load_background_async(
+            self,
+            picture_path: str,
+            install: Callable[[_LazyBackgroundPhoto], None]
+    ):
+        # Tk is not thread-safe: the worker only does the PIL decode, install() runs in the Tk loop
+        def _on_error(e):
+            logger.error("Failed to install background photo %s: %s", picture_path, e, exc_info=True)
 
+        def _install(photo):
             try:
-                background_image = Image.open(pictures_path)
-                logger.debug("009 Background image opened successfully")
-            except FileNotFoundError as e:
-                logger.error(f"010 File not found: {pictures_path}", exc_info=True)
-                raise BackgroundPhotoError(f"011 Background image file not found: {pictures_path}") from e
+                install(photo)
             except Exception as e:
-                logger.error(f"012 Error opening background image: {e}", exc_info=True)
-                raise BackgroundPhotoError("013 Failed to open background image") from e
+                _on_error(e)
+
+        self._run_in_background(functools.partial(_background_photo, _resolve_bg_path(picture_path)),
+                                _install, _on_error)
+
+    def _run_in_background(
+            self,
+            task: Callable[[], Any],
+            on_done: Callable[[Any], None],
+            on_error: Callable[[Exception], None],
+            pool: Optional[ThreadPoolExecutor] = None
+    ):
+        # Only task() runs on the worker; on_done/on_error are called back from the Tk loop
+        future = (pool or self._io_pool).submit(task)
 
+        def _poll():
+            if not future.done():
+                self.after(10, _poll)
+                return
             try:
-                photo_image = ImageTk.PhotoImage(background_image)
-                logger.debug("014 Background photo converted to PhotoImage successfully")
+                result = future.result()
             except Exception as e:
-                logger.error(f"015 Error converting background image to PhotoImage: {e}", exc_info=True)
-                raise BackgroundPhotoError("016 Failed to convert background image to PhotoImage") from e
+                on_error(e)
+            else:
+                on_done(result)
 
-            logger.log(SUCCESS, "017 Background photo created successfully")
-            return photo_image
-        except Exception as e:
-            logger.error(f"018 Unexpected error in _create_background_photo: {e}", exc_info=True)
-            raise BackgroundPhotoError(f"019 Unexpected error during background photo creation: {e}") from e
+        _poll()
+        return future
+
+    def _run_card_task(
+            self,
+            button: customtkinter.CTkButton,
+            task: Callable[[], Any],
+            on_done: Callable[[Any], None],
+            on_error: Callable[[Exception], None]
+    ):
+        # The card worker owns the reader until task() returns: the grab on the disabled button keeps
+        # the menus from driving the card on the Tk thread meanwhile, and a second click from saving twice
+        button.configure(state='disabled')
+        button.grab_set()
+        self.configure(cursor="watch")
+
+        def _release():
+            self.configure(cursor="")
+            button.grab_release()
+            button.configure(state='normal')
+
+        def _done(result):
+            _release()
+            on_done(result)
+
+        def _error(e):
+            _release()
+            on_error(e)
+
+        return self._run_in_background(task, _done, _error, pool=self._card_pool)
 
     def _create_canvas(
             self,
@@ -780,42 +1273,24 @@ class View(customtkinter.CTk):
     ) -> customtkinter.CTkCanvas:
         try:
             logger.info("001 Starting canvas creation")
-            canvas = customtkinter.CTkCanvas(self.current_frame, bg="whitesmoke", width=750, height=600)
+            canvas = customtkinter.CTkCanvas(self.current_frame, **_CANVAS_KW)
             logger.debug("002 Canvas created successfully")
             logger.log(SUCCESS, "003 Canvas creation completed")
             return canvas
         except Exception as e:
-            logger.error(f"004 Unexpected error in _create_canvas: {e}", exc_info=True)
+            logger.error("004 Unexpected error in _create_canvas: %s", e, exc_info=True)
             raise CanvasCreationError(f"005 Failed to create canvas: {e}") from e
 
     def _update_textbox(self, text):
         try:
             logger.info("001 Starting _update_textbox method")
-
-            def _clear_textbox():
-                try:
-                    logger.info("002 Clearing the current content of the textbox")
-                    self.text_box.delete(1.0, "end")
-                    logger.log(SUCCESS, "003 Textbox content cleared successfully")
-                except Exception as e:
-                    logger.error(f"004 Error clearing textbox content: {e}", exc_info=True)
-                    raise UIElementError(f"005 Failed to clear textbox content: {e}") from e
-
-            def _insert_new_text():
-                try:
-                    logger.info("006 Inserting new text into the textbox")
-                    self.text_box.insert("end", text)
-                    logger.log(SUCCESS, "007 New text inserted into textbox successfully")
-                except Exception as e:
-                    logger.error(f"008 Error inserting new text into textbox: {e}", exc_info=True)
-                    raise UIElementError(f"009 Failed to insert new text into textbox: {e}") from e
-
-            _clear_textbox()
-            _insert_new_text()
-
+            # CTkTextbox does not forward Text.replace, use the wrapped tkinter.Text widget:
+            # clearing and inserting becomes a single Tk round-trip
+            text_widget = getattr(self.text_box, "_textbox", self.text_box)
+            text_widget.replace("1.0", "end", text)
             logger.log(SUCCESS, "010 _update_textbox method completed successfully")
         except Exception as e:
-            logger.error(f"011 Unexpected error in _update_textbox: {e}", exc_info=True)
+            logger.error("011 Unexpected error in _update_textbox: %s", e, exc_info=True)
             raise ViewError(f"012 Failed to update textbox: {e}") from e
 
     ########################################
@@ -830,6 +1305,9 @@ class View(customtkinter.CTk):
             logger.info("Starting status update")
             # normal mode
             logger.info("011 Updating status in normal mode")
+            if isConnected is not None:
+                # Card inserted or removed: the cached data can no longer be trusted
+                self.controller.invalidate_card_caches()
             if isConnected is True:
                 try:
                     logger.info("012 Getting card status")
@@ -858,6 +1336,7 @@ class View(customtkinter.CTk):
             elif isConnected is False:
                 try:
                     logger.info("016 Card disconnected, resetting status")
+                    self._invalidate_view()
                     if not self.in_backup_process:
                         logger.info("Not in backup process, returning to welcome view")
                         self.view_welcome()
@@ -887,31 +1366,23 @@ class View(customtkinter.CTk):
     ) -> Optional[str]:
         try:
             logger.info("001 Initiating passphrase entry")
-            popup = customtkinter.CTkToplevel(self)
+            popup = customtkinter.CTkToplevel(self, fg_color='whitesmoke')
             popup.title("PIN Required") if self.controller.cc.setup_done else popup.title("PIN setup")
-            popup.configure(fg_color='whitesmoke')
             popup.protocol("WM_DELETE_WINDOW", lambda: [self.show(
                 "WARNING",
                 "You can't open app without password",
                 "Ok", None, "./pictures_db/change_pin_popup_icon.jpg")])
 
             popup_width, popup_height = 400, 200
-            position_right = int(self.winfo_screenwidth() / 2 - popup_width / 2)
-            position_down = int(self.winfo_screenheight() / 2 - popup_height / 2)
-            popup.geometry(f"{popup_width}x{popup_height}+{position_right}+{position_down}")
-            logger.debug("002 Passphrase popup created and positioned")
+            popup.geometry(f"{popup_width}x{popup_height}")
+            logger.debug("002 Passphrase popup created")
 
-            icon_image = Image.open("./pictures_db/change_pin_popup_icon.jpg")
-            icon = customtkinter.CTkImage(light_image=icon_image, size=(30, 30))
+            icon = _load_icon(os.path.join(self._icons_dir, "change_pin_popup_icon.jpg"), (30, 30))
             icon_label = customtkinter.CTkLabel(
                 popup, image=icon,
                 text="\nEnter the PIN code of your card." if self.controller.cc.setup_done else "Create a PIN code",
                 compound='top',
-                font=customtkinter.CTkFont(
-                    family="Outfit",
-                    size=18,
-                    weight="normal"
-                )
+                font=_font("Outfit", 18, "normal")
             )
             icon_label.pack(pady=(10, 5))
             logger.debug("003 Icon and label added to popup")
@@ -936,11 +1407,14 @@ class View(customtkinter.CTk):
                                                     width=120, height=35, corner_radius=34,
                                                     hover_color=BG_HOVER_BUTTON, text="Submit",
                                                     command=submit_passphrase,
-                                                    font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                               weight="normal"))
+                                                    font=_font("Outfit", 18, "normal"))
             submit_button.pack(pady=10)
             logger.debug("006 Submit button added to popup")
 
+            # Let Tk center the popup on screen in a single call, once its content is packed
+            popup.tk.call("tk::PlaceWindow", popup._w, "center")
+            logger.debug("Passphrase popup positioned")
+
             popup.transient(self)
             popup.bind('<Return>', lambda event: submit_passphrase())
             self.wait_window(popup)
@@ -949,13 +1423,25 @@ class View(customtkinter.CTk):
             return pin
 
         except Exception as e:
-            logger.error(f"008 Error in get_passphrase: {e}", exc_info=True)
+            logger.error("008 Error in get_passphrase: %s", e, exc_info=True)
             raise UIElementError(f"009 Failed to get passphrase: {e}") from e
 
     ####################################################################################################################
     """ MAIN MENUS """
 
     ####################################################################################################################
+    def _preload_menu_icons(self, names):
+        name = next(names, None)
+        if name is None:
+            logger.debug("Menu icons preloaded")
+            return
+        try:
+            _load_icon(os.path.join(self._icons_dir, name), _MENU_ICON_SIZE)
+        except Exception as e:
+            # Warming only: a missing icon is reported again when its button is built
+            logger.warning("Failed to preload menu icon %s: %s", name, e)
+        self.after_idle(self._preload_menu_icons, names)
+
     def _create_button_for_main_menu_item(
             self,
             frame: customtkinter.CTkFrame,
@@ -968,48 +1454,38 @@ class View(customtkinter.CTk):
             text_color: str = 'white',
     ) -> Optional[customtkinter.CTkButton]:
         try:
-            logger.info(f"001 Starting main menu button creation for '{button_label}'")
+            logger.info("001 Starting main menu button creation for '%s'", button_label)
 
-            icon_path = f"{ICON_PATH}{icon_name}"
-            try:
-                image = Image.open(icon_path)
-                image = image.resize((25, 25), Image.LANCZOS)
-                photo_image = customtkinter.CTkImage(image)
-                logger.debug(f"002 Icon loaded and resized: {icon_path}")
-            except FileNotFoundError:
-                logger.error(f"003 Icon file not found: {icon_path}")
-                raise ButtonCreationError(f"004 Failed to load icon: {icon_path}")
-            except IOError as e:
-                logger.error(f"005 Error processing icon: {e}")
-                raise ButtonCreationError(f"006 Failed to process icon: {e}") from e
+            icon_path = os.path.join(self._icons_dir, icon_name)
+            photo_image = _load_icon(icon_path, _MENU_ICON_SIZE)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("002 Icon loaded and resized: %s", icon_path)
 
-            try:
-                button = customtkinter.CTkButton(
-                    frame,
-                    text=button_label,
-                    text_color=text_color if text_color != "white" else "white",
-                    font=customtkinter.CTkFont(family="Outfit", weight="normal", size=18),
-                    image=photo_image,
-                    bg_color=BG_MAIN_MENU,
-                    fg_color=BG_MAIN_MENU,
-                    hover_color=BG_MAIN_MENU,
-                    compound="left",
-                    cursor="hand2",
-                    command=command,
-                    state=state
-                )
-                button.image = photo_image  # keep a reference!
-                button.place(rely=rel_y, relx=rel_x, anchor="e")
-                logger.debug(f"007 Button created and placed: {button_label}")
-            except Exception as e:
-                logger.error(f"008 Error while creating button: {e}")
-                raise ButtonCreationError(f"009 Failed to create button: {e}") from e
+            # Button without an action: no command is passed to the CTkButton
+            command_kw = {"command": command} if command is not None else {}
+            button = customtkinter.CTkButton(
+                frame,
+                text=button_label,
+                text_color=text_color,
+                font=_font("Outfit", 18, "normal"),
+                image=photo_image,
+                bg_color=BG_MAIN_MENU,
+                fg_color=BG_MAIN_MENU,
+                hover_color=BG_MAIN_MENU,
+                compound="left",
+                cursor="hand2",
+                state=state,
+                **command_kw
+            )
+            self._place_later(button, rely=rel_y, relx=rel_x, anchor="e")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("007 Button created and placed: %s", button_label)
 
-            logger.log(SUCCESS, f"010 Main menu button '{button_label}' created successfully")
+            logger.log(SUCCESS, "010 Main menu button '%s' created successfully", button_label)
             return button
 
         except Exception as e:
-            logger.error(f"011 Unexpected error creating button: {e}")
+            logger.error("011 Unexpected error creating button: %s", e)
             raise ButtonCreationError(f"012 Failed to create button: {e}") from e
 
     ########################################
@@ -1026,7 +1502,7 @@ class View(customtkinter.CTk):
             logger.debug("003 Seedkeeper menu placed")
             logger.log(SUCCESS, "004 Seedkeeper menu created and placed successfully")
         except Exception as e:
-            logger.error(f"005 Error in create_seedkeeper_menu: {e}", exc_info=True)
+            logger.error("005 Error in create_seedkeeper_menu: %s", e, exc_info=True)
             raise MenuCreationError(f"006 Failed to create Seedkeeper menu: {e}") from e
 
     @log_method
@@ -1037,89 +1513,119 @@ class View(customtkinter.CTk):
     ) -> customtkinter.CTkFrame:
         try:
             logger.info("001 Starting Seedkeeper lateral menu creation")
-            if self.menu:
-                self.menu.destroy()
-                logger.debug("002 Existing menu destroyed")
+            if self.menu and self.menu is not self._seedkeeper_menu:
+                self._dispose_menu(self.menu)
+                logger.debug("002 Existing menu removed")
 
             if state is None:
                 state = "normal" if self.controller.cc.card_present else "disabled"
-                logger.info(f"003 Card {'detected' if state == 'normal' else 'undetected'}, setting state to {state}")
+                logger.info("003 Card %s, setting state to %s", 'detected' if state == 'normal' else 'undetected', state)
+
+            if self._seedkeeper_menu is not None and self._seedkeeper_menu.winfo_exists():
+                # The menu is built once, later card events only reconfigure its buttons
+                self._refresh_seedkeeper_menu(state)
+                logger.log(SUCCESS, "009 Seedkeeper lateral menu refreshed successfully")
+                return self._seedkeeper_menu
 
-            menu_frame = customtkinter.CTkFrame(self.main_frame, width=250, height=600,
-                                                bg_color=BG_MAIN_MENU,
-                                                fg_color=BG_MAIN_MENU, corner_radius=0, border_color="black",
-                                                border_width=0)
+            menu_frame = customtkinter.CTkFrame(self.main_frame, **_MENU_FRAME_KW)
             logger.debug("004 Main menu frame created")
 
             # Logo section
             image_frame = customtkinter.CTkFrame(menu_frame, bg_color=BG_MAIN_MENU, fg_color=BG_MAIN_MENU,
                                                  width=284, height=126)
             image_frame.place(rely=0, relx=0.5, anchor="n")
-            logo_image = Image.open("./pictures_db/logo.png")
-            logo_photo = ImageTk.PhotoImage(logo_image)
             canvas = customtkinter.CTkCanvas(image_frame, width=284, height=127, bg=BG_MAIN_MENU,
                                              highlightthickness=0)
             canvas.pack(fill="both", expand=True)
+            # Decode the logo only once the canvas that displays it exists
+            logo_photo = self._logo_photo
             canvas.create_image(142, 63, image=logo_photo, anchor="center")
-            canvas.image = logo_photo  # conserver une référence
             logger.debug("005 Logo section created")
 
-            if self.controller.cc.card_present:
-                logger.log(SUCCESS, "006 Card Present")
-            else:
-                logger.error(f"007 Card not present")
-
             # Menu items
-            self._create_button_for_main_menu_item(menu_frame,
-                                                   "My secrets" if self.controller.cc.card_present else "Insert card",
-                                                   "secrets_icon.png" if self.controller.cc.card_present else "insert_card_icon.jpg",
-                                                   0.26, 0.585 if self.controller.cc.card_present else 0.578,
-                                                   state=state,
-                                                   command=self.show_view_my_secrets if self.controller.cc.card_present else None)
-            self._create_button_for_main_menu_item(menu_frame, "Generate",
-                                                   "generate_icon.png" if self.controller.cc.card_present else "generate_locked_icon.png",
-                                                   0.33, 0.56, state=state,
-                                                   command=self.show_view_generate_secret if self.controller.cc.card_present else None,
-                                                   text_color="white" if self.controller.cc.card_present else "grey")
-            self._create_button_for_main_menu_item(menu_frame, "Import",
-                                                   "import_icon.png" if self.controller.cc.card_present else "import_locked_icon.png",
-                                                   0.40, 0.51, state=state,
-                                                   command=self.show_view_import_secret if self.controller.cc.card_present else None,
-                                                   text_color="white" if self.controller.cc.card_present else "grey")
-            self._create_button_for_main_menu_item(menu_frame, "Logs",
-                                                   "logs_icon.png" if self.controller.cc.card_present else "settings_locked_icon.png",
-                                                   0.47, 0.49, state=state,
-                                                   command=self.show_view_logs if self.controller.cc.card_present else None,
-                                                   text_color="white" if self.controller.cc.card_present else "grey")
-            self._create_button_for_main_menu_item(menu_frame, "Settings",
-                                                   "settings_icon.png" if self.controller.cc.card_present else "settings_locked_icon.png",
-                                                   0.74, 0.546, state=state,
-                                                   command=self.show_view_about if self.controller.cc.card_present else None,
-                                                   text_color="white" if self.controller.cc.card_present else "grey")
-            self._create_button_for_main_menu_item(menu_frame, "Help", "help_icon.png", 0.81, 0.49, state='normal',
-                                                   command=self.show_view_help, text_color="white")
-            self._create_button_for_main_menu_item(menu_frame, "Go to the webshop", "webshop_icon.png", 0.95, 0.82,
-                                                   state='normal',
-                                                   command=lambda: webbrowser.open("https://satochip.io/shop/", new=2))
+            self._seedkeeper_menu_buttons = {}
+            for key, label, icon_name, rel_y, rel_x, item_state, command, text_color in \
+                    self._seedkeeper_menu_items(state):
+                self._seedkeeper_menu_buttons[key] = self._create_button_for_main_menu_item(
+                    menu_frame, label, icon_name, rel_y, rel_x, state=item_state, command=command,
+                    text_color=text_color)
+            self._seedkeeper_menu = menu_frame
             logger.debug("008 Menu items created")
             logger.log(SUCCESS, "009 Seedkeeper lateral menu created successfully")
             return menu_frame
         except Exception as e:
-            logger.error(f"010 Unexpected error in _seedkeeper_lateral_menu: {e}", exc_info=True)
+            logger.error("010 Unexpected error in _seedkeeper_lateral_menu: %s", e, exc_info=True)
             raise MenuCreationError(f"011 Failed to create Seedkeeper lateral menu: {e}") from e
 
+    def _seedkeeper_menu_items(self, state):
+        # (key, label, icon, rel_y, rel_x, state, command, text_color) for each Seedkeeper menu button
+        card_present = self.controller.cc.card_present
+        if card_present:
+            logger.log(SUCCESS, "006 Card Present")
+        else:
+            logger.error("007 Card not present")
+
+        return [
+            ("my_secrets", "My secrets" if card_present else "Insert card",
+             "secrets_icon.png" if card_present else "insert_card_icon.jpg",
+             0.26, 0.585 if card_present else 0.578, state,
+             self.show_view_my_secrets if card_present else None, "white"),
+            ("generate", "Generate",
+             "generate_icon.png" if card_present else "generate_locked_icon.png",
+             0.33, 0.56, state,
+             self.show_view_generate_secret if card_present else None,
+             "white" if card_present else "grey"),
+            ("import", "Import",
+             "import_icon.png" if card_present else "import_locked_icon.png",
+             0.40, 0.51, state,
+             self.show_view_import_secret if card_present else None,
+             "white" if card_present else "grey"),
+            ("logs", "Logs",
+             "logs_icon.png" if card_present else "settings_locked_icon.png",
+             0.47, 0.49, state,
+             self.show_view_logs if card_present else None,
+             "white" if card_present else "grey"),
+            ("settings", "Settings",
+             "settings_icon.png" if card_present else "settings_locked_icon.png",
+             0.74, 0.546, state,
+             self.show_view_about if card_present else None,
+             "white" if card_present else "grey"),
+            ("help", "Help", "help_icon.png", 0.81, 0.49, 'normal', self.show_view_help, "white"),
+            ("webshop", "Go to the webshop", "webshop_icon.png", 0.95, 0.82, 'normal',
+             _open_webshop, "white"),
+        ]
+
+    def _refresh_seedkeeper_menu(self, state):
+        try:
+            logger.info("Refreshing Seedkeeper menu buttons")
+            for key, label, icon_name, rel_y, rel_x, item_state, command, text_color in \
+                    self._seedkeeper_menu_items(state):
+                button = self._seedkeeper_menu_buttons[key]
+                button.configure(text=label, image=_load_icon(os.path.join(self._icons_dir, icon_name), _MENU_ICON_SIZE),
+                                 command=command, state=item_state, text_color=text_color)
+                button.place_configure(rely=rel_y, relx=rel_x)
+            logger.debug("Seedkeeper menu buttons reconfigured")
+        except Exception as e:
+            logger.error("Error while refreshing Seedkeeper menu: %s", e, exc_info=True)
+            raise MenuCreationError(f"Failed to refresh Seedkeeper menu: {e}") from e
+
     @log_method
     def _delete_seedkeeper_menu(self):
         try:
             logger.info("001 Starting Seedkeeper menu deletion")
+            if self._seedkeeper_menu is not None:
+                # Persistent menu: hidden, not destroyed, so it can be shown again without a rebuild
+                self._seedkeeper_menu.place_forget()
+                logger.debug("002 Seedkeeper menu hidden")
             if hasattr(self, 'menu') and self.menu:
-                self.menu.destroy()
-                logger.debug("002 Menu widget destroyed")
+                if self.menu is not self._seedkeeper_menu:
+                    self._dispose_menu(self.menu)
+                    logger.debug("002 Menu widget removed")
                 self.menu = None
                 logger.debug("003 Menu attribute set to None")
             logger.log(SUCCESS, "004 Seedkeeper menu deleted successfully")
         except Exception as e:
-            logger.error(f"005 Unexpected error in _delete_seedkeeper_menu: {e}", exc_info=True)
+            logger.error("005 Unexpected error in _delete_seedkeeper_menu: %s", e, exc_info=True)
             raise MenuDeletionError(f"006 Failed to delete Seedkeeper menu: {e}") from e
 
     ########################################
@@ -1130,15 +1636,18 @@ class View(customtkinter.CTk):
     def create_satochip_utils_menu(self):
         try:
             logger.info("001 Starting Satochip-utils menu creation")
-            self._delete_seedkeeper_menu()  # Ensure old menu is removed
-            logger.debug("002 Old Seedkeeper menu deleted")
+            if self.menu is None or self.menu is not self._utils_menu:
+                self._delete_seedkeeper_menu()  # Ensure old menu is removed
+                logger.debug("002 Old Seedkeeper menu deleted")
             self.menu = self._satochip_utils_lateral_menu()
             logger.debug("003 Satochip-utils lateral menu created")
-            self.menu.place(relx=0, rely=0, relwidth=0.25, relheight=1)
-            logger.debug("004 Satochip-utils menu placed")
+            # Still placed when coming from another settings view
+            if self.menu.winfo_manager() != "place":
+                self.menu.place(relx=0, rely=0, relwidth=0.25, relheight=1)
+                logger.debug("004 Satochip-utils menu placed")
             logger.log(SUCCESS, "005 Satochip-utils menu created and placed successfully")
         except Exception as e:
-            logger.error(f"006 Error in create_satochip_utils_menu: {e}", exc_info=True)
+            logger.error("006 Error in create_satochip_utils_menu: %s", e, exc_info=True)
             raise MenuCreationError(f"007 Failed to create Satochip-utils menu: {e}") from e
 
     @log_method
@@ -1149,121 +1658,136 @@ class View(customtkinter.CTk):
     ) -> customtkinter.CTkFrame:
         try:
             logger.info("Starting Satochip-utils lateral menu creation")
+            # Card state read once for the whole menu
+            cc = self.controller.cc
+            card_present = bool(cc.card_present)
+            card_type = cc.card_type
+            setup_done = cc.setup_done
             if state is None:
-                state = "normal" if self.controller.cc.card_present else "disabled"
-                logger.info(f"Card {'detected' if state == 'normal' else 'undetected'}, setting state to {state}")
-
-            menu_frame = customtkinter.CTkFrame(self.main_frame, width=250, height=600,
-                                                bg_color=BG_MAIN_MENU,
-                                                fg_color=BG_MAIN_MENU, corner_radius=0, border_color="black",
-                                                border_width=0)
+                state = "normal" if card_present else "disabled"
+                logger.info("Card %s, setting state to %s", 'detected' if state == 'normal' else 'undetected', state)
+
+            # Everything the menu content depends on: same signature, same menu
+            is_seeded = cc.is_seeded if card_present and setup_done else None
+            sig = (card_present, card_type, setup_done, is_seeded, state)
+            if sig == self._utils_menu_sig and self._utils_menu is not None and self._utils_menu.winfo_exists():
+                logger.log(SUCCESS, "012 Satochip-utils lateral menu reused, card state unchanged")
+                return self._utils_menu
+            if self._utils_menu is not None:
+                self._utils_menu.destroy()
+                self._utils_menu, self._utils_menu_sig = None, None
+                logger.debug("Outdated Satochip-utils menu destroyed")
+
+            menu_frame = customtkinter.CTkFrame(self.main_frame, **_MENU_FRAME_KW)
+            menu_frame.pack_propagate(False)
+            menu_frame.grid_propagate(False)
             logger.debug("Menu frame created successfully")
 
             # Logo section
             image_frame = customtkinter.CTkFrame(menu_frame, bg_color=BG_MAIN_MENU, fg_color=BG_MAIN_MENU,
                                                  width=284, height=126)
-            image_frame.place(rely=0, relx=0.5, anchor="n")
-            logo_image = Image.open("./pictures_db/logo.png")
-            logo_photo = ImageTk.PhotoImage(logo_image)
+            self._place_later(image_frame, rely=0, relx=0.5, anchor="n")
             canvas = customtkinter.CTkCanvas(image_frame, width=284, height=127, bg=BG_MAIN_MENU,
                                              highlightthickness=0)
-            canvas.pack(fill="both", expand=True)
+            self._pack_later(canvas, fill="both", expand=True)
+            # Decode the logo only once the canvas that displays it exists
+            logo_photo = self._logo_photo
             canvas.create_image(142, 63, image=logo_photo, anchor="center")
-            canvas.image = logo_photo  # conserver une référence
             logger.debug("Logo section setup complete")
 
-            if self.controller.cc.card_present:
-                if not self.controller.cc.setup_done:
-                    logger.info("Setup not done, enabling 'Setup My Card' button")
-                    self._create_button_for_main_menu_item(menu_frame, "Setup my card", "setup_my_card_icon.png", 0.26,
-                                                           0.60,
-                                                           state='normal', command=lambda: None)
-                else:
-                    if not self.controller.cc.is_seeded and self.controller.cc.card_type != "Satodime":
-                        logger.info("006 Card not seeded, enabling 'Setup Seed' button")
-                        self._create_button_for_main_menu_item(menu_frame, "Setup Seed", "seed.png", 0.26, 0.575,
-                                                               state='normal',
-                                                               command=lambda: None)
-                    else:
-                        logger.info("Setup completed, disabling 'Setup Done' button")
-                        self._create_button_for_main_menu_item(menu_frame,
-                                                               "Setup done" if self.controller.cc.card_present else 'Insert card',
-                                                               "setup_done_icon.jpg" if self.controller.cc.card_present else "insert_card_icon.jpg",
-                                                               0.26,
-                                                               0.575 if self.controller.cc.card_present else 0.595,
-                                                               state='disabled', command=lambda: None)
-            else:
-                logger.info("Card not present, setting 'Setup My Card' button state")
-                self._create_button_for_main_menu_item(menu_frame, "Insert a card", "insert_card_icon.jpg", 0.26, 0.585,
-                                                       state='normal', command=lambda: None)
-
-            if self.controller.cc.card_type != "Satodime" and self.controller.cc.setup_done:
-                logger.debug("009 Enabling 'Change Pin' button")
-                self._create_button_for_main_menu_item(menu_frame, "Change PIN", "change_pin_icon.png", 0.33, 0.567,
-                                                       state='normal', command=self.show_view_change_pin)
+            # State of each button computed once
+            pin_enabled = setup_done and card_type != "Satodime"
+            if not card_present:
+                setup_item = ("Insert a card", "insert_card_icon.jpg", 0.26, 0.585, 'normal', None)
+            elif not setup_done:
+                setup_item = ("Setup my card", "setup_my_card_icon.png", 0.26, 0.60, 'normal', None)
+            elif not is_seeded and card_type != "Satodime":
+                setup_item = ("Setup Seed", "seed.png", 0.26, 0.575, 'normal', None)
             else:
-                logger.info(f"010 Card type is {self.controller.cc.card_type} | Disabling 'Change Pin' button")
-                self._create_button_for_main_menu_item(menu_frame, "Change PIN", "change_pin_locked_icon.jpg", 0.33,
-                                                       0.57,
-                                                       state='disabled', command=lambda: None)
-
-            if self.controller.cc.setup_done:
-                self._create_button_for_main_menu_item(menu_frame, "Edit label", "edit_label_icon.png", 0.40, 0.537,
-                                                       state='normal', command=self.show_view_edit_label)
-            else:
-                self._create_button_for_main_menu_item(menu_frame, "Edit label", "edit_label_locked_icon.jpg", 0.40,
-                                                       0.546,
-                                                       state='disabled', command=lambda: None)
-
-            def before_check_authenticity():
-                logger.info("011 Requesting card verification PIN")
-                if self.controller.cc.card_type != "Satodime":
-                    if self.controller.cc.is_pin_set():
-                        self.controller.cc.card_verify_PIN_simple()
-                    else:
-                        self.controller.PIN_dialog(f'Unlock your {self.controller.cc.card_type}')
+                setup_item = ("Setup done", "setup_done_icon.jpg", 0.26, 0.575, 'disabled', None)
+            logger.info("Setup button: '%s' | Change PIN %s for card type %s",
+                        setup_item[0], 'enabled' if pin_enabled else 'disabled', card_type)
+
+            # (label, icon, rel_y, rel_x, state, command) for each Satochip-utils menu button
+            items = [
+                setup_item,
+                ("Change PIN", "change_pin_icon.png" if pin_enabled else "change_pin_locked_icon.jpg",
+                 0.33, 0.567 if pin_enabled else 0.57, 'normal' if pin_enabled else 'disabled',
+                 self.show_view_change_pin if pin_enabled else None),
+                ("Edit label", "edit_label_icon.png" if setup_done else "edit_label_locked_icon.jpg",
+                 0.40, 0.537 if setup_done else 0.546, 'normal' if setup_done else 'disabled',
+                 self.show_view_edit_label if setup_done else None),
+                ("Check authenticity",
+                 "check_authenticity_icon.png" if setup_done else "check_authenticity_locked_icon.jpg",
+                 0.47, 0.775 if setup_done else 0.66, 'normal' if setup_done else 'disabled',
+                 self._check_authenticity_command if setup_done else None),
+                ("Go back", "back_to_seedkeeper_icon.png" if card_present else "about_locked_icon.jpg",
+                 0.73, 0.52, 'normal' if card_present else 'disabled', self.show_view_my_secrets),
+                ("Go to the webshop", "webshop_icon.png", 0.95, 0.805, 'normal',
+                 _open_webshop),
+            ]
+
+            # The buttons are placed in a single layout pass when the block exits
+            with self._defer_geometry():
+                for label, icon_name, rel_y, rel_x, button_state, command in items:
+                    self._create_button_for_main_menu_item(menu_frame, label, icon_name, rel_y, rel_x,
+                                                           state=button_state, command=command)
+
+            self._utils_menu, self._utils_menu_sig = menu_frame, sig
+            logger.log(SUCCESS, "012 Satochip-utils lateral menu setup completed successfully")
+            return menu_frame
+        except Exception as e:
+            logger.error("013 Unexpected error in _satochip_utils_lateral_menu: %s", e, exc_info=True)
+            raise MenuCreationError(f"014 Failed to create Satochip-utils lateral menu: {e}") from e
 
-            if self.controller.cc.setup_done:
-                self._create_button_for_main_menu_item(menu_frame, "Check authenticity", "check_authenticity_icon.png",
-                                                       0.47, 0.775,
-                                                       state='normal', command=lambda: [before_check_authenticity(),
-                                                                                        self.show_view_check_authenticity()])
+    def _before_check_authenticity(self):
+        logger.info("001 Requesting card verification PIN")
+        cc = self.controller.cc
+        if cc.card_type != "Satodime":
+            if cc.is_pin_set():
+                cc.card_verify_PIN_simple()
             else:
-                self._create_button_for_main_menu_item(menu_frame, "Check authenticity",
-                                                       "check_authenticity_locked_icon.jpg", 0.47, 0.66,
-                                                       state='disabled',
-                                                       command=lambda: None)
-            if self.controller.cc.card_present:
-                self._create_button_for_main_menu_item(menu_frame, "Go back", "back_to_seedkeeper_icon.png",
-                                                       rel_y=0.73, rel_x=0.52,
-                                                       state='normal', command=self.show_view_my_secrets)
-            else:
-                self._create_button_for_main_menu_item(menu_frame, "Go back", "about_locked_icon.jpg",
-                                                       rel_y=0.73,
-                                                       rel_x=0.52, state='disabled', command=self.show_view_my_secrets)
+                self.controller.PIN_dialog(f'Unlock your {cc.card_type}')
 
-            self._create_button_for_main_menu_item(menu_frame, "Go to the webshop", "webshop_icon.png", 0.95, 0.805,
-                                                   state='normal',
-                                                   command=lambda: webbrowser.open("https://satochip.io/shop/", new=2))
+    def _check_authenticity_command(self):
+        self._before_check_authenticity()
+        self.show_view_check_authenticity()
 
-            logger.log(SUCCESS, "012 Satochip-utils lateral menu setup completed successfully")
-            return menu_frame
+    def _hide_unclaimed_utils_menu(self):
+        # Runs once the next view is built: hide the settings menu if that view did not take it back
+        menu = self._utils_menu
+        if menu is not None and self.menu is not menu and menu.winfo_exists():
+            menu.place_forget()
+            logger.debug("Satochip-utils menu hidden")
+
+    def _verify_pin_after_authenticity_view(self):
+        try:
+            self.controller.cc.card_verify_PIN_simple()
         except Exception as e:
-            logger.error(f"013 Unexpected error in _satochip_utils_lateral_menu: {e}", exc_info=True)
-            raise MenuCreationError(f"014 Failed to create Satochip-utils lateral menu: {e}") from e
+            logger.error(f"001 Error verifying PIN: {e}", exc_info=True)
+            self.view_start_setup()
+
+    def _dispose_menu(self, menu):
+        # Persistent menus are only hidden, any other menu frame is destroyed
+        if menu is self._seedkeeper_menu:
+            return
+        if menu is self._utils_menu:
+            menu.place_forget()
+        else:
+            menu.destroy()
 
     @log_method
     def _delete_satochip_utils_menu(self):
         try:
             logger.info("001 Starting Satochip-utils menu deletion")
-            if hasattr(self, 'menu') and self.menu:
-                self.menu.destroy()
-                logger.debug("002 Satochip-utils menu destroyed")
+            if self.menu is not None and self.menu is not self._seedkeeper_menu:
+                self._dispose_menu(self.menu)
+                logger.debug("002 Satochip-utils menu removed")
                 self.menu = None
                 logger.debug("003 Menu attribute set to None")
             logger.log(SUCCESS, "004 Satochip-utils menu deleted successfully")
         except Exception as e:
-            logger.error(f"005 Unexpected error in _delete_satochip_utils_menu: {e}", exc_info=True)
+            logger.error("005 Unexpected error in _delete_satochip_utils_menu: %s", e, exc_info=True)
             raise MenuDeletionError(f"006 Failed to delete Satochip-utils menu: {e}") from e
 
     ####################################################################################################################
@@ -1276,16 +1800,15 @@ class View(customtkinter.CTk):
             self.in_backup_process = False
             logger.info("001 Initiating show secrets process")
             self.welcome_in_display = False
-            self._clear_welcome_frame()
-            self._clear_current_frame()
+            self._reset_frames()
             logger.debug("002 Welcome frame cleared")
             secrets_data = self.controller.retrieve_secrets_stored_into_the_card()
             for header in secrets_data['headers']:
-                logger.debug(f"Header: {header}")
+                logger.debug("Header: %s", header)
             if self.status['protocol_version'] > 1:
                 for secret in secrets_data['headers']:
                     if secret['type'] == "Public Key":
-                        self.controller.cc.seedkeeper_reset_secret(secret['id'])
+                        self.controller.reset_secret(secret['id'])
             logger.debug("003 Secrets data retrieved from card")
             self.view_my_secrets(secrets_data)
             logger.log(SUCCESS, "004 Secrets displayed successfully")
@@ -1349,10 +1872,13 @@ class View(customtkinter.CTk):
             logger.info("001 Displaying help information")
             self.in_backup_process = False
             self.welcome_in_display = False
-            self._clear_current_frame()
-            self._clear_welcome_frame()
+            self._reset_frames()
             logger.debug("002 Welcome and current frames cleared")
-            self.view_help()
+            # The help content does not depend on the card: built once, then reused
+            if not self._show_cached_view("help"):
+                self.view_help()
+                self._cache_current_view("help", _HELP_ATTRS)
+            self.create_seedkeeper_menu()
             logger.log(SUCCESS, "003 Help information displayed successfully")
         except Exception as e:
             logger.error(f"003 Error in show_help: {e}", exc_info=True)
@@ -1365,8 +1891,7 @@ class View(customtkinter.CTk):
             logger.info("001 Starting show_view_start_setup method")
             self.in_backup_process = False
             self.welcome_in_display = False
-            self._clear_welcome_frame()
-            self._clear_current_frame()
+            self._reset_frames()
             logger.debug("002 Welcome and current frames cleared")
 
             self.view_start_setup()
@@ -1381,8 +1906,7 @@ class View(customtkinter.CTk):
             logger.info("001 Starting show_view_change_pin method")
             self.in_backup_process = False
             self.welcome_in_display = False
-            self._clear_welcome_frame()
-            self._clear_current_frame()
+            self._reset_frames()
             logger.debug("002 Welcome and current frames cleared")
 
             self.view_change_pin()
@@ -1397,8 +1921,7 @@ class View(customtkinter.CTk):
             logger.info("001 Starting show_view_edit_label method")
             self.in_backup_process = False
             self.welcome_in_display = False
-            self._clear_welcome_frame()
-            self._clear_current_frame()
+            self._reset_frames()
             logger.debug("002 Welcome and current frames cleared")
 
             self.view_edit_label()
@@ -1413,8 +1936,7 @@ class View(customtkinter.CTk):
             logger.info("001 Starting show_view_check_authenticity method")
             self.in_backup_process = False
             self.welcome_in_display = False
-            self._clear_welcome_frame()
-            self._clear_current_frame()
+            self._reset_frames()
             logger.debug("002 Welcome and current frames cleared")
 
             self.view_check_authenticity()
@@ -1429,8 +1951,7 @@ class View(customtkinter.CTk):
             logger.info("001 Initiating about view process")
             self.welcome_in_display = False
             self.in_backup_process = False
-            self._clear_welcome_frame()
-            self._clear_current_frame()
+            self._reset_frames()
             logger.debug("002 Welcome and current frames cleared")
             self.view_about()
             logger.log(SUCCESS, "003 About view displayed successfully")
@@ -1450,83 +1971,66 @@ class View(customtkinter.CTk):
             msg: str,
             button_txt: str = "Ok",
             cmd: Optional[Callable] = None,
-            icon_path: Optional[str] = None
+            icon_path: Optional[str] = None,
+            modal: bool = False
     ):
         try:
-            logger.info(f"001 Showing popup: {title}")
+            logger.info("001 Showing popup: %s", title)
 
             @log_method
             def create_popup(title):
-                try:
-                    popup = customtkinter.CTkToplevel(self)
-                    popup.title(title)
-                    popup.configure(fg_color='whitesmoke')
-                    popup.protocol("WM_DELETE_WINDOW", popup.destroy)
-                    logger.debug("002 Popup window created")
-                    return popup
-                except Exception as e:
-                    logger.error(f"003 Error in create_popup: {e}", exc_info=True)
-                    raise UIElementError(f"004 Failed to create popup: {e}") from e
+                popup = customtkinter.CTkToplevel(self, fg_color='whitesmoke')
+                popup.title(title)
+                popup.protocol("WM_DELETE_WINDOW", popup.destroy)
+                logger.debug("002 Popup window created")
+                return popup
 
             @log_method
             def center_popup(popup):
-                try:
-                    popup_width, popup_height = 400, 220
-                    position_right = int(self.winfo_screenwidth() / 2 - popup_width / 2)
-                    position_down = int(self.winfo_screenheight() / 2 - popup_height / 2)
-                    popup.geometry(f"{popup_width}x{popup_height}+{position_right}+{position_down}")
-                    logger.debug("005 Popup window centered")
-                except Exception as e:
-                    logger.error(f"006 Error in center_popup: {e}", exc_info=True)
-                    raise UIElementError(f"007 Failed to center popup: {e}") from e
+                popup_width, popup_height = 400, 220
+                position_right = int(self._screen_w / 2 - popup_width / 2)
+                position_down = int(self._screen_h / 2 - popup_height / 2)
+                popup.geometry(f"{popup_width}x{popup_height}+{position_right}+{position_down}")
+                logger.debug("005 Popup window centered")
 
             @log_method
             def add_content(popup, msg, icon_path):
-                try:
-                    if icon_path:
-                        try:
-                            icon_image = Image.open(icon_path)
-                            icon = customtkinter.CTkImage(light_image=icon_image, size=(30, 30))
-                            label = customtkinter.CTkLabel(popup, image=icon, text=f"\n{msg}", compound='top',
-                                                           font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                                      weight="normal"))
-                        except FileNotFoundError:
-                            logger.warning(f"008 Icon file not found: {icon_path}")
-                            label = customtkinter.CTkLabel(popup, text=msg,
-                                                           font=customtkinter.CTkFont(family="Outfit", size=14,
-                                                                                      weight="bold"))
-                    else:
+                if icon_path:
+                    try:
+                        icon = _load_icon(icon_path, (30, 30))
+                        label = customtkinter.CTkLabel(popup, image=icon, text=f"\n{msg}", compound='top',
+                                                       font=_font("Outfit", 18, "normal"))
+                    except FileNotFoundError:
+                        logger.warning("008 Icon file not found: %s", icon_path)
                         label = customtkinter.CTkLabel(popup, text=msg,
-                                                       font=customtkinter.CTkFont(family="Outfit", size=14,
-                                                                                  weight="bold"))
-                    label.pack(pady=20)
-                    logger.debug("009 Content added to popup")
-                except Exception as e:
-                    logger.error(f"010 Error in add_content: {e}", exc_info=True)
-                    raise UIElementError(f"011 Failed to add content to popup: {e}") from e
+                                                       font=_font("Outfit", 14, "bold"))
+                else:
+                    label = customtkinter.CTkLabel(popup, text=msg,
+                                                   font=_font("Outfit", 14, "bold"))
+                label.pack(pady=20)
+                logger.debug("009 Content added to popup")
 
             @log_method
             def add_button(popup, button_txt, cmd):
-                try:
-                    close_cmd = lambda: [cmd() if cmd else None, popup.destroy()]
-                    button = customtkinter.CTkButton(popup, text=button_txt, fg_color=BG_MAIN_MENU,
-                                                     hover_color=BG_HOVER_BUTTON, bg_color='whitesmoke',
-                                                     width=120, height=35, corner_radius=34,
-                                                     font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                                weight="normal"),
-                                                     command=close_cmd)
-                    button.pack(pady=20)
-                    logger.debug("012 Button added to popup")
-                except Exception as e:
-                    logger.error(f"013 Error in add_button: {e}", exc_info=True)
-                    raise UIElementError(f"014 Failed to add button to popup: {e}") from e
+                close_cmd = lambda: [cmd() if cmd else None, popup.destroy()]
+                button = customtkinter.CTkButton(popup, text=button_txt, fg_color=BG_MAIN_MENU,
+                                                 hover_color=BG_HOVER_BUTTON, bg_color='whitesmoke',
+                                                 width=120, height=35, corner_radius=34,
+                                                 font=_font("Outfit", 18, "normal"),
+                                                 command=close_cmd)
+                button.pack(pady=20)
+                logger.debug("012 Button added to popup")
 
             @log_method
             def make_popup_priority(popup):
                 popup.transient(self)
-                popup.grab_set()
+                # Only confirmations take a grab; information, error and success popups leave the app usable
+                if modal:
+                    popup.grab_set()
                 popup.attributes("-topmost", True)
-                logger.debug("015 Priority added to popup")
+                # transient keeps it above the main window; topmost is handed back to the window manager
+                popup.after(200, lambda: popup.winfo_exists() and popup.attributes("-topmost", False))
+                logger.debug("015 Priority added to popup (modal: %s)", modal)
 
             popup = create_popup(title)
             center_popup(popup)
@@ -1547,120 +2051,105 @@ class View(customtkinter.CTk):
         self.welcome_in_display = True
 
         def _setup_welcome_frame():
-            try:
-                logger.info("Setting up welcome frame")
-                self._clear_welcome_frame()
-                self.welcome_frame = customtkinter.CTkFrame(self, fg_color=BG_MAIN_MENU)
-                self.welcome_frame.place(relx=0.5, rely=0.5, anchor="center")
-                logger.log(SUCCESS, "Welcome frame set up successfully")
-            except Exception as e:
-                error_msg = f"Failed to create welcome frame: {e}"
-                logger.error(error_msg, exc_info=True)
-                raise FrameError(error_msg) from e
+            logger.info("Setting up welcome frame")
+            self._clear_welcome_frame()
+            self.welcome_frame = customtkinter.CTkFrame(self, fg_color=BG_MAIN_MENU)
+            self.welcome_frame.place(relx=0.5, rely=0.5, anchor="center")
+            logger.log(SUCCESS, "Welcome frame set up successfully")
 
         def _create_welcome_background():
-            try:
-                logger.info("Creating welcome background")
-                bg_image = Image.open("./pictures_db/welcome_in_seedkeeper_tool.png")
-                self.background_photo = ImageTk.PhotoImage(bg_image)
-                self.canvas = customtkinter.CTkCanvas(self.welcome_frame, width=bg_image.width, height=bg_image.height)
-                self.canvas.pack(fill="both", expand=True)
-                self.canvas.create_image(0, 0, image=self.background_photo, anchor="nw")
-                logger.log(SUCCESS, "Welcome background created successfully")
-            except FileNotFoundError:
-                logger.error("Background image file not found", exc_info=True)
-                raise UIElementError("Background image file not found.")
-            except Exception as e:
-                logger.error(f"Failed to create welcome background: {e}", exc_info=True)
-                raise UIElementError(f"Failed to create welcome background: {e}")
+            logger.info("Creating welcome background")
+            self.background_photo = _background_photo(_resolve_bg_path("pictures_db/welcome_in_seedkeeper_tool.png"))
+            bg_width, bg_height = self.background_photo.size
+            self.canvas = customtkinter.CTkCanvas(self.welcome_frame, width=bg_width, height=bg_height)
+            self.canvas.pack(fill="both", expand=True)
+            self.canvas.create_image(0, 0, image=self.background_photo.photo, anchor="nw")
+            logger.log(SUCCESS, "Welcome background created successfully")
 
         def _create_welcome_header():
-            try:
-                logger.info("Creating welcome header")
-                header_frame = customtkinter.CTkFrame(self.welcome_frame, width=380, height=178,
-                                                      fg_color=DEFAULT_BG_COLOR)
-                header_frame.place(relx=0.1, rely=0.03, anchor='nw')
+            logger.info("Creating welcome header")
+            header_frame = customtkinter.CTkFrame(self.welcome_frame, width=380, height=178,
+                                                  fg_color=DEFAULT_BG_COLOR)
+            header_frame.place(relx=0.1, rely=0.03, anchor='nw')
 
-                logo_canvas = customtkinter.CTkCanvas(header_frame, width=400, height=400, bg='black')
-                logo_canvas.place(relx=0.5, rely=0.5, anchor='center')
+            logo_canvas = customtkinter.CTkCanvas(header_frame, width=400, height=400, bg='black')
+            logo_canvas.place(relx=0.5, rely=0.5, anchor='center')
 
-                icon_path = "./pictures_db/icon_welcome_logo.png"
-                image = Image.open(icon_path)
-                photo = ImageTk.PhotoImage(image)
+            icon_path = "./pictures_db/icon_welcome_logo.png"
+            try:
+                # Decoded and converted once, shared by every welcome screen
+                photo = _background_photo(_resolve_bg_path(icon_path)).photo
+            except FileNotFoundError:
+                # Missing logo: the welcome screen stays usable without it
+                logger.error(f"Logo file not found: {icon_path}", exc_info=True)
+                return
 
-                logo_canvas_width = logo_canvas.winfo_reqwidth()
-                logo_canvas_height = logo_canvas.winfo_reqheight()
-                image_width = photo.width()
-                image_height = photo.height()
+            logo_canvas_width = logo_canvas.winfo_reqwidth()
+            logo_canvas_height = logo_canvas.winfo_reqheight()
+            image_width = photo.width()
+            image_height = photo.height()
 
-                x_center = (logo_canvas_width - image_width) // 2
-                y_center = (logo_canvas_height - image_height) // 2
+            x_center = (logo_canvas_width - image_width) // 2
+            y_center = (logo_canvas_height - image_height) // 2
 
-                logo_canvas.create_image(x_center, y_center, anchor='nw', image=photo)
-                logo_canvas.image = photo  # Keep a reference to prevent garbage collection
+            logo_canvas.create_image(x_center, y_center, anchor='nw', image=photo)
+            logo_canvas.image = photo  # Keep a reference to prevent garbage collection
 
-                logger.log(SUCCESS, "Welcome header created successfully")
-            except FileNotFoundError:
-                logger.error(f"Logo file not found: {icon_path}", exc_info=True)
-            except Exception as e:
-                error_msg = f"Failed to create welcome header: {e}"
-                logger.error(error_msg, exc_info=True)
-                raise UIElementError(error_msg) from e
+            logger.log(SUCCESS, "Welcome header created successfully")
 
         def _create_welcome_labels():
-            try:
-                logger.info("Creating welcome labels")
-                labels = [
-                    ("Seedkeeper-tool", 0.4, True),
-                    ("The companion app for your Seedkeeper card.", 0.5, False),
-                    ("It will help you to safely store and manage your crypto-related", 0.55, False),
-                    ("secrets including seedphrases, passwords and credentials.", 0.60, False),
-                    ('First time using the app? Plug your Seedkeeper card into the', 0.7, False),
-                    ('card reader and follow the guide...', 0.75, False)
-                ]
-
-                for text, rely, is_bold in labels:
-                    label = customtkinter.CTkLabel(
-                        self.welcome_frame,
-                        text=text,
-                        font=customtkinter.CTkFont(size=18, weight='bold' if is_bold else 'normal'),
-                        text_color="white"
-                    )
-                    label.place(relx=0.05, rely=rely, anchor="w")
+            logger.info("Creating welcome labels")
+            title = customtkinter.CTkLabel(
+                self.welcome_frame,
+                text="Seedkeeper-tool",
+                font=_font(None, 18, 'bold'),
+                text_color="white"
+            )
+            title.place(relx=0.05, rely=0.4, anchor="w")
+
+            # A single multi-line label for the paragraph; the empty line separates the two blocks
+            body_lines = [
+                "The companion app for your Seedkeeper card.",
+                "It will help you to safely store and manage your crypto-related",
+                "secrets including seedphrases, passwords and credentials.",
+                "",
+                "First time using the app? Plug your Seedkeeper card into the",
+                "card reader and follow the guide...",
+            ]
+            body = customtkinter.CTkLabel(
+                self.welcome_frame,
+                text="\n".join(body_lines),
+                font=_font(None, 18, 'normal'),
+                text_color="white",
+                justify="left"
+            )
+            # Vertical center of the block: between the first (0.5) and the last line (0.75)
+            body.place(relx=0.05, rely=0.625, anchor="w")
 
-                logger.log(SUCCESS, "Welcome labels created successfully")
-            except Exception as e:
-                error_msg = f"Failed to create welcome labels: {e}"
-                logger.error(error_msg, exc_info=True)
-                raise UIElementError(error_msg) from e
+            logger.log(SUCCESS, "Welcome labels created successfully")
 
         def _create_welcome_button():
-            try:
-                logger.info("Creating welcome button")
-                if self.controller.cc.card_present and self.controller.cc.is_pin_set():
-                    self.lets_go_button = self._create_welcome_button("Let's go", self.show_view_my_secrets)
+            logger.info("Creating welcome button")
+            if self.controller.cc.card_present and self.controller.cc.is_pin_set():
+                self.lets_go_button = self._create_welcome_button("Let's go", self.show_view_my_secrets)
+            else:
+                if not self.controller.cc.card_present:
+                    self.lets_go_button = self._create_welcome_button("Let's go", lambda: self.show(
+                        "ERROR",
+                        'Insert card to continue.',
+                        'Ok',
+                        lambda: self.view_welcome(),
+                        "./pictures_db/insert_card__icon_ws.png"))
                 else:
-                    if not self.controller.cc.card_present:
-                        self.lets_go_button = self._create_welcome_button("Let's go", lambda: self.show(
-                            "ERROR",
-                            'Insert card to continue.',
-                            'Ok',
-                            lambda: self.view_welcome(),
-                            "./pictures_db/insert_card__icon_ws.png"))
-                    else:
-                        self.lets_go_button = self._create_welcome_button("Let's go", lambda: self.show(
-                            "ERROR",
-                            'Enter your PIN to continue.',
-                            'Ok',
-                            lambda: self.view_welcome(),
-                            "./pictures_db/change_pin_popup_icon.jpg"))
-                self.lets_go_button.place(relx=0.85, rely=0.93, anchor="center")
-
-                logger.log(SUCCESS, "018 Welcome button created successfully")
-            except Exception as e:
-                error_msg = f"Failed to create welcome button: {e}"
-                logger.error(error_msg, exc_info=True)
-                raise UIElementError(error_msg) from e
+                    self.lets_go_button = self._create_welcome_button("Let's go", lambda: self.show(
+                        "ERROR",
+                        'Enter your PIN to continue.',
+                        'Ok',
+                        lambda: self.view_welcome(),
+                        "./pictures_db/change_pin_popup_icon.jpg"))
+            self.lets_go_button.place(relx=0.85, rely=0.93, anchor="center")
+
+            logger.log(SUCCESS, "018 Welcome button created successfully")
 
         logger.info("Initializing welcome view")
 
@@ -1673,7 +2162,7 @@ class View(customtkinter.CTk):
             _create_welcome_button()
 
             logger.log(SUCCESS, "Welcome view created successfully")
-            self.update()  # Force update of the window
+            self.update_idletasks()  # Layout only, no reentrant event processing
         except FrameError as e:
             logger.error(f"Frame error in welcome method: {e}", exc_info=True)
             raise FrameError(f"Failed to initialize welcome view due to frame error: {e}") from e
@@ -1692,72 +2181,64 @@ class View(customtkinter.CTk):
 
         @log_method
         def _create_start_setup_frame():
-            try:
-                logger.info("Creating start setup frame")
-                self._create_frame()
-                logger.log(SUCCESS, "002 Start setup frame created successfully")
-            except Exception as e:
-                logger.error(f"003 Error creating start setup frame: {e}", exc_info=True)
-                raise FrameCreationError(f"004 Failed to create start setup frame: {e}") from e
+            logger.info("Creating start setup frame")
+            self._create_frame()
+            logger.log(SUCCESS, "002 Start setup frame created successfully")
 
         @log_method
         def _create_start_setup_header():
-            try:
-                logger.info("009 Creating start setup header")
-                self.header = self._create_an_header("Settings", "home_popup_icon.jpg")
-                self.header.place(relx=0.03, rely=0.08, anchor="nw")
-                logger.log(SUCCESS, "010 Start setup header created successfully")
-            except Exception as e:
-                logger.error(f"011 Error creating start setup header: {e}", exc_info=True)
-                raise UIElementError(f"012 Failed to create start setup header: {e}") from e
+            logger.info("009 Creating start setup header")
+            self.header = self._create_an_header("Settings", "home_popup_icon.jpg")
+            self.header.place(relx=0.03, rely=0.08, anchor="nw")
+            logger.log(SUCCESS, "010 Start setup header created successfully")
 
         @log_method
         def _load_background_image():
-            try:
-                logger.info("013 Loading background image")
-                if self.controller.cc.card_present:
-                    image_path = f"./pictures_db/card_{self.controller.cc.card_type.lower()}.png"
-                else:
-                    image_path = "./pictures_db/insert_card.png"
+            logger.info("013 Loading background image")
+            cc = self.controller.cc
+            if cc.card_present:
+                image_path = CARD_IMAGE_PATHS.get(cc.card_type, INSERT_CARD_IMAGE_PATH)
+            else:
+                image_path = INSERT_CARD_IMAGE_PATH
 
-                self.background_photo = self._create_background_photo(self, image_path)
-                self.canvas = self._create_canvas()
+            canvas = self.canvas = self._create_canvas()
+            canvas.place(relx=0.4, rely=0.5, anchor="center")
 
-                self.canvas.place(relx=0.4, rely=0.5, anchor="center")
-                self.canvas.create_image(self.canvas.winfo_reqwidth() / 2, self.canvas.winfo_reqheight() / 2,
-                                         image=self.background_photo, anchor="center")
-                logger.log(SUCCESS, "014 Background image loaded successfully")
-            except Exception as e:
-                logger.error(f"015 Error loading background image: {e}", exc_info=True)
-                raise UIElementError(f"016 Failed to load background image: {e}") from e
+            def _install_background(photo):
+                # The view may have been left while the picture was decoding
+                if not canvas.winfo_exists():
+                    return
+                self.background_photo = photo
+                canvas.create_image(canvas.winfo_reqwidth() / 2, canvas.winfo_reqheight() / 2,
+                                    image=photo.photo, anchor="center")
+
+            self._load_background_async(image_path, _install_background)
+            logger.log(SUCCESS, "014 Background image loaded successfully")
 
         @log_method
         def _create_start_setup_labels():
-            try:
-                logger.info("017 Creating start setup labels")
-                label1 = self._create_label(f"Your {self.controller.cc.card_type} is connected.")
-                label1.place(relx=0.045, rely=0.27, anchor="w")
+            logger.info("017 Creating start setup labels")
+            label1 = self._create_label(f"Your {self.controller.cc.card_type} is connected.")
+            label1.place(relx=0.045, rely=0.27, anchor="w")
 
-                label2 = self._create_label("Select on the menu the action you wish to perform.")
-                label2.place(relx=0.045, rely=0.32, anchor="w")
-                logger.log(SUCCESS, "018 Start setup labels created successfully")
-            except Exception as e:
-                logger.error(f"019 Error creating start setup labels: {e}", exc_info=True)
-                raise UIElementError(f"020 Failed to create start setup labels: {e}") from e
+            label2 = self._create_label("Select on the menu the action you wish to perform.")
+            label2.place(relx=0.045, rely=0.32, anchor="w")
+            logger.log(SUCCESS, "018 Start setup labels created successfully")
 
         @log_method
         def _destroy_start_setup():
             try:
                 logger.info("021 Destroying start setup view")
-                if hasattr(self, 'current_frame'):
+                # Attributes declared as None in _declare_widgets
+                if self.current_frame is not None:
                     self.current_frame.destroy()
-                    delattr(self, 'current_frame')
-                if hasattr(self, 'header'):
+                    self.current_frame = None
+                if self.header is not None:
                     self.header.destroy()
-                    delattr(self, 'header')
-                if hasattr(self, 'canvas'):
+                    self.header = None
+                if self.canvas is not None:
                     self.canvas.destroy()
-                    delattr(self, 'canvas')
+                    self.canvas = None
                 logger.log(SUCCESS, "022 Start setup view destroyed successfully")
             except Exception as e:
                 logger.error(f"023 Error destroying start setup view: {e}", exc_info=True)
@@ -1779,295 +2260,153 @@ class View(customtkinter.CTk):
             logger.error(f"029 Unexpected error in start_setup: {e}", exc_info=True)
             raise ViewError(f"030 Unexpected error during start setup initialization: {e}") from e
 
+    def _build_form_view(
+            self,
+            form: str,
+            on_cancel: Callable,
+            on_confirm: Callable
+    ):
+        try:
+            logger.info("001 Building %s form", form)
+            spec = _FORM_VIEW_SPECS[form]
+
+            self.header = self._create_an_header(*spec["header"])
+            self._place_later(self.header, relx=0.03, rely=0.08, anchor="nw")
+
+            self._create_labels_bulk(_form_label_specs(form, self.controller.cc.card_type))
+
+            first_entry = None
+            for _, rely, entry_name, masked in spec["entries"]:
+                entry = self._create_entry(show_option="*" if masked else None)
+                self._place_later(entry, relx=0.05, rely=rely + 0.05, anchor="w")
+                # Plain instance attributes: the submit handlers read them back by name
+                self.__dict__[entry_name] = entry
+                if first_entry is None:
+                    first_entry = entry
+            self.after_idle(first_entry.focus_set)
+
+            self.cancel_button = self._create_button("Cancel", command=on_cancel)
+            self._place_later(self.cancel_button, relx=0.63, rely=0.9, anchor="w")
+            self.finish_button = self._create_button("Change it", command=on_confirm)
+            self._place_later(self.finish_button, relx=0.8, rely=0.9, anchor="w")
+            self.bind('<Return>', lambda event: on_confirm())
+
+            logger.log(SUCCESS, "002 %s form built successfully", form)
+        except Exception as e:
+            logger.error(f"003 Error building {form} form: {e}", exc_info=True)
+            raise UIElementError(f"004 Failed to build {form} form: {e}") from e
+
+    def _perform_pin_change(self):
+        try:
+            current_pin = self.current_pin_entry.get()
+            new_pin = self.new_pin_entry.get()
+            confirm_new_pin = self.confirm_new_pin_entry.get()
+            self.controller.change_card_pin(current_pin, new_pin, confirm_new_pin)
+        except Exception as e:
+            logger.error(f"001 Error performing PIN change: {e}", exc_info=True)
+            self.show("ERROR", "Failed to change PIN", "Ok")
+
     @log_method
     def view_change_pin(self):
         try:
             logger.info("001 Starting change_pin method")
+            self._create_frame()
+            # Every place() of the view is applied in one pass when the block exits
+            with self._defer_geometry():
+                self._build_form_view("change_pin", self.view_start_setup, self._perform_pin_change)
+                self.create_satochip_utils_menu()
 
-            @log_method
-            def _create_change_pin_frame():
+            logger.log(SUCCESS, "002 change_pin method completed successfully")
+        except Exception as e:
+            logger.error(f"003 Unexpected error in change_pin: {e}", exc_info=True)
+            raise ViewError(f"004 Failed to display change PIN view: {e}")
+
+    @log_method
+    def view_edit_label(self):
+        try:
+            logger.info("001 Starting view_edit_label method")
+            self._clear_current_frame()
+            self._create_frame()
+            with self._defer_geometry():
+                self._build_form_view("edit_label", self.show_view_start_setup,
+                                      lambda: self.controller.edit_label(self.edit_card_entry.get()))
+
+            logger.info("002 Handling card verification")
+            cc = self.controller.cc
+            if cc.card_type != "Satodime":
+                if cc.is_pin_set():
+                    cc.card_verify_PIN_simple()
+                else:
+                    self.controller.PIN_dialog(f'Unlock your {cc.card_type}')
+            self.create_satochip_utils_menu()
+
+            logger.log(SUCCESS, "003 Edit label view created successfully")
+        except Exception as e:
+            logger.error(f"004 Unexpected error in view_edit_label: {e}", exc_info=True)
+            raise ViewError(f"005 Failed to create edit label view: {e}") from e
+
+    @log_method
+    def view_check_authenticity(self):
+        try:
+            logger.info("001 Starting view_check_authenticity method")
+
+            def _create_check_authenticity_frame():
                 try:
-                    logger.info("002 Creating change PIN frame")
+                    logger.info("002 Creating check authenticity frame")
                     self._create_frame()
-                    logger.log(SUCCESS, "003 Change PIN frame created successfully")
+                    logger.log(SUCCESS, "003 Check authenticity frame created successfully")
                 except Exception as e:
-                    logger.error(f"004 Error creating change PIN frame: {e}", exc_info=True)
-                    raise FrameCreationError(f"005 Failed to create change PIN frame: {e}") from e
+                    logger.error(f"004 Error creating check authenticity frame: {e}", exc_info=True)
+                    raise FrameCreationError(f"005 Failed to create check authenticity frame: {e}") from e
 
-            @log_method
-            def _create_change_pin_header():
+            def _create_check_authenticity_header():
                 try:
-                    logger.info("006 Creating change PIN header")
-                    self.header = self._create_an_header("Change PIN", "change_pin_popup_icon.jpg")
-                    self.header.place(relx=0.03, rely=0.08, anchor="nw")
-                    logger.log(SUCCESS, "007 Change PIN header created successfully")
+                    logger.info("006 Creating check authenticity header")
+                    self.header = self._create_an_header("Check authenticity", "check_authenticity_icon_ws.jpg")
+                    self._place_later(self.header, relx=0.03, rely=0.08, anchor="nw")
+                    logger.log(SUCCESS, "007 Check authenticity header created successfully")
                 except Exception as e:
-                    logger.error(f"008 Error creating change PIN header: {e}", exc_info=True)
-                    raise UIElementError(f"009 Failed to create change PIN header: {e}") from e
+                    logger.error(f"008 Error creating check authenticity header: {e}", exc_info=True)
+                    raise UIElementError(f"009 Failed to create check authenticity header: {e}") from e
 
-            @log_method
-            def _create_change_pin_content():
+            def _create_check_authenticity_content():
                 try:
-                    logger.info("010 Creating change PIN content")
-
-                    instructions = [
-                        "Change your personal PIN code.",
-                        "We strongly encourage you to set up a strong password between 4 and 16",
-                        "characters. You can use symbols, lower and upper cases, letters and",
-                        "numbers."
-                    ]
-
-                    for i, text in enumerate(instructions):
-                        label = self._create_label(text)
-                        label.place(relx=0.05, rely=0.20 + i * 0.05, anchor="w")
-
-                    pin_entries = [
-                        ("Current PIN:", 0.40, "current_pin_entry"),
-                        ("New PIN code:", 0.55, "new_pin_entry"),
-                        ("Repeat new PIN code:", 0.70, "confirm_new_pin_entry")
-                    ]
+                    logger.info("010 Creating check authenticity content")
+                    text = self._create_label("Check whether or not you have a genuine Satochip card.")
+                    self._place_later(text, relx=0.045, rely=0.20, anchor="w")
 
-                    for label_text, rely, entry_name in pin_entries:
-                        label = self._create_label(label_text)
-                        label.configure(font=self._make_text_bold(18))
-                        label.place(relx=0.05, rely=rely, anchor="w")
+                    status_label = self._create_label("Status:")
+                    status_label.configure(font=self._make_text_bold())
+                    self._place_later(status_label, relx=0.045, rely=0.27, anchor="w")
 
-                        entry = self._create_entry(show_option="*")
-                        entry.place(relx=0.05, rely=rely + 0.05, anchor="w")
-                        setattr(self, entry_name, entry)
+                    if self.controller.cc.card_present:
+                        _display_authenticity_status()
 
-                    self.after(100, self.current_pin_entry.focus_force)
+                    _create_certificate_radio_buttons()
+                    # The text box is only built on the first certificate selection
+                    self.text_box = None
 
-                    logger.log(SUCCESS, "011 Change PIN content created successfully")
-                except Exception as e:
-                    logger.error(f"012 Error creating change PIN content: {e}", exc_info=True)
-                    raise UIElementError(f"013 Failed to create change PIN content: {e}") from e
-
-            @log_method
-            def _create_change_pin_buttons():
-                try:
-                    logger.info("014 Creating change PIN buttons")
-
-                    cancel_button = self._create_button("Cancel", command=self.view_start_setup)
-                    cancel_button.place(relx=0.63, rely=0.9, anchor="w")
-
-                    change_button = self._create_button("Change it", command=_perform_pin_change)
-                    change_button.place(relx=0.8, rely=0.9, anchor="w")
-
-                    self.bind('<Return>', lambda event: _perform_pin_change())
-
-                    logger.log(SUCCESS, "015 Change PIN buttons created successfully")
-                except Exception as e:
-                    logger.error(f"016 Error creating change PIN buttons: {e}", exc_info=True)
-                    raise UIElementError(f"017 Failed to create change PIN buttons: {e}") from e
-
-            @log_method
-            def _perform_pin_change():
-                try:
-                    current_pin = self.current_pin_entry.get()
-                    new_pin = self.new_pin_entry.get()
-                    confirm_new_pin = self.confirm_new_pin_entry.get()
-                    self.controller.change_card_pin(current_pin, new_pin, confirm_new_pin)
-                except Exception as e:
-                    logger.error(f"018 Error performing PIN change: {e}", exc_info=True)
-                    self.show("ERROR", "Failed to change PIN", "Ok")
-
-            _create_change_pin_frame()
-            _create_change_pin_header()
-            _create_change_pin_content()
-            _create_change_pin_buttons()
-            self.create_satochip_utils_menu()
-
-            logger.log(SUCCESS, "019 change_pin method completed successfully")
-        except Exception as e:
-            logger.error(f"020 Unexpected error in change_pin: {e}", exc_info=True)
-            raise ViewError(f"021 Failed to display change PIN view: {e}")
-
-    @log_method
-    def view_edit_label(self):
-        try:
-            logger.info("001 Starting view_edit_label method")
-
-            @log_method
-            def _create_edit_label_frame():
-                try:
-                    logger.info("002 Creating edit label frame")
-                    self._create_frame()
-                    logger.log(SUCCESS, "003 Edit label frame created successfully")
-                except Exception as e:
-                    logger.error(f"004 Error creating edit label frame: {e}", exc_info=True)
-                    raise FrameCreationError(f"005 Failed to create edit label frame: {e}") from e
-
-            @log_method
-            def _create_edit_label_header():
-                try:
-                    logger.info("006 Creating edit label header")
-                    header_text = "Edit Label"
-                    self.header = self._create_an_header(header_text, "edit_label_icon_ws.jpg")
-                    self.header.place(relx=0.03, rely=0.08, anchor="nw")
-                    logger.log(SUCCESS, "007 Edit label header created successfully")
-                except Exception as e:
-                    logger.error(f"008 Error creating edit label header: {e}", exc_info=True)
-                    raise UIElementError(f"009 Failed to create edit label header: {e}") from e
-
-            @log_method
-            def _create_edit_label_content():
-                try:
-                    logger.info("010 Creating edit label content")
-
-                    instructions = [
-                        f"Edit the label of your {self.controller.cc.card_type}.",
-                        "The label is a tag that identifies your card. It can be used to distinguish",
-                        "several cards, or to associate it with a person, a name or a story."
-                    ]
-
-                    for i, text in enumerate(instructions):
-                        label = self._create_label(text)
-                        label.place(relx=0.05, rely=0.20 + i * 0.05, anchor="w")
-
-                    label_entries = [
-                        ("Label:", 0.40, "edit_card_entry")
-                    ]
-
-                    for label_text, rely, entry_name in label_entries:
-                        label = self._create_label(label_text)
-                        label.configure(font=self._make_text_bold(18))
-                        label.place(relx=0.05, rely=rely, anchor="w")
-
-                        entry = self._create_entry()
-                        entry.place(relx=0.05, rely=rely + 0.05, anchor="w")
-                        setattr(self, entry_name, entry)
-
-                    self.after(100, self.edit_card_entry.focus_force)
-
-                    logger.log(SUCCESS, "011 Edit label content created successfully")
-                except Exception as e:
-                    logger.error(f"012 Error creating edit label content: {e}", exc_info=True)
-                    raise UIElementError(f"013 Failed to create edit label content: {e}") from e
-
-            @log_method
-            def _create_edit_label_buttons():
-                try:
-                    logger.info("014 Creating edit label buttons")
-                    self.cancel_button = self._create_button("Cancel", command=self.show_view_start_setup)
-                    self.cancel_button.place(relx=0.63, rely=0.9, anchor="w")
-
-                    self.finish_button = self._create_button("Change it", command=lambda: self.controller.edit_label(
-                        self.edit_card_entry.get()))
-                    self.finish_button.place(relx=0.8, rely=0.9, anchor="w")
-                    self.bind('<Return>', lambda event: self.controller.edit_label(self.edit_card_entry.get()))
-                    logger.log(SUCCESS, "015 Edit label buttons created successfully")
-                except Exception as e:
-                    logger.error(f"016 Error creating edit label buttons: {e}", exc_info=True)
-                    raise UIElementError(f"017 Failed to create edit label buttons: {e}") from e
-
-            @log_method
-            def _handle_card_verification():
-                try:
-                    logger.info("018 Handling card verification")
-                    if self.controller.cc.card_type != "Satodime":
-                        if self.controller.cc.is_pin_set():
-                            self.controller.cc.card_verify_PIN_simple()
-                        else:
-                            self.controller.PIN_dialog(f'Unlock your {self.controller.cc.card_type}')
-                    logger.log(SUCCESS, "019 Card verification handled successfully")
-                except Exception as e:
-                    logger.error(f"020 Error handling card verification: {e}", exc_info=True)
-                    raise ViewError(f"021 Failed to handle card verification: {e}") from e
-
-            self._clear_current_frame()
-            _create_edit_label_frame()
-            _create_edit_label_header()
-            _create_edit_label_content()
-            _create_edit_label_buttons()
-            _handle_card_verification()
-            self.create_satochip_utils_menu()
-
-            logger.log(SUCCESS, "022 Edit label view created successfully")
-        except Exception as e:
-            logger.error(f"023 Unexpected error in view_edit_label: {e}", exc_info=True)
-            raise ViewError(f"024 Failed to create edit label view: {e}") from e
-
-    @log_method
-    def view_check_authenticity(self):
-        try:
-            logger.info("001 Starting view_check_authenticity method")
-
-            @log_method
-            def _create_check_authenticity_frame():
-                try:
-                    logger.info("002 Creating check authenticity frame")
-                    self._create_frame()
-                    logger.log(SUCCESS, "003 Check authenticity frame created successfully")
-                except Exception as e:
-                    logger.error(f"004 Error creating check authenticity frame: {e}", exc_info=True)
-                    raise FrameCreationError(f"005 Failed to create check authenticity frame: {e}") from e
-
-            @log_method
-            def _create_check_authenticity_header():
-                try:
-                    logger.info("006 Creating check authenticity header")
-                    self.header = self._create_an_header("Check authenticity", "check_authenticity_icon_ws.jpg")
-                    self.header.place(relx=0.03, rely=0.08, anchor="nw")
-                    logger.log(SUCCESS, "007 Check authenticity header created successfully")
-                except Exception as e:
-                    logger.error(f"008 Error creating check authenticity header: {e}", exc_info=True)
-                    raise UIElementError(f"009 Failed to create check authenticity header: {e}") from e
-
-            @log_method
-            def _create_check_authenticity_content():
-                try:
-                    logger.info("010 Creating check authenticity content")
-                    text = self._create_label("Check whether or not you have a genuine Satochip card.")
-                    text.place(relx=0.045, rely=0.20, anchor="w")
-
-                    status_label = self._create_label("Status:")
-                    status_label.configure(font=self._make_text_bold())
-                    status_label.place(relx=0.045, rely=0.27, anchor="w")
-
-                    if self.controller.cc.card_present:
-                        _display_authenticity_status()
-
-                    _create_certificate_radio_buttons()
-                    _create_text_box()
-
-                    logger.log(SUCCESS, "011 Check authenticity content created successfully")
+                    logger.log(SUCCESS, "011 Check authenticity content created successfully")
                 except Exception as e:
                     logger.error(f"012 Error creating check authenticity content: {e}", exc_info=True)
                     raise UIElementError(f"013 Failed to create check authenticity content: {e}") from e
 
-            @log_method
             def _display_authenticity_status():
                 icon_path = "./pictures_db/icon_genuine_card.jpg" if is_authentic else "./pictures_db/icon_not_genuine_card.jpg"
                 status_text = "Your card is authentic. " if is_authentic else "Your card is not authentic. "
 
-                icon_image = Image.open(icon_path)
-                icon = customtkinter.CTkImage(light_image=icon_image, size=(30, 30))
+                icon = _load_icon(icon_path, (30, 30))
                 icon_label = customtkinter.CTkLabel(self.current_frame, image=icon, text=status_text,
                                                     compound='right', bg_color="whitesmoke", fg_color="whitesmoke",
-                                                    font=customtkinter.CTkFont(family="Outfit", size=18,
-                                                                               weight="normal"))
-                icon_label.place(relx=0.15, rely=0.267, anchor="w")
+                                                    font=_font("Outfit", 18, "normal"))
+                self._place_later(icon_label, relx=0.15, rely=0.267, anchor="w")
 
                 if not is_authentic:
                     _display_warning_message()
 
-            @log_method
             def _display_warning_message():
-                warning_texts = [
-                    ("Warning!", 0.7, True),
-                    ("We could not authenticate the issuer of this card.", 0.75, False),
-                    ("If you did not load the card applet by yourself, be extremely careful!", 0.8, False),
-                    ("Contact support@satochip.io to report any suspicious device.", 0.85, False)
-                ]
-
-                for text, rely, is_bold in warning_texts:
-                    label = self._create_label(text)
-                    if is_bold:
-                        label.configure(font=self._make_text_bold())
-                    label.place(relx=0.045, rely=rely, anchor="w")
+                self._create_labels_bulk(_AUTHENTICITY_WARNING_LABELS)
 
-            @log_method
             def _create_certificate_radio_buttons():
                 self.certificate_radio_value = customtkinter.StringVar(value="")
                 radio_buttons = [
@@ -2079,69 +2418,67 @@ class View(customtkinter.CTk):
                 for text, value, relx in radio_buttons:
                     radio = customtkinter.CTkRadioButton(self.current_frame, text=text,
                                                          variable=self.certificate_radio_value, value=value,
-                                                         font=customtkinter.CTkFont(family="Outfit", size=14,
-                                                                                    weight="normal"),
+                                                         font=_font("Outfit", 14, "normal"),
                                                          bg_color="whitesmoke", fg_color="green", hover_color="green",
                                                          command=_update_radio_selection)
-                    radio.place(relx=relx, rely=0.35, anchor="w")
+                    self._place_later(radio, relx=relx, rely=0.35, anchor="w")
 
-            @log_method
             def _create_text_box():
                 self.text_box = customtkinter.CTkTextbox(self, corner_radius=10,
                                                          bg_color='whitesmoke', fg_color=BG_BUTTON,
                                                          border_color=BG_BUTTON, border_width=0,
                                                          width=581, height=228 if is_authentic else 150,
                                                          text_color="grey",
-                                                         font=customtkinter.CTkFont(family="Outfit", size=13,
-                                                                                    weight="normal"))
+                                                         font=_font("Outfit", 13, "normal"))
 
-            @log_method
             def _update_radio_selection():
                 try:
                     selection = self.certificate_radio_value.get()
-                    logger.info(f"014 Radio button selected: {selection}")
-                    text_content = {
-                        'root_ca_certificate': txt_ca,
-                        'sub_ca_certificate': txt_subca,
-                        'device_certificate': txt_device
-                    }.get(selection, "")
+                    logger.info("014 Radio button selected: %s", selection)
+                    text_content = cert_texts.get(selection, "")
+                    if self.text_box is None:
+                        _create_text_box()
+                        self._place_later(self.text_box, relx=0.28, rely=0.4, anchor="nw")
                     self._update_textbox(text_content)
-                    self.text_box.place(relx=0.28, rely=0.4, anchor="nw")
                 except Exception as e:
                     logger.error(f"015 Error updating radio selection: {e}", exc_info=True)
                     raise UIElementError(f"016 Failed to update radio selection: {e}") from e
 
-            @log_method
             def _create_check_authenticity_buttons():
                 try:
                     logger.info("017 Creating check authenticity buttons")
                     self.cancel_button = self._create_button("Back", command=self.view_start_setup)
-                    self.cancel_button.place(relx=0.8, rely=0.9, anchor="w")
+                    self._place_later(self.cancel_button, relx=0.8, rely=0.9, anchor="w")
                     logger.log(SUCCESS, "018 Check authenticity buttons created successfully")
                 except Exception as e:
                     logger.error(f"019 Error creating check authenticity buttons: {e}", exc_info=True)
                     raise UIElementError(f"020 Failed to create check authenticity buttons: {e}") from e
 
             # Main execution
+            # Text shown for each radio button, built once each time the view opens
+            cert_texts = {}
             if self.controller.cc.card_present:
                 logger.info("021 Card detected: checking authenticity")
-                is_authentic, txt_ca, txt_subca, txt_device, txt_error = self.controller.cc.card_verify_authenticity()
+                is_authentic, txt_ca, txt_subca, txt_device, txt_error = self.controller.get_cached_authenticity()
                 if txt_error:
                     txt_device = f"{txt_error}\n------------------\n{txt_device}"
+                cert_texts = {
+                    'root_ca_certificate': txt_ca,
+                    'sub_ca_certificate': txt_subca,
+                    'device_certificate': txt_device
+                }
 
             self._clear_current_frame()
             _create_check_authenticity_frame()
-            _create_check_authenticity_header()
-            _create_check_authenticity_content()
-            _create_check_authenticity_buttons()
+            with self._defer_geometry():
+                _create_check_authenticity_header()
+                _create_check_authenticity_content()
+                _create_check_authenticity_buttons()
             self.create_satochip_utils_menu()
 
             if self.controller.cc.card_type != "Satodime":
-                try:
-                    self.controller.cc.card_verify_PIN_simple()
-                except Exception as e:
-                    logger.error(f"022 Error verifying PIN: {e}", exc_info=True)
-                    self.view_start_setup()
+                # The PIN verification APDU is sent once the view is displayed
+                self.after_idle(self._verify_pin_after_authenticity_view)
 
             logger.log(SUCCESS, "023 view_check_authenticity completed successfully")
         except Exception as e:
@@ -2153,8 +2490,11 @@ class View(customtkinter.CTk):
 
         try:
             logger.info("Starting view_about method")
+            # Card state read once for every section of the view
+            cc = self.controller.cc
+            card_type = cc.card_type
+            card_status = self.controller.card_status
 
-            @log_method
             def _create_about_frame():
                 try:
                     logger.info("002 Creating about frame")
@@ -2164,43 +2504,46 @@ class View(customtkinter.CTk):
                     logger.error(f"004 Error creating about frame: {e}", exc_info=True)
                     raise FrameCreationError(f"005 Failed to create about frame: {e}") from e
 
-            @log_method
             def _create_about_header():
                 try:
                     logger.info("006 Creating about header")
                     self.header = self._create_an_header("About", "about_icon_ws.jpg")
-                    self.header.place(relx=0.03, rely=0.08, anchor="nw")
+                    self._place_later(self.header, relx=0.03, rely=0.08, anchor="nw")
                     logger.log(SUCCESS, "007 About header created successfully")
                 except Exception as e:
                     logger.error(f"008 Error creating about header: {e}", exc_info=True)
                     raise UIElementError(f"009 Failed to create about header: {e}") from e
 
-            @log_method
             def _load_background_image():
                 try:
                     logger.info("010 Loading background image")
-                    self.background_photo = self._create_background_photo(self, "./pictures_db/about.png")
-                    self.canvas = self._create_canvas()
-                    self.canvas.place(relx=0.5, rely=0.2, anchor="center")
-                    self.canvas.create_image(0, 0, image=self.background_photo, anchor="nw")
+                    canvas = self.canvas = self._create_canvas()
+                    self._place_later(canvas, relx=0.5, rely=0.2, anchor="center")
+
+                    def _install_background(photo):
+                        if not canvas.winfo_exists():
+                            return
+                        self.background_photo = photo
+                        canvas.create_image(0, 0, image=photo.photo, anchor="nw")
+
+                    self._load_background_async("./pictures_db/about.png", _install_background)
                     logger.log(SUCCESS, "011 Background image loaded successfully")
                 except Exception as e:
                     logger.error(f"012 Error loading background image: {e}", exc_info=True)
                     raise UIElementError(f"013 Failed to load background image: {e}") from e
 
-            @log_method
-            def _create_card_information():
+            def _create_card_information(authenticated):
                 try:
                     logger.info("014 Creating card information section")
                     card_information = self._create_label("Card information")
-                    card_information.place(relx=0.05, rely=0.21, anchor="w")
+                    self._place_later(card_information, relx=0.05, rely=0.21, anchor="w")
                     card_information.configure(font=self._make_text_bold())
 
                     applet_version = self._create_label(
-                        f"Applet version: {self.controller.card_status['applet_full_version_string']}")
-                    applet_version.place(relx=0.05, rely=0.29)
+                        f"Applet version: {card_status['applet_full_version_string']}")
+                    self._place_later(applet_version, relx=0.05, rely=0.29)
 
-                    if self.controller.cc.card_type == "Satodime" or self.controller.cc.is_pin_set():
+                    if authenticated:
                         _create_authenticated_card_info()
 
                     logger.log(SUCCESS, "015 Card information section created successfully")
@@ -2208,40 +2551,35 @@ class View(customtkinter.CTk):
                     logger.error(f"016 Error creating card information section: {e}", exc_info=True)
                     raise UIElementError(f"017 Failed to create card information section: {e}") from e
 
-            @log_method
             def _create_authenticated_card_info():
-                if self.controller.cc.card_type != "Satodime":
-                    self.controller.cc.card_verify_PIN_simple()
                 card_label_named = self._create_label(f"Label: [{self.controller.get_card_label_infos()}]")
-                is_authentic, _, _, _, _ = self.controller.cc.card_verify_authenticity()
+                is_authentic, _, _, _, _ = self.controller.get_cached_authenticity()
                 card_genuine = self._create_label(f"Genuine: {'YES' if is_authentic else 'NO'}")
-                card_label_named.place(relx=0.05, rely=0.24)
-                card_genuine.place(relx=0.05, rely=0.34)
+                self._place_later(card_label_named, relx=0.05, rely=0.24)
+                self._place_later(card_genuine, relx=0.05, rely=0.34)
 
-            @log_method
             def _create_card_configuration():
                 try:
                     logger.info("018 Creating card configuration section")
                     card_configuration = self._create_label("Card configuration")
-                    card_configuration.place(relx=0.05, rely=0.42, anchor="w")
+                    self._place_later(card_configuration, relx=0.05, rely=0.42, anchor="w")
                     card_configuration.configure(font=self._make_text_bold())
 
-                    if self.controller.cc.card_type != "Satodime":
-                        pin_info = f"PIN counter:[{self.controller.card_status['PIN0_remaining_tries']}] tries remaining"
+                    if card_type != "Satodime":
+                        pin_info = f"PIN counter:[{card_status['PIN0_remaining_tries']}] tries remaining"
                     else:
                         pin_info = "No PIN required"
-                    self._create_label(pin_info).place(relx=0.05, rely=0.44)
+                    self._place_later(self._create_label(pin_info), relx=0.05, rely=0.44)
 
-                    if self.controller.cc.card_type == "Satochip":
-                        two_fa_status = "2FA enabled" if self.controller.cc.needs_2FA else "2FA disabled"
-                        self._create_label(two_fa_status).place(relx=0.05, rely=0.52)
+                    if card_type == "Satochip":
+                        two_fa_status = "2FA enabled" if cc.needs_2FA else "2FA disabled"
+                        self._place_later(self._create_label(two_fa_status), relx=0.05, rely=0.52)
 
                     logger.log(SUCCESS, "019 Card configuration section created successfully")
                 except Exception as e:
                     logger.error(f"020 Error creating card configuration section: {e}", exc_info=True)
                     raise UIElementError(f"021 Failed to create card configuration section: {e}") from e
 
-            @log_method
             def _create_make_backup():
 
                 def switch_in_backup_process_to(value: bool):
@@ -2260,9 +2598,13 @@ class View(customtkinter.CTk):
                     print(f'Entering _create_make_backup')
                     print(f'TrustStore: {self.controller.truststore}')
                     logger.info("Creating make backup section")
-                    self._create_label("Make a backup of your Seedkeeper to another one:").place(relx=0.05, rely=0.53)
-                    self._create_button("Make it !", lambda: [switch_in_backup_process_to(True), show_view_start_backup_process()], None).place(relx=0.62,
-                                                                                                             rely=0.522)
+                    self._place_later(self._create_label("Make a backup of your Seedkeeper to another one:"),
+                                      relx=0.05, rely=0.53)
+                    make_backup_button = self._create_button(
+                        "Make it !",
+                        lambda: [switch_in_backup_process_to(True), show_view_start_backup_process()],
+                        None)
+                    self._place_later(make_backup_button, relx=0.62, rely=0.522)
                     logger.debug("Make backup section created successfully")
                 except Exception as e:
                     logger.error(f"Error creating make backup section: {e}", exc_info=True)
@@ -2330,13 +2672,12 @@ class View(customtkinter.CTk):
                             try:
                                 print(f'Loading start backup background image')
                                 logger.info("Loading start backup background image")
-                                self.backup_start_pictures = self._create_background_photo(self,
-                                                                                           "./pictures_db/backup_start_ws.png")
+                                self.backup_start_pictures = self._create_background_photo("./pictures_db/backup_start_ws.png")
                                 print(f'Backup start pictures: {self.backup_start_pictures}')
                                 self.canvas = self._create_canvas()
                                 self.canvas.config(width=750, height=600)
                                 self.canvas.place(relx=0.5, rely=0.5, anchor="center")
-                                self.canvas.create_image(380, 375, image=self.backup_start_pictures, anchor="center")
+                                self.canvas.create_image(380, 375, image=self.backup_start_pictures.photo, anchor="center")
                                 logger.debug("Start backup background image loaded successfully")
                             except Exception as e:
                                 logger.error(f"Error loading start backup background image: {e}", exc_info=True)
@@ -2443,13 +2784,12 @@ class View(customtkinter.CTk):
                             try:
                                 print(f'Loading step 1 backup background image')
                                 logger.info("Loading step 1 backup background image")
-                                self.backup_start_pictures = self._create_background_photo(self,
-                                                                                           "./pictures_db/backup_step_1_ws.png")
+                                self.backup_start_pictures = self._create_background_photo("./pictures_db/backup_step_1_ws.png")
                                 print(f'Backup step 1 pictures: {self.backup_start_pictures}')
                                 self.canvas = self._create_canvas()
                                 self.canvas.config(width=750, height=600)
                                 self.canvas.place(relx=0.5, rely=0.5, anchor="center")
-                                self.canvas.create_image(380, 375, image=self.backup_start_pictures, anchor="center")
+                                self.canvas.create_image(380, 375, image=self.backup_start_pictures.photo, anchor="center")
                                 logger.debug("Step 1 backup background image loaded successfully")
                             except Exception as e:
                                 logger.error(f"Error loading step 1 backup background image: {e}", exc_info=True)
@@ -2549,12 +2889,11 @@ class View(customtkinter.CTk):
                         def load_step_2_backup_background_image():
                             try:
                                 logger.info("Loading step 2 backup background image")
-                                self.backup_start_pictures = self._create_background_photo(self,
-                                                                                           "./pictures_db/backup_start_ws.png")
+                                self.backup_start_pictures = self._create_background_photo("./pictures_db/backup_start_ws.png")
                                 self.canvas = self._create_canvas()
                                 self.canvas.config(width=750, height=600)
                                 self.canvas.place(relx=0.5, rely=0.5, anchor="center")
-                                self.canvas.create_image(380, 375, image=self.backup_start_pictures, anchor="center")
+                                self.canvas.create_image(380, 375, image=self.backup_start_pictures.photo, anchor="center")
                                 logger.debug("Step 2 backup background image loaded successfully")
                             except Exception as e:
                                 logger.error(f"Error loading step 2 backup background image: {e}", exc_info=True)
@@ -2650,11 +2989,11 @@ class View(customtkinter.CTk):
                         def load_step_3_backup_background_image():
                             try:
                                 logger.info("Loading step 3 backup background image")
-                                self.backup_start_pictures = self._create_background_photo(self, "./pictures_db/backup_step_1_ws.png")
+                                self.backup_start_pictures = self._create_background_photo("./pictures_db/backup_step_1_ws.png")
                                 self.canvas = self._create_canvas()
                                 self.canvas.config(width=750, height=600)
                                 self.canvas.place(relx=0.5, rely=0.5, anchor="center")
-                                self.canvas.create_image(380, 375, image=self.backup_start_pictures, anchor="center")
+                                self.canvas.create_image(380, 375, image=self.backup_start_pictures.photo, anchor="center")
                                 logger.debug("Step 3 backup background image loaded successfully")
                             except Exception as e:
                                 logger.error(f"Error loading step 3 backup background image: {e}", exc_info=True)
@@ -2690,58 +3029,59 @@ class View(customtkinter.CTk):
                         logger.error(f"Error in view_step_3_backup_process: {e}", exc_info=True)
                         raise ViewError(f"Failed to start step 3 backup process view: {e}") from e
 
-            @log_method
             def _create_seed_my_satochip():
-                self._create_label("Initialize your Satochip hardware wallet:").place(relx=0.05, rely=0.65)
-                self._create_button("Initialize it !", None, None).place(relx=0.49, rely=0.642)
+                self._place_later(self._create_label("Initialize your Satochip hardware wallet:"), relx=0.05, rely=0.65)
+                self._place_later(self._create_button("Initialize it !", None, None), relx=0.49, rely=0.642)
 
-            @log_method
             def _create_card_connectivity():
                 try:
                     logger.info("022 Creating card connectivity section")
                     card_connectivity = self._create_label("Card connectivity")
-                    card_connectivity.place(relx=0.05, rely=0.76, anchor="w")
+                    self._place_later(card_connectivity, relx=0.05, rely=0.76, anchor="w")
                     card_connectivity.configure(font=self._make_text_bold())
 
                     nfc_status = {
                         0: "NFC enabled",
                         1: "NFC disabled",
-                    }.get(self.controller.cc.nfc_policy, "NFC: [BLOCKED]")
-                    self._create_label(nfc_status).place(relx=0.05, rely=0.775)
+                    }.get(cc.nfc_policy, "NFC: [BLOCKED]")
+                    self._place_later(self._create_label(nfc_status), relx=0.05, rely=0.775)
 
                     logger.log(SUCCESS, "023 Card connectivity section created successfully")
                 except Exception as e:
                     logger.error(f"024 Error creating card connectivity section: {e}", exc_info=True)
                     raise UIElementError(f"025 Failed to create card connectivity section: {e}") from e
 
-            @log_method
             def _create_software_information():
-                from version import VERSION
                 try:
                     logger.info("026 Creating software information section")
                     software_information = self._create_label("Software information")
-                    software_information.place(relx=0.05, rely=0.85, anchor="w")
+                    self._place_later(software_information, relx=0.05, rely=0.85, anchor="w")
                     software_information.configure(font=self._make_text_bold())
-                    self._create_label(f"SeedKeeper-Tool version: {VERSION}").place(relx=0.05, rely=0.87)
-                    self._create_label(f"Pysatochip version: {PYSATOCHIP_VERSION}").place(relx=0.05, rely=0.91)
+                    self._place_later(self._create_label(f"SeedKeeper-Tool version: {VERSION}"), relx=0.05, rely=0.87)
+                    self._place_later(self._create_label(f"Pysatochip version: {PYSATOCHIP_VERSION}"),
+                                      relx=0.05, rely=0.91)
 
                     logger.log(SUCCESS, "027 Software information section created successfully")
                 except Exception as e:
                     logger.error(f"028 Error creating software information section: {e}", exc_info=True)
                     raise UIElementError(f"029 Failed to create software information section: {e}") from e
 
-            @log_method
             def _load_view_about():
+                authenticated = card_type == "Satodime" or cc.is_pin_set()
+                if authenticated and card_type != "Satodime":
+                    # Raises PinRequiredError when no PIN is cached: checked before anything is built or queued
+                    cc.card_verify_PIN_simple()
                 _create_about_frame()
-                _load_background_image()
-                _create_about_header()
-                _create_card_information()
-                _create_card_configuration()
-                _create_make_backup()
-                _create_seed_my_satochip()
-                _create_card_connectivity()
-                _create_software_information()
-                self.create_satochip_utils_menu()
+                with self._defer_geometry():
+                    _load_background_image()
+                    _create_about_header()
+                    _create_card_information(authenticated)
+                    _create_card_configuration()
+                    _create_make_backup()
+                    _create_seed_my_satochip()
+                    _create_card_connectivity()
+                    _create_software_information()
+                    self.create_satochip_utils_menu()
 
             _load_view_about()
             logger.log(SUCCESS, "037 view_about method completed successfully")
@@ -2788,425 +3128,272 @@ class View(customtkinter.CTk):
 
         @log_method
         def _create_secrets_table(secrets_data):
-            logger.debug(f"secret data: {secrets_data}")
-            def _on_mouse_on_secret(event, buttons):
-                for button in buttons:
-                    button.configure(fg_color=HIGHLIGHT_COLOR, cursor="hand2")
-
-            def _on_mouse_out_secret(event, buttons):
-                for button in buttons:
-                    button.configure(fg_color=button.default_color)
-
-            def _show_secret_details(secret):
-                try:
-                    logger.info(f"Showing details for secret ID: {secret['id']}")
-                    self._create_frame()
-                    logger.debug(f"secret concerned: {secret}")
-
-                    logger.debug("Managing export rights control")
-                    secret_details = {}
-                    if secret['export_rights'] == '0x2':
-                        secret_details['type'] = secret['type']
-                        secret_details['label'] = secret['label']
-                        secret_details['secret'] = 'Export failed: export not allowed by SeedKeeper policy.'
-                        secret_details['subtype'] = 0x0 if secret['subtype'] == '0x0' else '0x1'
-                        logger.debug(f"Export_rights: Not allowed for {secret} with id {secret['id']}")
-                    else:
-                        logger.debug(f"Export rights allowed for {secret} with id {secret['id']}")
-                        secret_details = self.controller.retrieve_details_about_secret_selected(secret['id'])
-                        secret_details['id'] = secret['id']
-                        logger.debug(f"secret id details: {secret_details} for id: {secret_details['id']}")
-                    logger.log(SUCCESS, f"Secret details retrieved: {secret_details}")
-
-                    logger.debug("Creating and placing header for Secret détails frame")
-                    self.header = self._create_an_header("Secret details", "secrets_icon_ws.png")
-                    self.header.place(relx=0.03, rely=0.08, anchor="nw")
-
-                    logger.debug("Calling the main menu for seedkeeper")
-                    self.create_seedkeeper_menu()
-
-                    logger.debug("Starting to control the secret type to choose the corresponding frame to dsplay")
-                    if secret['type'] == 'Password':
-                        logger.debug(f"Secret: {secret}, with id {secret['id']} is a couple login password")
-                        _create_password_secret_frame(secret_details)
-                        logger.debug(f"Frame corresponding to {secret['type']} details called")
-                    elif secret['type'] == 'Masterseed':
-                        if secret_details['subtype'] > 0 or secret_details['subtype'] == '0x1':
-                            logger.info(f"this is mnemonic, subtype: {secret['subtype']}")
-                            logger.debug(f"Frame corresponding to {secret['type']} details called for subtype: {secret['subtype']}")
-                            _create_mnemonic_secret_frame(secret_details)
-                        else:
-                            logger.info(f"this is masterseed, subtype: {secret['subtype']}")
-                            _create_masterseed_secret_frame(secret_details)
-                            logger.debug(f"Frame corresponding to {secret['type']} details called for subtype: {secret['subtype']}")
-                    elif secret['type'] == "BIP39 mnemonic":
-                        logger.debug(f"Secret: {secret}, with id {secret['id']} is a {secret['type']}")
-                        _create_mnemonic_secret_frame(secret_details)
-                        logger.debug(f"Frame corresponding to {secret['type']}{secret['type']} details called")
-                    elif secret['type'] == 'Electrum mnemonic':
-                        logger.debug(f"Secret: {secret}, with id {secret['id']} is a {secret['type']}")
-                        _create_mnemonic_secret_frame(secret_details)
-                        logger.debug(f"Frame corresponding to {secret['type']} details called")
-                    elif secret['type'] == '2FA secret':
-                        logger.debug(f"Secret: {secret}, with id {secret['id']} is a {secret['type']}")
-                        _create_2FA_secret_frame(secret_details)
-                        logger.debug(f"Frame corresponding to {secret['type']} details called")
-                    elif secret['type'] == 'Free text':
-                        logger.info(f"this is mnemonic, subtype: {secret['subtype']}")
-                        logger.debug(f"Frame corresponding to {secret['type']} details called for subtype: {secret['subtype']}")
-                        _create_free_text_secret_frame(secret_details)
-                    elif secret['type'] == 'Wallet descriptor':
-                        logger.info(f"this is wallet descriptor, subtype: {secret['subtype']}")
-                        logger.debug(f"Frame corresponding to {secret['type']} details called for subtype: {secret['subtype']}")
-                        _create_wallet_descriptor_secret_frame(secret_details)
-                    else:
-                        logger.warning(f"Unsupported secret type: {secret['type']}")
-                        self.show("WARNING", f"Unsupported type:\n{secret['type']}", "Ok", None, "./pictures_db/secrets_icon_ws.png")
-
-                    back_button = self._create_button(text="Back", command=self.show_view_my_secrets)
-                    back_button.place(relx=0.95, rely=0.98, anchor="se")
-
-                    logger.log(SUCCESS, f"012 Secret details displayed for ID: {secret['id']}")
-                except Exception as e:
-                    logger.error(f"013 Error displaying secret details: {e}", exc_info=True)
-                    raise SecretFrameCreationError("Error displaying secret details") from e
-
+            logger.debug("secret data: %s", secrets_data)
             try:
-                logger.info("Creating secrets table")
-
-                subtype_dict = {
-                    '0x0': 'masterseed',
-                    '0x1': 'Mnemonic seedphrase',
-                }
-
-                # Introduce table
-                label_text = self._create_label(text="Click on a secret to manage it:")
-                label_text.place(relx=0.05, rely=0.25, anchor="w")
-
-                # Define headers
-                headers = ["Id", "Type of secret", "Label"]
-                rely = 0.3
-
-                # Create header labels
-                header_frame = customtkinter.CTkFrame(self.current_frame, width=750, bg_color=DEFAULT_BG_COLOR,
-                                                      corner_radius=0, fg_color=DEFAULT_BG_COLOR)
-                header_frame.place(relx=0.05, rely=rely, relwidth=0.9, anchor="w")
-
-                header_widths = [100, 250, 350]  # Define specific widths for each header
-                for col, width in zip(headers, header_widths):
-                    header_button = customtkinter.CTkButton(header_frame, text=col,
-                                                            font=customtkinter.CTkFont(size=14, family='Outfit',
-                                                                                       weight="bold"),
-                                                            corner_radius=0, state='disabled', text_color='white',
-                                                            fg_color=BG_MAIN_MENU, width=width)
-                    header_button.pack(side="left", expand=True, fill="both")
-
-                logger.debug("015 Table headers created")
-
-                table_frame = self._create_scrollable_frame(self.current_frame, width=700, height=400, x=33.5, y=200)
-
-                # Create rows of labels with alternating colors
-                for i, secret in enumerate(secrets_data['headers']):
-                    try:
-                        rely += 0.06
-                        row_frame = customtkinter.CTkFrame(table_frame, width=750, bg_color=DEFAULT_BG_COLOR,
-                                                           fg_color=DEFAULT_BG_COLOR)
-                        row_frame.pack(pady=2, fill="x")
-
-                        fg_color = DEFAULT_BG_COLOR if i % 2 == 0 else BG_HOVER_BUTTON
-                        text_color = TEXT_COLOR if i % 2 == 0 else BUTTON_TEXT_COLOR
-
-                        buttons = []
-                        secret_type = None
-                        if secret['type'] == "Masterseed" and secret['subtype'] == '0x1':
+                with self._defer_geometry():
+                    logger.info("Creating secrets table")
+
+                    # Introduce table
+                    label_text = self._create_label(text="Click on a secret to manage it:")
+                    self._place_later(label_text, relx=0.05, rely=0.25, anchor="w")
+
+                    # (column, heading, width) of the table
+                    headers = (("id", "Id", 100), ("type", "Type of secret", 250), ("label", "Label", 350))
+
+                    container = customtkinter.CTkFrame(self.current_frame, width=700, height=434,
+                                                       fg_color=DEFAULT_BG_COLOR)
+                    self._place_later(container, x=33.5, y=166)
+                    container.pack_propagate(False)
+
+                    # ttk does not follow the CTk scaling: fonts, row height and columns are scaled here
+                    scaling = customtkinter.ScalingTracker.get_widget_scaling(container)
+                    style = ttk.Style(self)
+                    style.configure("Secrets.Treeview", font=("Outfit", -round(14 * scaling), "normal"),
+                                    rowheight=round(32 * scaling))
+                    style.configure("Secrets.Treeview.Heading", font=("Outfit", -round(14 * scaling), "bold"))
+
+                    # A single native widget for the whole table: Tk only draws the visible rows
+                    tree = ttk.Treeview(container, columns=[name for name, _, _ in headers], show="headings",
+                                        style="Secrets.Treeview", selectmode="browse", cursor="hand2")
+                    for name, text, width in headers:
+                        tree.heading(name, text=text)
+                        tree.column(name, width=round(width * scaling), anchor="center")
+                    scrollbar = customtkinter.CTkScrollbar(container, orientation="vertical", command=tree.yview,
+                                                           fg_color=DEFAULT_BG_COLOR, button_color=DEFAULT_BG_COLOR,
+                                                           button_hover_color=BG_HOVER_BUTTON)
+                    tree.configure(yscrollcommand=scrollbar.set)
+                    scrollbar.pack(side="right", fill="y")
+                    tree.pack(side="left", fill="both", expand=True)
+
+                    row_tags = ("even", "odd")
+                    for tag, (background, foreground) in zip(row_tags, _ROW_STYLES):
+                        tree.tag_configure(tag, background=background, foreground=foreground)
+                    tree.tag_configure("hover", background=HIGHLIGHT_COLOR, foreground=TEXT_COLOR)
+                    logger.debug("015 Table headers created")
+
+                    # Headers read once: one dict lookup per field, then tuples in the loop
+                    rows = [(secret['id'], secret['type'], secret['subtype'], secret['label'], secret)
+                            for secret in secrets_data['headers']]
+                    secrets_by_iid = {}
+                    for i, (secret_id, secret_type, subtype, label, secret) in enumerate(rows):
+                        if secret_type == "Masterseed" and subtype == '0x1':
                             secret_type = "Mnemonic seedphrase"
-                        values = [secret['id'], secret['type'] if not secret_type else secret_type, secret['label']]
-                        for value, width in zip(values, header_widths):
-                            cell_button = customtkinter.CTkButton(row_frame, text=value, text_color=text_color,
-                                                                  fg_color=fg_color,
-                                                                  font=customtkinter.CTkFont(size=14, family='Outfit'),
-                                                                  hover_color=HIGHLIGHT_COLOR,
-                                                                  corner_radius=0, width=width)
-                            cell_button.default_color = fg_color  # Store the default color
-                            cell_button.pack(side='left', expand=True, fill="both")
-                            buttons.append(cell_button)
-
-                        # Bind hover events to change color for all buttons in the row
-                        for button in buttons:
-                            button.bind("<Enter>", lambda event, btns=buttons: _on_mouse_on_secret(event, btns))
-                            button.bind("<Leave>", lambda event, btns=buttons: _on_mouse_out_secret(event, btns))
-                            button.configure(command=lambda s=secret: _show_secret_details(s))
-
-                        logger.debug(f"016 Row created for secret ID: {secret['id']}")
-                    except Exception as e:
-                        logger.error(f"017 Error creating row for secret {secret['id']}: {str(e)}")
-                        raise UIElementError(f"018 Failed to create row for secret {secret['id']}") from e
+                        iid = tree.insert("", "end", values=(secret_id, secret_type, label),
+                                          tags=(row_tags[i & 1],))
+                        secrets_by_iid[iid] = secret
+                    logger.debug("016 %s rows inserted", len(secrets_by_iid))
+
+                    hovered_iid = ""
+
+                    def _restore_hovered_row(event=None):
+                        nonlocal hovered_iid
+                        if hovered_iid:
+                            tree.item(hovered_iid, tags=(row_tags[tree.index(hovered_iid) & 1],))
+                            hovered_iid = ""
+
+                    def _on_tree_motion(event):
+                        nonlocal hovered_iid
+                        iid = tree.identify_row(event.y)
+                        if iid == hovered_iid:
+                            return
+                        _restore_hovered_row()
+                        if iid:
+                            tree.item(iid, tags=("hover",))
+                            hovered_iid = iid
+
+                    def _open_secret(iid):
+                        if iid in secrets_by_iid:
+                            self._show_secret_details(secrets_by_iid[iid])
+
+                    # A row opens on click or Return; the arrow keys only move the selection
+                    tree.bind("<Motion>", _on_tree_motion)
+                    tree.bind("<Leave>", _restore_hovered_row)
+                    tree.bind("<ButtonRelease-1>", lambda event: _open_secret(tree.identify_row(event.y)))
+                    tree.bind("<Return>", lambda event: _open_secret(tree.focus()))
 
                 logger.log(SUCCESS, "019 Secrets table created successfully")
             except Exception as e:
                 logger.error(f"020 Error in _create_secrets_table: {e}", exc_info=True)
                 raise UIElementError(f"021 Failed to create secrets table: {e}") from e
 
-        @log_method
-        def _create_password_secret_frame(secret_details):
-            try:
-                logger.info("001 Creating password secret frame to display secret details")
-
-                # Create field for label login, url and password
-                try:
-                    label_label = self._create_label("Label:")
-                    label_label.place(relx=0.045, rely=0.2)
-                    self.label_entry = self._create_entry()
-                    self.label_entry.insert(0, secret_details['label'])
-                    self.label_entry.place(relx=0.045, rely=0.27)
-                    logger.debug("002 label fields created")
-
-                    login_label = self._create_label("Login:")
-                    login_label.place(relx=0.045, rely=0.34)
-                    self.login_entry = self._create_entry(show_option="*")
-                    self.login_entry.place(relx=0.045, rely=0.41)
-                    logger.debug("003 login fields created")
-
-
-                    url_label = self._create_label("Url:")
-                    url_label.place(relx=0.045, rely=0.48)
-                    self.url_entry = self._create_entry(show_option="*")
-                    self.url_entry.place(relx=0.045, rely=0.55)
-                    logger.debug("004 url fields created")
-
-                    password_label = self._create_label("Password:")
-                    password_label.place(relx=0.045, rely=0.7, anchor="w")
-                    self.password_entry = self._create_entry(show_option="*")
-                    self.password_entry.configure(width=500)
-                    self.password_entry.place(relx=0.04, rely=0.77, anchor="w")
-                    logger.debug("005 password fields created")
-
-                    # Decode secret
-                    try:
-                        logger.debug("006 Decoding secret to show")
-                        self.decoded_login_password = self.controller._decode_password(secret_details, binascii.unhexlify(secret_details['secret']))
-                        logger.log(
-                            SUCCESS, f"login password secret decoded successfully: {self.decoded_login_password}"
-                        )
-                    except ValueError as e:
-                        self.show("ERROR", f"Invalid secret format: {str(e)}", "Ok")
-                    except ControllerError as e:
-                        self.show("ERROR", f"Failed to decode secret: {str(e)}", "Ok")
-
-                    self.login_entry.insert(0, self.decoded_login_password['login'])
-                    self.url_entry.insert(0, self.decoded_login_password['url'])
-                    self.password_entry.insert(0, self.decoded_login_password['password'][1:])
+        def _load_view_my_secrets():
+                logger.info("Creating secrets frame")
+                _create_secrets_frame()
+                _create_secrets_header()
+                _create_secrets_table(secrets_data)
+                self.create_seedkeeper_menu()
+                logger.log(SUCCESS, "Secrets frame created successfully")
 
-                except Exception as e:
-                    logger.error(f"008 Error creating fields: {e}", exc_info=True)
-                    raise UIElementError(f"009 Failed to create fields: {e}") from e
+        try:
+            _load_view_my_secrets()
+        except Exception as e:
+            error_msg = f"Failed to create secrets frame: {e}"
+            logger.error(error_msg, exc_info=True)
+            raise SecretFrameCreationError(error_msg) from e
 
-                def _toggle_password_visibility(login_entry, url_entry, password_entry):
-                    try:
-                        # login
-                        login_current_state = login_entry.cget("show")
-                        login_new_state = "" if login_current_state == "*" else "*"
-                        login_entry.configure(show=login_new_state)
-
-                        # url
-                        url_current_state =  url_entry.cget("show")
-                        url_new_state = "" if url_current_state == "*" else "*"
-                        url_entry.configure(show=url_new_state)
-
-                        # password
-                        password_current_state = password_entry.cget("show")
-                        password_new_state = "" if password_current_state == "*" else "*"
-                        password_entry.configure(show=password_new_state)
-
-                        logger.log(
-                            SUCCESS,
-                            f"{'hidden' if (login_new_state, url_new_state, password_new_state) == '*' else 'visible'}"
-                        )
-                    except Exception as e:
-                        logger.error(f"018 Error toggling password visibility: {e}", exc_info=True)
-                        raise UIElementError(f"019 Failed to toggle password visibility: {e}") from e
+    @log_method
+    def _show_secret_details(self, secret):
+        try:
+            logger.info("Showing details for secret ID: %s", secret['id'])
+            self._create_frame()
+            logger.debug("secret concerned: %s", secret)
+
+            logger.debug("Managing export rights control")
+            secret_details = {}
+            if secret['export_rights'] == '0x2':
+                secret_details['type'] = secret['type']
+                secret_details['label'] = secret['label']
+                secret_details['secret'] = 'Export failed: export not allowed by SeedKeeper policy.'
+                secret_details['subtype'] = 0x0 if secret['subtype'] == '0x0' else '0x1'
+                logger.debug("Export_rights: Not allowed for %s with id %s", secret, secret['id'])
+            else:
+                logger.debug("Export rights allowed for %s with id %s", secret, secret['id'])
+                secret_details = self.controller.retrieve_details_about_secret_selected(secret['id'])
+                secret_details['id'] = secret['id']
+                logger.debug("secret id details: %s for id: %s", secret_details, secret_details['id'])
+            logger.log(SUCCESS, "Secret details retrieved: %s", secret_details)
 
-                # Create action buttons
-                try:
-                    show_button = self._create_button(text="Show",
-                                                      command=lambda: _toggle_password_visibility(
-                                                          self.login_entry, self.url_entry, self.password_entry)
-                                                      )
-                    show_button.place(relx=0.9, rely=0.8, anchor="se")
-
-                    delete_button = self._create_button(
-                        text="Delete secret",
-                        command=lambda: [
-                            self.show(
-                                "WARNING",
-                                "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
-                                "Yes",
-                                lambda: [self.controller.cc.seedkeeper_reset_secret(secret_details['id']),
-                                         self.show_view_my_secrets()],
-                                './pictures_db/secrets_icon_ws.png'),
-                            self.show_view_my_secrets()
-                        ]
-                    )
-                    delete_button.place(relx=0.75, rely=0.98, anchor="se")
-                    logger.debug("010 Action buttons created")
-                except Exception as e:
-                    logger.error(f"011 Error creating action buttons: {e}", exc_info=True)
-                    raise UIElementError(f"012 Failed to create action buttons: {e}") from e
+            logger.debug("Creating and placing header for Secret détails frame")
+            self.header = self._create_an_header("Secret details", "secrets_icon_ws.png")
+            self.header.place(relx=0.03, rely=0.08, anchor="nw")
 
-                logger.log(SUCCESS, "013 Password secret frame created successfully")
-            except Exception as e:
-                logger.error(f"014 Unexpected error in _create_password_secret_frame: {e}", exc_info=True)
-                raise ViewError(f"015 Failed to create password secret frame: {e}") from e
+            logger.debug("Calling the main menu for seedkeeper")
+            self.create_seedkeeper_menu()
 
-        @log_method
-        def _create_masterseed_secret_frame(secret_details):
-            try:
-                logger.debug(f"masterseed_secret_details: {secret_details}")
-                logger.info("001 Creating mnemonic secret frame")
-                # Create labels and entry fields
-                labels = ['Label:', 'Mnemonic type:']
-                entries = {}
+            secret_type = secret['type']
+            builder = self._SECRET_FRAME_BUILDERS.get(secret_type)
+            if secret_type == 'Masterseed' and not (secret_details['subtype'] > 0 or secret_details['subtype'] == '0x1'):
+                builder = self._MASTERSEED_FRAME_BUILDER
+            logger.debug("Secret %s is a %s, subtype: %s", secret['id'], secret_type, secret['subtype'])
+            if builder is not None:
+                builder(self, secret_details)
+            else:
+                logger.warning("Unsupported secret type: %s", secret_type)
+                self.show("WARNING", f"Unsupported type:\n{secret_type}", "Ok", None, "./pictures_db/secrets_icon_ws.png")
 
-                for i, label_text in enumerate(labels):
-                    try:
-                        label = self._create_label(label_text)
-                        label.place(relx=0.045, rely=0.2 + i * 0.15, anchor="w")
-                        logger.debug(f"Created label: {label_text}")
-
-                        entry = self._create_entry()
-                        entry.place(relx=0.04, rely=0.27 + i * 0.15, anchor="w")
-                        entries[label_text.lower()[:-1]] = entry
-                        logger.debug(f"Created entry for: {label_text}")
-                    except Exception as e:
-                        logger.error(f"Error creating label or entry for {label_text}: {e}", exc_info=True)
-                        raise UIElementError(f"Failed to create label or entry for {label_text}: {e}") from e
+            back_button = self._create_button(text="Back", command=self.show_view_my_secrets)
+            back_button.place(relx=0.95, rely=0.98, anchor="se")
 
-                # Set values to label and mnemonic type
-                entries['label'].insert(0, secret_details['label'])
-                entries['mnemonic type'].insert(0, secret_details['type'])
+            logger.log(SUCCESS, "012 Secret details displayed for ID: %s", secret['id'])
+        except Exception as e:
+            logger.error(f"013 Error displaying secret details: {e}", exc_info=True)
+            raise SecretFrameCreationError("Error displaying secret details") from e
 
-                # lock possibilities to wright into entries
-                entries['label'].configure(state='disabled')
-                entries['mnemonic type'].configure(state='disabled')
-                logger.debug("Entry values set")
+    @log_method
+    def _create_password_secret_frame(self, secret_details):
+        try:
+            logger.info("001 Creating password secret frame to display secret details")
 
-                if secret_details['secret'] != "Export failed: export not allowed by SeedKeeper policy.":
-                    # Decode seed to mnemonic
-                    try:
-                        logger.debug("Decoding seed to mnemonic words")
-                        secret = self.controller.decode_masterseed(secret_details)
-                        mnemonic = secret['mnemonic']
-                        passphrase = secret['passphrase']
-                    except Exception as e:
-                        logger.error(f"Error decoding Masterseed: {e}", exc_info=True)
-                        raise ControllerError(f"015 Failed to decode Masterseed: {e}") from e
-                else:
-                    mnemonic = secret_details['secret']
-                    passphrase = secret_details['secret']
+            # Create field for label login, url and password
+            try:
+                _, self.label_entry = self._create_labeled_entry("Label:", 0.045, 0.2, 0.27,
+                                                                 value=secret_details['label'])
+                _, self.login_entry = self._create_labeled_entry("Login:", 0.045, 0.34, 0.41, show_option="*")
+                _, self.url_entry = self._create_labeled_entry("Url:", 0.045, 0.48, 0.55, show_option="*")
+                _, self.password_entry = self._create_labeled_entry("Password:", 0.045, 0.7, 0.77, show_option="*",
+                                                                    width=500, anchor="w", entry_relx=0.04)
+                logger.debug("005 label, login, url and password fields created")
 
-                # Create mnemonic field
+                # Decode secret
                 try:
-                    mnemonic_label = self._create_label("Mnemonic:")
-                    mnemonic_label.place(relx=0.045, rely=0.65, anchor="w")
+                    logger.debug("006 Decoding secret to show")
+                    self.decoded_login_password = self.controller._decode_password(
+                        secret_details, binascii.unhexlify(secret_details['secret']))
+                    logger.log(SUCCESS, "login password secret decoded successfully")
+                except ValueError as e:
+                    self.show("ERROR", f"Invalid secret format: {str(e)}", "Ok")
+                except ControllerError as e:
+                    self.show("ERROR", f"Failed to decode secret: {str(e)}", "Ok")
 
-                    mnemonic_textbox = self._create_textbox()
-                    mnemonic_textbox.place(relx=0.04, rely=0.8, relheight=0.23, anchor="w")
-                    mnemonic_textbox.insert("1.0", '*' * len(mnemonic))
-                    logger.debug("013 Mnemonic field created")
-                except Exception as e:
-                    logger.error(f"014 Error creating mnemonic field: {e}", exc_info=True)
-                    raise UIElementError(f"015 Failed to create mnemonic field: {e}") from e
+                self.login_entry.insert(0, self.decoded_login_password['login'])
+                self.url_entry.insert(0, self.decoded_login_password['url'])
+                self.password_entry.insert(0, self.decoded_login_password['password'][1:])
 
-                # Function to toggle visibility of mnemonic
-                @log_method
-                def _toggle_mnemonic_visibility(textbox, original_text):
-                    try:
-                        logger.info("016 Toggling mnemonic visibility")
-                        textbox.configure(state='normal')
-                        # Obtenir le contenu actuel de la textbox
-                        current_text = textbox.get("1.0", "end-1c")
-
-                        if current_text == '*' * len(original_text):
-                            # Si la textbox contient uniquement des étoiles, afficher le texte original
-                            textbox.delete("1.0", "end")
-                            textbox.insert("1.0", original_text)
-                            textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "017 Mnemonic visibility toggled to visible")
-                        else:
-                            # Sinon, masquer le texte avec des étoiles
-                            textbox.delete("1.0", "end")
-                            textbox.insert("1.0", '*' * len(original_text))
-                            textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "017 Mnemonic visibility toggled to hidden")
+            except Exception as e:
+                logger.error(f"008 Error creating fields: {e}", exc_info=True)
+                raise UIElementError(f"009 Failed to create fields: {e}") from e
 
-                    except Exception as e:
-                        logger.error(f"018 Error toggling mnemonic visibility: {e}", exc_info=True)
-                        raise UIElementError(f"019 Failed to toggle mnemonic visibility: {e}") from e
+            password_visible = False
 
-                # Create action buttons
+            def _toggle_password_visibility(login_entry, url_entry, password_entry):
+                nonlocal password_visible
                 try:
-                    delete_button = self._create_button(
-                        text="Delete secret",
-                        command=lambda: [
-                            self.show(
-                                "WARNING",
-                                "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
-                                "Yes",
-                                lambda: [self.controller.cc.seedkeeper_reset_secret(secret_details['id']),
-                                         self.show_view_my_secrets()],
-                                './pictures_db/secrets_icon_ws.png'),
-                            self.show_view_my_secrets()
-                        ]
-                    )
-                    delete_button.place(relx=0.75, rely=0.98, anchor="se")
+                    # The three fields toggle together: a single state, no cget() round-trip to Tk
+                    password_visible = not password_visible
+                    show = "" if password_visible else "*"
+                    for entry in (login_entry, url_entry, password_entry):
+                        entry.configure(show=show)
 
-                    show_button = self._create_button(text="Show",
-                                                      command=lambda: [_toggle_mnemonic_visibility(mnemonic_textbox, mnemonic)])
-                    show_button.place(relx=0.95, rely=0.8, anchor="e")
-                    logger.debug("020 Action buttons created")
+                    logger.log(SUCCESS, "Login password fields %s", 'visible' if password_visible else 'hidden')
                 except Exception as e:
-                    logger.error(f"021 Error creating action buttons: {e}", exc_info=True)
-                    raise UIElementError(f"022 Failed to create action buttons: {e}") from e
-
-                logger.log(SUCCESS, "023 Mnemonic secret frame created successfully")
-            except Exception as e:
-                logger.error(f"024 Unexpected error in _create_mnemonic_secret_frame: {e}", exc_info=True)
-                raise ViewError(f"025 Failed to create mnemonic secret frame: {e}") from e
+                    logger.error(f"018 Error toggling password visibility: {e}", exc_info=True)
+                    raise UIElementError(f"019 Failed to toggle password visibility: {e}") from e
 
-        @log_method
-        def _create_mnemonic_secret_frame(secret_details):
+            # Create action buttons
             try:
+                show_button = self._create_button(text="Show",
+                                                  command=lambda: _toggle_password_visibility(
+                                                      self.login_entry, self.url_entry, self.password_entry))
+                show_button.place(relx=0.9, rely=0.8, anchor="se")
+
+                delete_button = self._create_button(
+                    text="Delete secret",
+                    command=lambda: [
+                        self.show(
+                            "WARNING",
+                            "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
+                            "Yes",
+                            lambda: [self.controller.reset_secret(secret_details['id']),
+                                     self.show_view_my_secrets()],
+                            './pictures_db/secrets_icon_ws.png', modal=True),
+                        self.show_view_my_secrets()
+                    ]
+                )
+                delete_button.place(relx=0.75, rely=0.98, anchor="se")
+                logger.debug("010 Action buttons created")
+            except Exception as e:
+                logger.error(f"011 Error creating action buttons: {e}", exc_info=True)
+                raise UIElementError(f"012 Failed to create action buttons: {e}") from e
 
-                logger.debug(f"masterseed_secret_details: {secret_details}")
-                logger.info("001 Creating mnemonic secret frame")
-                # Create labels and entry fields
-                labels = ['Label:', 'Mnemonic type:']
-                entries = {}
-
-                for i, label_text in enumerate(labels):
-                    try:
-                        label = self._create_label(label_text)
-                        label.place(relx=0.045, rely=0.2 + i * 0.15, anchor="w")
-                        logger.debug(f"Created label: {label_text}")
-
-                        entry = self._create_entry()
-                        entry.place(relx=0.04, rely=0.255 + i * 0.15, anchor="w")
-                        entries[label_text.lower()[:-1]] = entry
-                        logger.debug(f"Created entry for: {label_text}")
-                    except Exception as e:
-                        logger.error(f"Error creating label or entry for {label_text}: {e}", exc_info=True)
-                        raise UIElementError(f"Failed to create label or entry for {label_text}: {e}") from e
+            logger.log(SUCCESS, "013 Password secret frame created successfully")
+        except Exception as e:
+            logger.error(f"014 Unexpected error in _create_password_secret_frame: {e}", exc_info=True)
+            raise ViewError(f"015 Failed to create password secret frame: {e}") from e
 
-                # Set values to label and mnemonic type
-                entries['label'].insert(0, secret_details['label'])
-                entries['mnemonic type'].insert(0, 'Mnemonic seedphrase')
+    @log_method
+    def _create_seed_secret_frame(self, secret_details, variant):
+        try:
+            layout = _SEED_FRAME_VARIANTS[variant]
+            logger.debug("%s secret details: %s", variant, secret_details)
+            logger.info("001 Creating %s secret frame", variant)
+            # Create labels and entry fields
+            labels = ['Label:', 'Mnemonic type:']
+            entries = {}
+
+            for i, label_text in enumerate(labels):
+                try:
+                    label = self._create_label(label_text)
+                    label.place(relx=0.045, rely=0.2 + i * 0.15, anchor="w")
+                    logger.debug("Created label: %s", label_text)
+
+                    entry = self._create_entry()
+                    entry.place(relx=0.04, rely=layout['entry_rely'] + i * 0.15, anchor="w")
+                    entries[label_text.lower()[:-1]] = entry
+                    logger.debug("Created entry for: %s", label_text)
+                except Exception as e:
+                    logger.error(f"Error creating label or entry for {label_text}: {e}", exc_info=True)
+                    raise UIElementError(f"Failed to create label or entry for {label_text}: {e}") from e
 
+            # Set values to label and mnemonic type
+            entries['label'].insert(0, secret_details['label'])
+            entries['mnemonic type'].insert(0, layout['type_text'] or secret_details['type'])
 
-                # lock possibilities to wright into entries
-                entries['label'].configure(state='disabled')
-                entries['mnemonic type'].configure(state='disabled')
-                logger.debug("Entry values set")
+            # lock possibilities to wright into entries
+            entries['label'].configure(state='disabled')
+            entries['mnemonic type'].configure(state='disabled')
+            logger.debug("Entry values set")
 
+            if layout['with_passphrase']:
                 def show_seed_qr_code():
                     import pyqrcode
                     # Fonction pour générer et afficher le QR code
@@ -3230,406 +3417,381 @@ class View(customtkinter.CTk):
                     logger.error(f"Error creating Xpub and SeedQR buttons: {e}", exc_info=True)
                     raise UIElementError(f"Failed to create Xpub and SeedQR buttons: {e}") from e
 
-                if secret_details['secret'] != "Export failed: export not allowed by SeedKeeper policy.":
-                    # Decode seed to mnemonic
-                    try:
-                        logger.debug("Decoding seed to mnemonic words")
-                        secret = self.controller.decode_masterseed(secret_details)
-                        mnemonic = secret['mnemonic']
-                        passphrase = secret['passphrase']
-                        print(passphrase)
-                    except Exception as e:
-                        logger.error(f"Error decoding Masterseed: {e}", exc_info=True)
-                        raise ControllerError(f"015 Failed to decode Masterseed: {e}") from e
-                else:
-                    mnemonic = secret_details['secret']
-                    passphrase = secret_details['secret']
+            if secret_details['secret'] != "Export failed: export not allowed by SeedKeeper policy.":
+                # Decode seed to mnemonic
+                try:
+                    logger.debug("Decoding seed to mnemonic words")
+                    secret = self.controller.decode_masterseed(secret_details)
+                    mnemonic = secret['mnemonic']
+                    passphrase = secret['passphrase']
+                except Exception as e:
+                    logger.error(f"Error decoding Masterseed: {e}", exc_info=True)
+                    raise ControllerError(f"015 Failed to decode Masterseed: {e}") from e
+            else:
+                mnemonic = secret_details['secret']
+                passphrase = secret_details['secret']
 
-                # Create passphrase field
+            # Create passphrase field
+            passphrase_entry = None
+            if layout['with_passphrase']:
                 try:
-                    passphrase_label = self._create_label("Passphrase:")
+                    # Without a passphrase the label is enough: no entry to mask or toggle
+                    passphrase_label = self._create_label("Passphrase:" if passphrase else "Passphrase: None")
                     passphrase_label.place(relx=0.045, rely=0.56, anchor="w")
 
-                    passphrase_entry = self._create_entry()
-                    passphrase_entry.place(relx=0.2, rely=0.56, anchor="w", relwidth=0.585)
-                    passphrase_entry.insert(0, '*' * len(
-                        passphrase) if passphrase != '' else 'None')  # Masque la passphrase
+                    if passphrase:
+                        passphrase_mask = '*' * len(passphrase)
+                        # The toggle only calls set() on the variable, with no delete/insert
+                        passphrase_var = StringVar(self, value=passphrase_mask)  # Masque la passphrase
+                        passphrase_entry = self._create_entry(textvariable=passphrase_var)
+                        passphrase_entry.place(relx=0.2, rely=0.56, anchor="w", relwidth=0.585)
+                        passphrase_entry.configure(state='disabled')
                     logger.debug("010 Passphrase field created")
                 except Exception as e:
                     logger.error(f"011 Error creating passphrase field: {e}", exc_info=True)
                     raise UIElementError(f"012 Failed to create passphrase field: {e}") from e
 
-                # Create mnemonic field
-                try:
-                    mnemonic_label = self._create_label("Mnemonic:")
-                    mnemonic_label.place(relx=0.045, rely=0.63, anchor="w")
-
-                    self.seed_mnemonic_textbox = self._create_textbox()
-                    self.seed_mnemonic_textbox.place(relx=0.04, rely=0.77, relheight=0.23, anchor="w")
-                    self.seed_mnemonic_textbox.insert("1.0", '*' * len(mnemonic))
-                    logger.debug("013 Mnemonic field created")
-                except Exception as e:
-                    logger.error(f"014 Error creating mnemonic field: {e}", exc_info=True)
-                    raise UIElementError(f"015 Failed to create mnemonic field: {e}") from e
-
-                # Function to toggle visibility of passphrase
-                @log_method
-                def _toggle_passphrase_visibility(entry, original_text):
-                    try:
-                        entry.configure(state='normal')
-                        logger.info("020 Toggling passphrase visibility")
-                        # retrieve the content from actual entry
-                        current_text = entry.get()
+            # Create mnemonic field
+            try:
+                label_rely, textbox_rely = layout['mnemonic_rely']
+                mnemonic_label = self._create_label("Mnemonic:")
+                mnemonic_label.place(relx=0.045, rely=label_rely, anchor="w")
+
+                self.seed_mnemonic_textbox = self._create_textbox()
+                self.seed_mnemonic_textbox.place(relx=0.04, rely=textbox_rely, relheight=0.23, anchor="w")
+                mnemonic_mask = '*' * len(mnemonic)
+                self.seed_mnemonic_textbox.insert("1.0", mnemonic_mask)
+                logger.debug("013 Mnemonic field created")
+            except Exception as e:
+                logger.error(f"014 Error creating mnemonic field: {e}", exc_info=True)
+                raise UIElementError(f"015 Failed to create mnemonic field: {e}") from e
 
-                        if current_text == '*' * len(original_text):
-                            # if entry contains only stars, logger.debug origina text
-                            entry.delete(0, "end")
-                            entry.insert(0, original_text)
-                            logger.log(SUCCESS, "021 Passphrase visibility toggled to visible")
-                            entry.configure(state='disabled')
-                        else:
-                            entry.delete(0, "end")
-                            entry.insert(0, '*' * len(original_text))
-                            entry.configure(state='disabled')
-                            logger.log(SUCCESS, "021 Passphrase visibility toggled to hidden")
+            # Function to toggle visibility of passphrase
+            passphrase_visible = False
 
-                    except Exception as e:
-                        logger.error(f"022 Error toggling passphrase visibility: {e}", exc_info=True)
-                        raise UIElementError(f"023 Failed to toggle passphrase visibility: {e}") from e
+            @log_method
+            def _toggle_passphrase_visibility(variable, original_text, mask):
+                nonlocal passphrase_visible
+                try:
+                    logger.info("020 Toggling passphrase visibility")
+                    passphrase_visible = not passphrase_visible
+                    variable.set(original_text if passphrase_visible else mask)
+                    logger.log(SUCCESS, "021 Passphrase visibility toggled to %s", 'visible' if passphrase_visible else 'hidden')
 
-                # Function to toggle visibility of mnemonic
-                @log_method
-                def _toggle_mnemonic_visibility(textbox, original_text):
-                    try:
-                        logger.info("016 Toggling mnemonic visibility")
-                        textbox.configure(state='normal')
-                        # Obtenir le contenu actuel de la textbox
-                        current_text = textbox.get("1.0", "end-1c")
-
-                        if current_text == '*' * len(original_text):
-                            # Si la textbox contient uniquement des étoiles, afficher le texte original
-                            textbox.delete("1.0", "end")
-                            textbox.insert("1.0", original_text)
-                            textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "017 Mnemonic visibility toggled to visible")
-                        else:
-                            # Sinon, masquer le texte avec des étoiles
-                            textbox.delete("1.0", "end")
-                            textbox.insert("1.0", '*' * len(original_text))
-                            textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "017 Mnemonic visibility toggled to hidden")
+                except Exception as e:
+                    logger.error(f"022 Error toggling passphrase visibility: {e}", exc_info=True)
+                    raise UIElementError(f"023 Failed to toggle passphrase visibility: {e}") from e
 
-                    except Exception as e:
-                        logger.error(f"018 Error toggling mnemonic visibility: {e}", exc_info=True)
-                        raise UIElementError(f"019 Failed to toggle mnemonic visibility: {e}") from e
+            # Function to toggle visibility of mnemonic
+            mnemonic_visible = False
 
-                # Create action buttons
+            @log_method
+            def _toggle_mnemonic_visibility(textbox, original_text, mask):
+                nonlocal mnemonic_visible
                 try:
-                    delete_button = self._create_button(
-                        text="Delete secret",
-                        command=lambda: [
-                            self.show(
-                                "WARNING",
-                                "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
-                                "Yes",
-                                lambda: [self.controller.cc.seedkeeper_reset_secret(secret_details['id']), self.show_view_my_secrets()],
-                                './pictures_db/secrets_icon_ws.png'),
-                            self.show_view_my_secrets()
-                        ]
-                    )
-                    delete_button.place(relx=0.75, rely=0.95, anchor="e")
+                    logger.info("016 Toggling mnemonic visibility")
+                    textbox.configure(state='normal')
+                    mnemonic_visible = not mnemonic_visible
+                    textbox.delete("1.0", "end")
+                    textbox.insert("1.0", original_text if mnemonic_visible else mask)
+                    textbox.configure(state='disabled')
+                    logger.log(SUCCESS, "017 Mnemonic visibility toggled to %s", 'visible' if mnemonic_visible else 'hidden')
 
-                    show_button = self._create_button(text="Show",
-                                                      command=lambda: [_toggle_mnemonic_visibility(self.seed_mnemonic_textbox, mnemonic), _toggle_passphrase_visibility(passphrase_entry, passphrase)])
-                    show_button.place(relx=0.95, rely=0.8, anchor="e")
-                    logger.debug("020 Action buttons created")
                 except Exception as e:
-                    logger.error(f"021 Error creating action buttons: {e}", exc_info=True)
-                    raise UIElementError(f"022 Failed to create action buttons: {e}") from e
+                    logger.error(f"018 Error toggling mnemonic visibility: {e}", exc_info=True)
+                    raise UIElementError(f"019 Failed to toggle mnemonic visibility: {e}") from e
 
-                logger.log(SUCCESS, "023 Mnemonic secret frame created successfully")
-            except Exception as e:
-                logger.error(f"024 Unexpected error in _create_mnemonic_secret_frame: {e}", exc_info=True)
-                raise ViewError(f"025 Failed to create mnemonic secret frame: {e}") from e
+            def _toggle_seed_visibility():
+                _toggle_mnemonic_visibility(self.seed_mnemonic_textbox, mnemonic, mnemonic_mask)
+                if passphrase_entry is not None:
+                    _toggle_passphrase_visibility(passphrase_var, passphrase, passphrase_mask)
 
-        @log_method
-        def _create_2FA_secret_frame(secret_details):
+            # Create action buttons
             try:
-                logger.debug(f"2FA secret details: {secret_details}")
-                self.label_2FA = self._create_label('Label:')
-                self.label_2FA.place(relx=0.045, rely=0.2)
-                self.label_2FA_entry = self._create_entry()
-                self.label_2FA_entry.place(relx=0.045, rely=0.25)
-                self.label_2FA_entry.insert(0, secret_details['label'])
-
-                self.secret_2FA_label = self._create_label('Secret:')
-                self.secret_2FA_label.place(relx=0.045, rely=0.32)
-                self.secret_2FA_entry = self._create_entry(show_option="*")
-                self.secret_2FA_entry.place(relx=0.045, rely=0.37)
-                self.secret_2FA_entry.configure(width=450)
-                self.secret_2FA_entry.insert(0, secret_details['secret'][2:])
-
-                def _toggle_2FA_visibility(secret_2FA_entry):
-                    try:
-                        # secret 2FA
-                        secret_2FA_current_state = secret_2FA_entry.cget("show")
-                        secret_2FA_new_state = "" if secret_2FA_current_state == "*" else "*"
-                        secret_2FA_entry.configure(show=secret_2FA_new_state)
-
-                        logger.log(
-                            SUCCESS,
-                            f"{'hidden' if (secret_2FA_new_state) == '*' else 'visible'}"
-                        )
-                    except Exception as e:
-                        logger.error(f"Error toggling password visibility: {e}", exc_info=True)
-                        raise UIElementError(f"Failed to toggle password visibility: {e}") from e
+                delete_button = self._create_button(
+                    text="Delete secret",
+                    command=lambda: [
+                        self.show(
+                            "WARNING",
+                            "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
+                            "Yes",
+                            lambda: [self.controller.reset_secret(secret_details['id']),
+                                     self.show_view_my_secrets()],
+                            './pictures_db/secrets_icon_ws.png', modal=True),
+                        self.show_view_my_secrets()
+                    ]
+                )
+                delete_button.place(relx=0.75, **layout['delete_place'])
 
-                # Create action buttons
-                try:
-                    show_button = self._create_button(text="Show",
-                                                      command=lambda: _toggle_2FA_visibility(
-                                                          self.secret_2FA_entry))
-                    show_button.place(relx=0.9, rely=0.433, anchor="se")
-
-                    delete_button = self._create_button(
-                        text="Delete secret",
-                        command=lambda: [
-                            self.show(
-                                "WARNING",
-                                "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
-                                "Yes",
-                                lambda: [self.controller.cc.seedkeeper_reset_secret(secret_details['id']),
-                                         self.show_view_my_secrets()],
-                                './pictures_db/secrets_icon_ws.png'),
-                            self.show_view_my_secrets()
-                        ]
-                    )
-                    delete_button.place(relx=0.75, rely=0.95, anchor="e")
-                    logger.debug("Action buttons created")
-                except Exception as e:
-                    logger.error(f"Error creating action buttons: {e}", exc_info=True)
-                    raise UIElementError(f"Failed to create action buttons: {e}") from e
-                logger.log(SUCCESS, "Generic secret frame created")
+                show_button = self._create_button(text="Show", command=_toggle_seed_visibility)
+                show_button.place(relx=0.95, rely=0.8, anchor="e")
+                logger.debug("020 Action buttons created")
             except Exception as e:
-                logger.error(f"Error creating generic secret frame: {e}", exc_info=True)
-                raise UIElementError(f"Failed to create generic secret frame: {e}")
-
-        @log_method
-        def _create_generic_secret_frame(secret_details):
-            try:
-                for key, value in secret_details.items():
-                    label = self._create_label(f"{key}:")
-                    label.place(relx=0.1, rely=0.2 + len(secret_details) * 0.05, anchor="w")
+                logger.error(f"021 Error creating action buttons: {e}", exc_info=True)
+                raise UIElementError(f"022 Failed to create action buttons: {e}") from e
 
-                    entry = self._create_entry(show_option="*" if key.lower() == "value" else None)
-                    entry.insert(0, value)
-                    entry.configure(state="readonly")
-                    entry.place(relx=0.3, rely=0.2 + len(secret_details) * 0.05, anchor="w")
+            logger.log(SUCCESS, "023 %s secret frame created successfully", variant)
+        except Exception as e:
+            logger.error(f"024 Unexpected error in _create_seed_secret_frame: {e}", exc_info=True)
+            raise ViewError(f"025 Failed to create {variant} secret frame: {e}") from e
 
-                logger.log(SUCCESS, "Generic secret frame created")
-            except Exception as e:
-                logger.error(f"Error creating generic secret frame: {e}", exc_info=True)
-                raise UIElementError(f"Failed to create generic secret frame: {e}")
+    @log_method
+    def _create_2FA_secret_frame(self, secret_details):
+        try:
+            logger.debug("2FA secret details: %s", secret_details)
+            self.label_2FA, self.label_2FA_entry = self._create_labeled_entry(
+                'Label:', 0.045, 0.2, 0.25, value=secret_details['label'])
+            self.secret_2FA_label, self.secret_2FA_entry = self._create_labeled_entry(
+                'Secret:', 0.045, 0.32, 0.37, value=secret_details['secret'][2:], show_option="*", width=450)
 
-        @log_method
-        def _create_free_text_secret_frame(secret_details):
-            try:
-                logger.info("Creating free text secret frame to display secret details")
-
-                # Create field for label
-                label_label = self._create_label("Label:")
-                label_label.place(relx=0.045, rely=0.2)
-                self.label_entry = self._create_entry()
-                self.label_entry.insert(0, secret_details['label'])
-                self.label_entry.place(relx=0.045, rely=0.27)
-                self.label_entry.configure(state='disabled')
-                logger.debug("Label field created")
-
-                # Create field for free text content
-                free_text_label = self._create_label("Free Text Content:")
-                free_text_label.place(relx=0.045, rely=0.34)
-                self.free_text_textbox = self._create_textbox()
-                self.free_text_textbox.place(relx=0.045, rely=0.41, relheight=0.4, relwidth=0.7)
-                logger.debug("Free text content field created")
+            secret_2FA_visible = False
 
-                # Decode secret
+            def _toggle_2FA_visibility(secret_2FA_entry):
+                nonlocal secret_2FA_visible
                 try:
-                    logger.debug("Decoding free text to show")
-                    self.decoded_text = self.controller.decode_free_text(secret_details)
-                    free_text = self.decoded_text['text']
-                    logger.log(SUCCESS, f"Free text secret decoded successfully")
-                except ValueError as e:
-                    self.show("ERROR", f"Invalid secret format: {str(e)}", "Ok")
-                except ControllerError as e:
-                    self.show("ERROR", f"Failed to decode secret: {str(e)}", "Ok")
+                    secret_2FA_visible = not secret_2FA_visible
+                    secret_2FA_entry.configure(show="" if secret_2FA_visible else "*")
 
-                # Insert decoded text into textbox
-                self.free_text_textbox.insert("1.0", '*' * len(self.decoded_text['text']))
-                self.free_text_textbox.configure(state='disabled')
+                    logger.log(SUCCESS, "2FA secret %s", 'visible' if secret_2FA_visible else 'hidden')
+                except Exception as e:
+                    logger.error(f"Error toggling password visibility: {e}", exc_info=True)
+                    raise UIElementError(f"Failed to toggle password visibility: {e}") from e
 
-                # Function to toggle visibility of free text
-                @log_method
-                def _toggle_free_text_visibility(free_text_textbox, original_text):
-                    try:
-                        logger.info("Toggling Free text visibility")
-                        free_text_textbox.configure(state='normal')
-                        # Obtenir le contenu actuel de la textbox
-                        current_text = free_text_textbox.get("1.0", "end-1c")
-
-                        if current_text == '*' * len(original_text):
-                            # Si la textbox contient uniquement des étoiles, afficher le texte original
-                            free_text_textbox.delete("1.0", "end")
-                            free_text_textbox.insert("1.0", original_text)
-                            free_text_textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "Free text visibility toggled to visible")
-                        else:
-                            # Sinon, masquer le texte avec des étoiles
-                            free_text_textbox.delete("1.0", "end")
-                            free_text_textbox.insert("1.0", '*' * len(original_text))
-                            free_text_textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "Free text visibility toggled to hidden")
+            # Create action buttons
+            try:
+                show_button = self._create_button(text="Show",
+                                                  command=lambda: _toggle_2FA_visibility(
+                                                      self.secret_2FA_entry))
+                show_button.place(relx=0.9, rely=0.433, anchor="se")
+
+                delete_button = self._create_button(
+                    text="Delete secret",
+                    command=lambda: [
+                        self.show(
+                            "WARNING",
+                            "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
+                            "Yes",
+                            lambda: [self.controller.reset_secret(secret_details['id']),
+                                     self.show_view_my_secrets()],
+                            './pictures_db/secrets_icon_ws.png', modal=True),
+                        self.show_view_my_secrets()
+                    ]
+                )
+                delete_button.place(relx=0.75, rely=0.95, anchor="e")
+                logger.debug("Action buttons created")
+            except Exception as e:
+                logger.error(f"Error creating action buttons: {e}", exc_info=True)
+                raise UIElementError(f"Failed to create action buttons: {e}") from e
+            logger.log(SUCCESS, "Generic secret frame created")
+        except Exception as e:
+            logger.error(f"Error creating generic secret frame: {e}", exc_info=True)
+            raise UIElementError(f"Failed to create generic secret frame: {e}")
 
-                    except Exception as e:
-                        logger.error(f"Error toggling Free text visibility: {e}", exc_info=True)
-                        raise UIElementError(f"Failed to toggle Free text visibility: {e}") from e
+    @log_method
+    def _create_generic_secret_frame(self, secret_details):
+        try:
+            rely = 0.2 + len(secret_details) * 0.05
+            for key, value in secret_details.items():
+                label = self._create_label(f"{key}:")
+                label.place(relx=0.1, rely=rely, anchor="w")
 
-                # Create action buttons
-                try:
-                    show_button = self._create_button(text="Show",
-                                                      command=lambda: _toggle_free_text_visibility(self.free_text_textbox, free_text))
-                    show_button.place(relx=0.95, rely=0.65, anchor="se")
-
-                    delete_button = self._create_button(
-                        text="Delete secret",
-                        command=lambda: [
-                            self.show(
-                                "WARNING",
-                                "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
-                                "Yes",
-                                lambda: [self.controller.cc.seedkeeper_reset_secret(secret_details['id']),
-                                         self.show_view_my_secrets()],
-                                './pictures_db/secrets_icon_ws.png'),
-                            self.show_view_my_secrets()
-                        ]
-                    )
-                    delete_button.place(relx=0.75, rely=0.98, anchor="se")
-                    logger.debug("Action buttons created")
-                except Exception as e:
-                    logger.error(f"Error creating action buttons: {e}", exc_info=True)
-                    raise UIElementError(f"Failed to create action buttons: {e}") from e
+                entry = self._create_entry(show_option="*" if key.lower() == "value" else None)
+                entry.insert(0, value)
+                entry.configure(state="readonly")
+                entry.place(relx=0.3, rely=rely, anchor="w")
 
-                logger.log(SUCCESS, "Free text secret frame created successfully")
-            except Exception as e:
-                logger.error(f"Unexpected error in _create_free_text_secret_frame: {e}", exc_info=True)
-                raise ViewError(f"Failed to create free text secret frame: {e}") from e
+            logger.log(SUCCESS, "Generic secret frame created")
+        except Exception as e:
+            logger.error(f"Error creating generic secret frame: {e}", exc_info=True)
+            raise UIElementError(f"Failed to create generic secret frame: {e}")
 
-        @log_method
-        def _create_wallet_descriptor_secret_frame(secret_details):
+    @log_method
+    def _create_free_text_secret_frame(self, secret_details):
+        try:
+            logger.info("Creating free text secret frame to display secret details")
+
+            # Create field for label
+            label_label = self._create_label("Label:")
+            label_label.place(relx=0.045, rely=0.2)
+            self.label_entry = self._create_entry()
+            self.label_entry.insert(0, secret_details['label'])
+            self.label_entry.place(relx=0.045, rely=0.27)
+            self.label_entry.configure(state='disabled')
+            logger.debug("Label field created")
+
+            # Create field for free text content
+            free_text_label = self._create_label("Free Text Content:")
+            free_text_label.place(relx=0.045, rely=0.34)
+            self.free_text_textbox = self._create_textbox()
+            self.free_text_textbox.place(relx=0.045, rely=0.41, relheight=0.4, relwidth=0.7)
+            logger.debug("Free text content field created")
+
+            # Decode secret
             try:
-                logger.info("Creating wallet descriptor secret frame to display secret details")
-
-                # Create field for label
-                label_label = self._create_label("Label:")
-                label_label.place(relx=0.045, rely=0.2)
-                self.label_entry = self._create_entry()
-                self.label_entry.insert(0, secret_details['label'])
-                self.label_entry.place(relx=0.045, rely=0.27)
-                self.label_entry.configure(state='disabled')
-                logger.debug("Label field created")
-
-                # Create field for wallet descriptor content
-                wallet_descriptor_label = self._create_label("Wallet Descriptor Content:")
-                wallet_descriptor_label.place(relx=0.045, rely=0.34)
-                self.wallet_descriptor_textbox = self._create_textbox()
-                self.wallet_descriptor_textbox.place(relx=0.045, rely=0.41, relheight=0.4, relwidth=0.7)
-                logger.debug("Wallet descriptor content field created")
+                logger.debug("Decoding free text to show")
+                self.decoded_text = self.controller.decode_free_text(secret_details)
+                free_text = self.decoded_text['text']
+                logger.log(SUCCESS, "Free text secret decoded successfully")
+            except ValueError as e:
+                self.show("ERROR", f"Invalid secret format: {str(e)}", "Ok")
+            except ControllerError as e:
+                self.show("ERROR", f"Failed to decode secret: {str(e)}", "Ok")
+
+            # Insert decoded text into textbox
+            free_text_mask = '*' * len(self.decoded_text['text'])
+            self.free_text_textbox.insert("1.0", free_text_mask)
+            self.free_text_textbox.configure(state='disabled')
+
+            # Function to toggle visibility of free text
+            free_text_visible = False
 
-                # Decode secret
+            @log_method
+            def _toggle_free_text_visibility(free_text_textbox, original_text, mask):
+                nonlocal free_text_visible
                 try:
-                    logger.debug("Decoding wallet descriptor to show")
-                    self.decoded_text = self.controller.decode_wallet_descriptor(secret_details)
-                    wallet_descriptor = self.decoded_text['descriptor']
-                    logger.log(SUCCESS, f"Wallet descriptor secret decoded successfully")
-                except ValueError as e:
-                    self.show("ERROR", f"Invalid secret format: {str(e)}", "Ok")
-                except ControllerError as e:
-                    self.show("ERROR", f"Failed to decode secret: {str(e)}", "Ok")
+                    logger.info("Toggling Free text visibility")
+                    free_text_textbox.configure(state='normal')
+                    free_text_visible = not free_text_visible
+                    free_text_textbox.delete("1.0", "end")
+                    free_text_textbox.insert("1.0", original_text if free_text_visible else mask)
+                    free_text_textbox.configure(state='disabled')
+                    logger.log(SUCCESS, "Free text visibility toggled to %s", 'visible' if free_text_visible else 'hidden')
 
-                # Insert decoded text into textbox
-                self.wallet_descriptor_textbox.insert("1.0", '*' * len(self.decoded_text['descriptor']))
-                self.wallet_descriptor_textbox.configure(state='disabled')
+                except Exception as e:
+                    logger.error(f"Error toggling Free text visibility: {e}", exc_info=True)
+                    raise UIElementError(f"Failed to toggle Free text visibility: {e}") from e
 
-                # Function to toggle visibility of wallet descriptor
-                @log_method
-                def _toggle_wallet_descriptor_visibility(wallet_descriptor_textbox, original_text):
-                    try:
-                        logger.info("Toggling Wallet descriptor visibility")
-                        wallet_descriptor_textbox.configure(state='normal')
-                        # Obtenir le contenu actuel de la textbox
-                        current_text = wallet_descriptor_textbox.get("1.0", "end-1c")
-
-                        if current_text == '*' * len(original_text):
-                            # Si la textbox contient uniquement des étoiles, afficher le texte original
-                            wallet_descriptor_textbox.delete("1.0", "end")
-                            wallet_descriptor_textbox.insert("1.0", original_text)
-                            wallet_descriptor_textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "Wallet descriptor visibility toggled to visible")
-                        else:
-                            # Sinon, masquer le texte avec des étoiles
-                            wallet_descriptor_textbox.delete("1.0", "end")
-                            wallet_descriptor_textbox.insert("1.0", '*' * len(original_text))
-                            wallet_descriptor_textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "Wallet descriptor visibility toggled to hidden")
+            # Create action buttons
+            try:
+                show_button = self._create_button(text="Show",
+                                                  command=lambda: _toggle_free_text_visibility(self.free_text_textbox, free_text, free_text_mask))
+                show_button.place(relx=0.95, rely=0.65, anchor="se")
+
+                delete_button = self._create_button(
+                    text="Delete secret",
+                    command=lambda: [
+                        self.show(
+                            "WARNING",
+                            "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
+                            "Yes",
+                            lambda: [self.controller.reset_secret(secret_details['id']),
+                                     self.show_view_my_secrets()],
+                            './pictures_db/secrets_icon_ws.png', modal=True),
+                        self.show_view_my_secrets()
+                    ]
+                )
+                delete_button.place(relx=0.75, rely=0.98, anchor="se")
+                logger.debug("Action buttons created")
+            except Exception as e:
+                logger.error(f"Error creating action buttons: {e}", exc_info=True)
+                raise UIElementError(f"Failed to create action buttons: {e}") from e
 
-                    except Exception as e:
-                        logger.error(f"Error toggling Wallet descriptor visibility: {e}", exc_info=True)
-                        raise UIElementError(f"Failed to toggle Wallet descriptor visibility: {e}") from e
+            logger.log(SUCCESS, "Free text secret frame created successfully")
+        except Exception as e:
+            logger.error(f"Unexpected error in _create_free_text_secret_frame: {e}", exc_info=True)
+            raise ViewError(f"Failed to create free text secret frame: {e}") from e
 
-                # Create action buttons
+    @log_method
+    def _create_wallet_descriptor_secret_frame(self, secret_details):
+        try:
+            logger.info("Creating wallet descriptor secret frame to display secret details")
+
+            # Create field for label
+            label_label = self._create_label("Label:")
+            label_label.place(relx=0.045, rely=0.2)
+            self.label_entry = self._create_entry()
+            self.label_entry.insert(0, secret_details['label'])
+            self.label_entry.place(relx=0.045, rely=0.27)
+            self.label_entry.configure(state='disabled')
+            logger.debug("Label field created")
+
+            # Create field for wallet descriptor content
+            wallet_descriptor_label = self._create_label("Wallet Descriptor Content:")
+            wallet_descriptor_label.place(relx=0.045, rely=0.34)
+            self.wallet_descriptor_textbox = self._create_textbox()
+            self.wallet_descriptor_textbox.place(relx=0.045, rely=0.41, relheight=0.4, relwidth=0.7)
+            logger.debug("Wallet descriptor content field created")
+
+            # Decode secret
+            try:
+                logger.debug("Decoding wallet descriptor to show")
+                self.decoded_text = self.controller.decode_wallet_descriptor(secret_details)
+                wallet_descriptor = self.decoded_text['descriptor']
+                logger.log(SUCCESS, "Wallet descriptor secret decoded successfully")
+            except ValueError as e:
+                self.show("ERROR", f"Invalid secret format: {str(e)}", "Ok")
+            except ControllerError as e:
+                self.show("ERROR", f"Failed to decode secret: {str(e)}", "Ok")
+
+            # Insert decoded text into textbox
+            wallet_descriptor_mask = '*' * len(self.decoded_text['descriptor'])
+            self.wallet_descriptor_textbox.insert("1.0", wallet_descriptor_mask)
+            self.wallet_descriptor_textbox.configure(state='disabled')
+
+            # Function to toggle visibility of wallet descriptor
+            wallet_descriptor_visible = False
+
+            @log_method
+            def _toggle_wallet_descriptor_visibility(wallet_descriptor_textbox, original_text, mask):
+                nonlocal wallet_descriptor_visible
                 try:
-                    show_button = self._create_button(text="Show",
-                                                      command=lambda: _toggle_wallet_descriptor_visibility(
-                                                          self.wallet_descriptor_textbox, wallet_descriptor))
-                    show_button.place(relx=0.95, rely=0.65, anchor="se")
-
-                    delete_button = self._create_button(
-                        text="Delete secret",
-                        command=lambda: [
-                            self.show(
-                                "WARNING",
-                                "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
-                                "Yes",
-                                lambda: [self.controller.cc.seedkeeper_reset_secret(secret_details['id']),
-                                         self.show_view_my_secrets()],
-                                './pictures_db/secrets_icon_ws.png'),
-                            self.show_view_my_secrets()
-                        ]
-                    )
-                    delete_button.place(relx=0.75, rely=0.98, anchor="se")
-                    logger.debug("Action buttons created")
+                    logger.info("Toggling Wallet descriptor visibility")
+                    wallet_descriptor_textbox.configure(state='normal')
+                    wallet_descriptor_visible = not wallet_descriptor_visible
+                    wallet_descriptor_textbox.delete("1.0", "end")
+                    wallet_descriptor_textbox.insert("1.0", original_text if wallet_descriptor_visible else mask)
+                    wallet_descriptor_textbox.configure(state='disabled')
+                    logger.log(SUCCESS, "Wallet descriptor visibility toggled to %s", 'visible' if wallet_descriptor_visible else 'hidden')
+
                 except Exception as e:
-                    logger.error(f"Error creating action buttons: {e}", exc_info=True)
-                    raise UIElementError(f"Failed to create action buttons: {e}") from e
+                    logger.error(f"Error toggling Wallet descriptor visibility: {e}", exc_info=True)
+                    raise UIElementError(f"Failed to toggle Wallet descriptor visibility: {e}") from e
 
-                logger.log(SUCCESS, "Wallet descriptor secret frame created successfully")
+            # Create action buttons
+            try:
+                show_button = self._create_button(text="Show",
+                                                  command=lambda: _toggle_wallet_descriptor_visibility(
+                                                      self.wallet_descriptor_textbox, wallet_descriptor,
+                                                      wallet_descriptor_mask))
+                show_button.place(relx=0.95, rely=0.65, anchor="se")
+
+                delete_button = self._create_button(
+                    text="Delete secret",
+                    command=lambda: [
+                        self.show(
+                            "WARNING",
+                            "Are you sure to delete this secret ?!\n Click Yes for delete the secret or close popup",
+                            "Yes",
+                            lambda: [self.controller.reset_secret(secret_details['id']),
+                                     self.show_view_my_secrets()],
+                            './pictures_db/secrets_icon_ws.png', modal=True),
+                        self.show_view_my_secrets()
+                    ]
+                )
+                delete_button.place(relx=0.75, rely=0.98, anchor="se")
+                logger.debug("Action buttons created")
             except Exception as e:
-                logger.error(f"Unexpected error in _create_wallet_descriptor_secret_frame: {e}", exc_info=True)
-                raise ViewError(f"Failed to create wallet descriptor secret frame: {e}") from e
-
-        def _load_view_my_secrets():
-                logger.info("Creating secrets frame")
-                _create_secrets_frame()
-                _create_secrets_header()
-                _create_secrets_table(secrets_data)
-                self.create_seedkeeper_menu()
-                logger.log(SUCCESS, "Secrets frame created successfully")
+                logger.error(f"Error creating action buttons: {e}", exc_info=True)
+                raise UIElementError(f"Failed to create action buttons: {e}") from e
 
-        try:
-            _load_view_my_secrets()
+            logger.log(SUCCESS, "Wallet descriptor secret frame created successfully")
         except Exception as e:
-            error_msg = f"Failed to create secrets frame: {e}"
-            logger.error(error_msg, exc_info=True)
-            raise SecretFrameCreationError(error_msg) from e
+            logger.error(f"Unexpected error in _create_wallet_descriptor_secret_frame: {e}", exc_info=True)
+            raise ViewError(f"Failed to create wallet descriptor secret frame: {e}") from e
+
+    # Frame displaying the details of each type of secret, resolved once at class creation (called with the
+    # view as first argument); a Masterseed without a mnemonic subtype is rerouted to _MASTERSEED_FRAME_BUILDER
+    _MNEMONIC_FRAME_BUILDER = functools.partial(_create_seed_secret_frame, variant='mnemonic')
+    _MASTERSEED_FRAME_BUILDER = functools.partial(_create_seed_secret_frame, variant='masterseed')
+    _SECRET_FRAME_BUILDERS = {
+        'Password': _create_password_secret_frame,
+        'Masterseed': _MNEMONIC_FRAME_BUILDER,
+        'BIP39 mnemonic': _MNEMONIC_FRAME_BUILDER,
+        'Electrum mnemonic': _MNEMONIC_FRAME_BUILDER,
+        '2FA secret': _create_2FA_secret_frame,
+        'Free text': _create_free_text_secret_frame,
+        'Wallet descriptor': _create_wallet_descriptor_secret_frame,
+    }
 
 
     @log_method
@@ -3720,61 +3882,63 @@ class View(customtkinter.CTk):
                     @log_method
                     def _generate_mnemonic_widgets():
                         try:
-                            logger.info("Creating generate mnemonic content")
-
-                            label = self._create_label("Label*:")
-                            label.place(relx=0.05, rely=0.20, anchor="nw")
-
-                            self.mnemonic_label_name = self._create_entry()
-                            self.mnemonic_label_name.place(relx=0.04, rely=0.25, anchor="nw")
-
-                            self.radio_value = customtkinter.StringVar(value="12")
-                            self.use_passphrase = customtkinter.BooleanVar(value=False)
-
-                            radio_12 = customtkinter.CTkRadioButton(
-                                self.current_frame,
-                                text="12 words",
-                                variable=self.radio_value,
-                                value="12",
-                                command=_update_mnemonic
-                            )
-                            radio_12.place(relx=0.05, rely=0.35, anchor="w")
-
-                            radio_24 = customtkinter.CTkRadioButton(
-                                self.current_frame,
-                                text="24 words",
-                                variable=self.radio_value,
-                                value="24",
-                                command=_update_mnemonic
-                            )
-                            radio_24.place(relx=0.2, rely=0.35, anchor="w")
-
-                            self.mnemonic_textbox = self._create_textbox()
-                            self.mnemonic_textbox.place(relx=0.045, rely=0.5, relheight=0.23, anchor="w")
-
-                            passphrase_checkbox = customtkinter.CTkCheckBox(
-                                self.current_frame,
-                                text="Use passphrase",
-                                variable=self.use_passphrase,
-                                command=_toggle_passphrase
-                            )
-                            passphrase_checkbox.place(relx=0.05, rely=0.66, anchor="w")
-
-                            self.passphrase_entry = self._create_entry()
-                            self.passphrase_entry.place(relx=0.045, rely=0.73, anchor="w")
-                            self.passphrase_entry.configure(placeholder_text="Enter passphrase (optional)")
-                            self.passphrase_entry.configure(state='disabled')
-
-                            generate_mnemonic_button = self._create_button("Generate", command=_generate_new_mnemonic)
-                            generate_mnemonic_button.place(relx=0.8, rely=0.49, anchor="w")
-
-                            save_button = self._create_button("Save on card", command=_save_mnemonic_generated_on_card)
-                            save_button.place(relx=0.85, rely=0.93, anchor="center")
-
-                            back_button = self._create_button("Back", command=self.show_view_generate_secret)
-                            back_button.place(relx=0.65, rely=0.93, anchor="center")
-
-                            logger.log(SUCCESS, "Generate mnemonic content created successfully")
+                            with self._defer_geometry():
+                                logger.info("Creating generate mnemonic content")
+
+                                label = self._create_label("Label*:")
+                                self._place_later(label, relx=0.05, rely=0.20, anchor="nw")
+
+                                self.mnemonic_label_name = self._create_entry()
+                                self._place_later(self.mnemonic_label_name, relx=0.04, rely=0.25, anchor="nw")
+
+                                self.radio_value = customtkinter.StringVar(value="12")
+                                self.use_passphrase = customtkinter.BooleanVar(value=False)
+
+                                radio_12 = customtkinter.CTkRadioButton(
+                                    self.current_frame,
+                                    text="12 words",
+                                    variable=self.radio_value,
+                                    value="12",
+                                    command=_update_mnemonic
+                                )
+                                self._place_later(radio_12, relx=0.05, rely=0.35, anchor="w")
+
+                                radio_24 = customtkinter.CTkRadioButton(
+                                    self.current_frame,
+                                    text="24 words",
+                                    variable=self.radio_value,
+                                    value="24",
+                                    command=_update_mnemonic
+                                )
+                                self._place_later(radio_24, relx=0.2, rely=0.35, anchor="w")
+
+                                self.mnemonic_textbox = self._create_textbox()
+                                self._place_later(self.mnemonic_textbox, relx=0.045, rely=0.5, relheight=0.23, anchor="w")
+
+                                passphrase_checkbox = customtkinter.CTkCheckBox(
+                                    self.current_frame,
+                                    text="Use passphrase",
+                                    variable=self.use_passphrase,
+                                    command=_toggle_passphrase
+                                )
+                                self._place_later(passphrase_checkbox, relx=0.05, rely=0.66, anchor="w")
+
+                                self.passphrase_entry = self._create_entry()
+                                self._place_later(self.passphrase_entry, relx=0.045, rely=0.73, anchor="w")
+                                self.passphrase_entry.configure(placeholder_text="Enter passphrase (optional)")
+                                self.passphrase_entry.configure(state='disabled')
+
+                                generate_mnemonic_button = self._create_button("Generate", command=_generate_new_mnemonic)
+                                self._place_later(generate_mnemonic_button, relx=0.8, rely=0.49, anchor="w")
+
+                                self.generate_save_button = self._create_button(
+                                    "Save on card", command=_save_mnemonic_generated_on_card)
+                                self._place_later(self.generate_save_button, relx=0.85, rely=0.93, anchor="center")
+
+                                back_button = self._create_button("Back", command=self.show_view_generate_secret)
+                                self._place_later(back_button, relx=0.65, rely=0.93, anchor="center")
+
+                                logger.log(SUCCESS, "Generate mnemonic content created successfully")
                         except Exception as e:
                             logger.error(f"Error creating generate mnemonic content: {e}", exc_info=True)
                             raise UIElementError(f"Failed to create generate mnemonic content: {e}") from e
@@ -3791,18 +3955,36 @@ class View(customtkinter.CTk):
 
                     @log_method
                     def _generate_new_mnemonic():
+                        def _on_generation_error(e):
+                            logger.error(f"Error generating mnemonic: {e}", exc_info=True)
+                            self.show("ERROR", f"Failed to generate mnemonic: {e}", "Ok", None,
+                                      "./pictures_db/generate_icon_ws.png")
+
+                        self.mnemonic_generation += 1
+                        generation = self.mnemonic_generation
+
+                        def _display_mnemonic(mnemonic):
+                            if generation != self.mnemonic_generation:
+                                logger.debug("Stale mnemonic dropped")
+                                return
+                            try:
+                                self.mnemonic_textbox.configure(state='normal')
+                                self.mnemonic_textbox.delete("1.0", customtkinter.END)
+                                self.mnemonic_textbox.insert("1.0", mnemonic)
+                                self.mnemonic_textbox.configure(state='disabled')
+                                logger.log(SUCCESS, "New mnemonic generated successfully")
+                            except Exception as e:
+                                _on_generation_error(e)
+
                         try:
                             logger.info("Generating new mnemonic")
-                            self.mnemonic_textbox.configure(state='normal')
                             mnemonic_length = int(self.radio_value.get())
-                            mnemonic = self.controller.generate_random_seed(mnemonic_length)
-                            self.mnemonic_textbox.delete("1.0", customtkinter.END)
-                            self.mnemonic_textbox.insert("1.0", mnemonic)
-                            self.mnemonic_textbox.configure(state='disabled')
-                            logger.log(SUCCESS, "New mnemonic generated successfully")
+                            # Generation runs in the pool; the result is displayed from the Tk loop
+                            self._run_in_background(
+                                functools.partial(self.controller.generate_random_seed, mnemonic_length),
+                                _display_mnemonic, _on_generation_error)
                         except Exception as e:
-                            logger.error(f"Error generating mnemonic: {e}", exc_info=True)
-                            raise UIElementError(f"Failed to generate mnemonic: {e}") from e
+                            _on_generation_error(e)
 
                     @log_method
                     def _toggle_passphrase():
@@ -3839,39 +4021,65 @@ class View(customtkinter.CTk):
                                 raise ValueError("Passphrase checked but not provided.")
 
                             if passphrase:
-                                id, fingerprint = self.controller.import_masterseed(label, mnemonic, passphrase)
-
+                                import_task = functools.partial(self.controller.import_masterseed, label, mnemonic,
+                                                                passphrase)
                             else:
-                                id, fingerprint = self.controller.import_masterseed(label, mnemonic)
+                                import_task = functools.partial(self.controller.import_masterseed, label, mnemonic)
 
-                            self.show("SUCCESS", f"Masterseed saved successfully\nID: {id}\nFingerlogger.debug: {fingerprint}",
-                                      "Ok", self.show_view_my_secrets, "./pictures_db/generate_icon_ws.png")
-                            logger.log(SUCCESS, "Masterseed saved to card successfully")
+                            # The card import runs on the card worker; the popups are shown from the Tk loop
+                            self._run_card_task(self.generate_save_button, import_task, _on_masterseed_saved,
+                                                _on_save_error)
+                        except Exception as e:
+                            _on_save_error(e)
 
-                        except ValueError as e:
+                    def _on_masterseed_saved(result):
+                        id, fingerprint = result
+                        self.show("SUCCESS", f"Masterseed saved successfully\nID: {id}\nFingerlogger.debug: {fingerprint}",
+                                  "Ok", self.show_view_my_secrets, "./pictures_db/generate_icon_ws.png")
+                        logger.log(SUCCESS, "Masterseed saved to card successfully")
+
+                    def _on_save_error(e):
+                        if isinstance(e, ValueError):
                             logger.error(f"Validation error saving mnemonic to card: {str(e)}")
                             self.show("ERROR", str(e), "Ok", None,
                                       "./pictures_db/generate_icon_ws.png")
-                        except ControllerError as e:
+                        elif isinstance(e, ControllerError):
                             logger.error(f"Controller error saving mnemonic to card: {str(e)}")
                             self.show("ERROR", f"Failed to save mnemonic: {str(e)}", "Ok", None,
                                       "./pictures_db/generate_icon_ws.png")
-                        except SeedkeeperError as e:
+                        elif isinstance(e, SeedkeeperError):
                             logger.error(f"SeedKeeper error saving mnemonic to card: {str(e)}")
                             self.show("ERROR", f"Failed to save mnemonic: {str(e)}", "Ok", None,
                                       "./pictures_db/generate_icon_ws.png")
-                        except Exception as e:
+                        else:
                             logger.error(f"Unexpected error saving mnemonic to card: {str(e)}")
                             self.show("ERROR", "An unexpected error occurred while saving the mnemonic",
                                       "Ok", None,
                                       "./pictures_db/generate_icon_ws.png")
 
+                    @log_method
+                    def _reset_generate_mnemonic_fields():
+                        # on_hide hook: the generated seed does not outlive the view,
+                        # and bumping the counter keeps a pending generation from refilling it
+                        self.mnemonic_generation += 1
+                        self.mnemonic_label_name.delete(0, "end")
+                        self.radio_value.set("12")
+                        self.mnemonic_textbox.configure(state='normal')
+                        self.mnemonic_textbox.delete("1.0", customtkinter.END)
+                        self.mnemonic_textbox.configure(state='disabled')
+                        self.use_passphrase.set(False)
+                        self.passphrase_entry.configure(state='normal')
+                        self.passphrase_entry.delete(0, "end")
+                        self.passphrase_entry.configure(state='disabled')
+
                     self._clear_current_frame()
-                    _generate_mnemonic_frame()
-                    _generate_mnemonic_header()
-                    _generate_mnemonic_widgets()
+                    if not self._show_cached_view("generate_mnemonic"):
+                        _generate_mnemonic_frame()
+                        _generate_mnemonic_header()
+                        _generate_mnemonic_widgets()
+                        self._cache_current_view("generate_mnemonic", _GENERATE_MNEMONIC_ATTRS,
+                                                 on_hide=_reset_generate_mnemonic_fields)
                     self.create_seedkeeper_menu()
-                    self.mnemonic_textbox_active = True
                     logger.log(SUCCESS, "_show_generate_mnemonic completed successfully")
                 except Exception as e:
                     logger.error(f"Unexpected error in _show_generate_mnemonic: {e}", exc_info=True)
@@ -3906,7 +4114,6 @@ class View(customtkinter.CTk):
 
                     @log_method
                     def _generate_new_password():
-                        import random
                         try:
                             logger.info("066 Generating new login/password")
                             if not self.slider_moved:
@@ -3920,15 +4127,8 @@ class View(customtkinter.CTk):
 
                             # Récupération des types de caractères sélectionnés
                             # retrieving characters selected in checkbox
-                            char_pool = ""
-                            if self.var_abc.get():
-                                char_pool += "abcdefghijklmnopqrstuvwxyz"
-                            if self.var_ABC.get():
-                                char_pool += "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-                            if self.var_numeric.get():
-                                char_pool += "0123456789"
-                            if self.var_symbolic.get():
-                                char_pool += "!@#$%^&*()-_=+[]{}|;:,.<>?/~`"
+                            char_pool = _password_pool((bool(self.var_abc.get()), bool(self.var_ABC.get()),
+                                                        bool(self.var_numeric.get()), bool(self.var_symbolic.get())))
 
                             if not char_pool:
                                 logger.warning("No character sets selected for password generation")
@@ -3936,19 +4136,15 @@ class View(customtkinter.CTk):
                                     "No character sets selected.\nPlease select at least one character set.")
 
                             # Génération du mot de passe
-                            # password generation
-                            generated_password = ''.join(random.choice(char_pool) for _ in range(password_length))
-
-                            # Centrer le mot de passe dans la boîte de texte
-                            # adjust alignement of text into text_boxw
-                            textbox_width = 100
-                            centered_text = generated_password.center(textbox_width)
+                            # password generation (CSPRNG: secrets rather than the Mersenne Twister of random)
+                            generated_password = ''.join(secrets.choice(char_pool) for _ in range(password_length))
 
                             # Affichage du mot de passe dans la boîte de texte
                             # displaying password into text box
+                            # Centered by the "center" tag
                             self.password_text_box.configure(state='normal')
                             self.password_text_box.delete("1.0", customtkinter.END)
-                            self.password_text_box.insert("1.0", centered_text)
+                            self.password_text_box.insert("1.0", generated_password, "center")
                             self.password_text_box.configure(state='disabled')
 
                             logger.log(SUCCESS, "New login/password generated successfully")
@@ -3973,151 +4169,153 @@ class View(customtkinter.CTk):
                     @log_method
                     def _create_generate_password_content():
                         try:
-                            logger.info("074 Creating generate login/password content")
-
-                            # Label and entry creation
-                            # création des labels et des entrées
-                            label = self._create_label("Label*:")
-                            label.place(relx=0.04, rely=0.20, anchor="nw")
-
-                            self.generate_label_name = self._create_entry()
-                            self.generate_label_name.place(relx=0.12, rely=0.195, anchor="nw")
-                            self.generate_label_name.configure(width=400)
-
-                            self.generate_login = self._create_label("Login:")
-                            self.generate_login.place(relx=0.04, rely=0.32, anchor="nw")
-
-                            self.generate_login_name = self._create_entry()
-                            self.generate_login_name.place(relx=0.12, rely=0.318, anchor="nw")
-                            self.generate_login_name.configure(width=400)
-
-                            self.generate_url = self._create_label("Url:")
-                            self.generate_url.place(relx=0.04, rely=0.44, anchor="nw")
-
-                            self.generate_url_name = self._create_entry()
-                            self.generate_url_name.place(relx=0.12, rely=0.438, anchor="nw")
-                            self.generate_url_name.configure(width=400)
-
-                            logger.debug("Labels and entries created successfully")
-                            self.slider_moved = False
-
-                            # Slide bar creation
-                            # Création de la slide bar
-                            @log_method
-                            def _length_slider_event(value):
-                                try:
-                                    self.slider_moved = True
-                                    int_value = int(value)
-                                    length_value_label.configure(text=f"{int_value}")
-                                    length_value_label.place(x=self.length_slider.get() * 3.5 + 250, y=324)
-
-                                    if int_value < 8:
-                                        self.length_slider.configure(button_color="red", progress_color="red")
-                                    elif int_value == 8:
-                                        self.length_slider.configure(button_color="orange", progress_color="orange")
-                                    elif int_value > 8:
-                                        self.length_slider.configure(button_color="green", progress_color="green")
-
-                                    logger.debug(f"076 Slider value updated to {int_value}")
-                                except Exception as e:
-                                    logger.error(f"077 Error updating slider value: {e}", exc_info=True)
-                                    raise UIElementError(f"078 Failed to update slider value: {e}") from e
-
-                            self.length_slider = customtkinter.CTkSlider(self.current_frame,
-                                                                         from_=4, to=16,
-                                                                         command=_length_slider_event,
-                                                                         width=600,
-                                                                         progress_color=BG_HOVER_BUTTON,
-                                                                         button_color=BG_MAIN_MENU)
-
-                            self.length_slider.place(relx=0.15, rely=0.55)
-
-                            length = self._create_label("Length*: ")
-                            length.place(relx=0.04, rely=0.535)
-
-                            length_value_label = self._create_label("6")
-                            length_value_label.configure(font=self._make_text_bold(20))
-                            length_value_label.place(x=250, y=324)
-
-                            logger.debug("079 Slider and length labels created successfully")
-
-                            # Checkbox creation
-                            # Création de la check box
-                            characters_used = self._create_label("Characters used: ")
-                            characters_used.place(relx=0.04, rely=0.6)
-
-                            self.var_abc = customtkinter.StringVar()
-                            self.var_ABC = customtkinter.StringVar()
-                            self.var_numeric = customtkinter.StringVar()
-                            self.var_symbolic = customtkinter.StringVar()
-
-                            @log_method
-                            def checkbox_event():
-                                try:
-                                    selected_values = [self.var_abc.get(), self.var_ABC.get(), self.var_numeric.get(),
-                                                       self.var_symbolic.get()]
-                                    logger.debug(
-                                        f"080 Checkbox selection updated: {', '.join(filter(None, selected_values))}")
-                                except Exception as e:
-                                    logger.error(f"081 Error in checkbox event: {e}", exc_info=True)
-                                    raise UIElementError(f"082 Failed to handle checkbox event: {e}") from e
-
-                            minus_abc = customtkinter.CTkCheckBox(self.current_frame, text="abc", variable=self.var_abc,
-                                                                  onvalue="abc", offvalue="", command=checkbox_event,
-                                                                  checkmark_color=BG_MAIN_MENU,
-                                                                  fg_color=BG_HOVER_BUTTON)
-                            minus_abc.place(relx=0.3, rely=0.6)
-
-                            major_abc = customtkinter.CTkCheckBox(self.current_frame, text="ABC", variable=self.var_ABC,
-                                                                  onvalue="ABC", offvalue="", command=checkbox_event,
-                                                                  checkmark_color=BG_MAIN_MENU,
-                                                                  fg_color=BG_HOVER_BUTTON)
-                            major_abc.place(relx=0.4, rely=0.6)
-
-                            numeric_value = customtkinter.CTkCheckBox(self.current_frame, text="123",
-                                                                      variable=self.var_numeric,
-                                                                      onvalue="123", offvalue="",
-                                                                      command=checkbox_event,
+                            with self._defer_geometry():
+                                logger.info("074 Creating generate login/password content")
+
+                                # Label and entry creation
+                                # création des labels et des entrées
+                                label = self._create_label("Label*:")
+                                self._place_later(label, relx=0.04, rely=0.20, anchor="nw")
+
+                                self.generate_label_name = self._create_entry()
+                                self._place_later(self.generate_label_name, relx=0.12, rely=0.195, anchor="nw")
+                                self.generate_label_name.configure(width=400)
+
+                                self.generate_login = self._create_label("Login:")
+                                self._place_later(self.generate_login, relx=0.04, rely=0.32, anchor="nw")
+
+                                self.generate_login_name = self._create_entry()
+                                self._place_later(self.generate_login_name, relx=0.12, rely=0.318, anchor="nw")
+                                self.generate_login_name.configure(width=400)
+
+                                self.generate_url = self._create_label("Url:")
+                                self._place_later(self.generate_url, relx=0.04, rely=0.44, anchor="nw")
+
+                                self.generate_url_name = self._create_entry()
+                                self._place_later(self.generate_url_name, relx=0.12, rely=0.438, anchor="nw")
+                                self.generate_url_name.configure(width=400)
+
+                                logger.debug("Labels and entries created successfully")
+                                self.slider_moved = False
+
+                                # Slide bar creation
+                                # Création de la slide bar
+                                @log_method
+                                def _length_slider_event(value):
+                                    try:
+                                        self.slider_moved = True
+                                        int_value = int(value)
+                                        length_value_label.configure(text=f"{int_value}")
+                                        length_value_label.place(x=self.length_slider.get() * 3.5 + 250, y=324)
+
+                                        if int_value < 8:
+                                            self.length_slider.configure(button_color="red", progress_color="red")
+                                        elif int_value == 8:
+                                            self.length_slider.configure(button_color="orange", progress_color="orange")
+                                        elif int_value > 8:
+                                            self.length_slider.configure(button_color="green", progress_color="green")
+
+                                        logger.debug("076 Slider value updated to %s", int_value)
+                                    except Exception as e:
+                                        logger.error(f"077 Error updating slider value: {e}", exc_info=True)
+                                        raise UIElementError(f"078 Failed to update slider value: {e}") from e
+
+                                self.length_slider = customtkinter.CTkSlider(self.current_frame,
+                                                                             from_=4, to=16,
+                                                                             command=_length_slider_event,
+                                                                             width=600,
+                                                                             progress_color=BG_HOVER_BUTTON,
+                                                                             button_color=BG_MAIN_MENU)
+
+                                self._place_later(self.length_slider, relx=0.15, rely=0.55)
+
+                                length = self._create_label("Length*: ")
+                                self._place_later(length, relx=0.04, rely=0.535)
+
+                                length_value_label = self._create_label("6")
+                                length_value_label.configure(font=self._make_text_bold(20))
+                                self._place_later(length_value_label, x=250, y=324)
+
+                                logger.debug("079 Slider and length labels created successfully")
+
+                                # Checkbox creation
+                                # Création de la check box
+                                characters_used = self._create_label("Characters used: ")
+                                self._place_later(characters_used, relx=0.04, rely=0.6)
+
+                                self.var_abc = customtkinter.StringVar()
+                                self.var_ABC = customtkinter.StringVar()
+                                self.var_numeric = customtkinter.StringVar()
+                                self.var_symbolic = customtkinter.StringVar()
+
+                                @log_method
+                                def checkbox_event():
+                                    try:
+                                        selected_values = [self.var_abc.get(), self.var_ABC.get(), self.var_numeric.get(),
+                                                           self.var_symbolic.get()]
+                                        logger.debug(
+                                            f"080 Checkbox selection updated: {', '.join(filter(None, selected_values))}")
+                                    except Exception as e:
+                                        logger.error(f"081 Error in checkbox event: {e}", exc_info=True)
+                                        raise UIElementError(f"082 Failed to handle checkbox event: {e}") from e
+
+                                minus_abc = customtkinter.CTkCheckBox(self.current_frame, text="abc", variable=self.var_abc,
+                                                                      onvalue="abc", offvalue="", command=checkbox_event,
                                                                       checkmark_color=BG_MAIN_MENU,
                                                                       fg_color=BG_HOVER_BUTTON)
-                            numeric_value.place(relx=0.5, rely=0.6)
-
-                            symbolic_value = customtkinter.CTkCheckBox(self.current_frame, text="#$&",
-                                                                       variable=self.var_symbolic,
-                                                                       onvalue="#$&", offvalue="",
-                                                                       command=checkbox_event,
-                                                                       checkmark_color=BG_MAIN_MENU,
-                                                                       fg_color=BG_HOVER_BUTTON)
-                            symbolic_value.place(relx=0.6, rely=0.6)
-
-                            logger.debug("083 Checkboxes created successfully")
-
-                            password_label = self._create_label("Generated password:")
-                            password_label.place(relx=0.04, rely=0.67, anchor="nw")
-
-                            self.password_text_box = customtkinter.CTkTextbox(self, corner_radius=20,
-                                                                              bg_color="whitesmoke", fg_color=BG_BUTTON,
-                                                                              border_color=BG_BUTTON, border_width=1,
-                                                                              width=500, height=83,
-                                                                              text_color="grey",
-                                                                              font=customtkinter.CTkFont(
-                                                                                  family="Outfit",
-                                                                                  size=13,
-                                                                                  weight="normal"))
-                            self.password_text_box.place(relx=0.28, rely=0.8, anchor="w")
-                            self.password_text_box.configure(state='disabled')
-
-                            generate_password_button = self._create_button("Generate", command=_update_password)
-                            generate_password_button.place(relx=0.75, rely=0.8, anchor="w")
-
-                            save_button = self._create_button("Save on card", command=_save_password_to_card)
-                            save_button.place(relx=0.85, rely=0.93, anchor="center")
+                                self._place_later(minus_abc, relx=0.3, rely=0.6)
 
-                            back_button = self._create_button("Back",
-                                                              command=self.show_view_generate_secret)
-                            back_button.place(relx=0.65, rely=0.93, anchor="center")
-
-                            logger.log(SUCCESS, "084 Generate login/password content created successfully")
+                                major_abc = customtkinter.CTkCheckBox(self.current_frame, text="ABC", variable=self.var_ABC,
+                                                                      onvalue="ABC", offvalue="", command=checkbox_event,
+                                                                      checkmark_color=BG_MAIN_MENU,
+                                                                      fg_color=BG_HOVER_BUTTON)
+                                self._place_later(major_abc, relx=0.4, rely=0.6)
+
+                                numeric_value = customtkinter.CTkCheckBox(self.current_frame, text="123",
+                                                                          variable=self.var_numeric,
+                                                                          onvalue="123", offvalue="",
+                                                                          command=checkbox_event,
+                                                                          checkmark_color=BG_MAIN_MENU,
+                                                                          fg_color=BG_HOVER_BUTTON)
+                                self._place_later(numeric_value, relx=0.5, rely=0.6)
+
+                                symbolic_value = customtkinter.CTkCheckBox(self.current_frame, text="#$&",
+                                                                           variable=self.var_symbolic,
+                                                                           onvalue="#$&", offvalue="",
+                                                                           command=checkbox_event,
+                                                                           checkmark_color=BG_MAIN_MENU,
+                                                                           fg_color=BG_HOVER_BUTTON)
+                                self._place_later(symbolic_value, relx=0.6, rely=0.6)
+
+                                logger.debug("083 Checkboxes created successfully")
+
+                                password_label = self._create_label("Generated password:")
+                                self._place_later(password_label, relx=0.04, rely=0.67, anchor="nw")
+
+                                self.password_text_box = customtkinter.CTkTextbox(self.current_frame, corner_radius=20,
+                                                                                  bg_color="whitesmoke", fg_color=BG_BUTTON,
+                                                                                  border_color=BG_BUTTON, border_width=1,
+                                                                                  width=500, height=83,
+                                                                                  text_color="grey",
+                                                                                  font=_font("Outfit", 13, "normal"))
+                                # Inside the frame (x=250 on the window) so it is cached along with it
+                                self._place_later(self.password_text_box, relx=0.04, rely=0.8, anchor="w")
+                                # Centered by Tk, without padding the text with spaces
+                                self.password_text_box.tag_config("center", justify="center")
+                                self.password_text_box.configure(state='disabled')
+
+                                generate_password_button = self._create_button("Generate", command=_update_password)
+                                self._place_later(generate_password_button, relx=0.75, rely=0.8, anchor="w")
+
+                                self.generate_save_button = self._create_button("Save on card",
+                                                                                command=_save_password_to_card)
+                                self._place_later(self.generate_save_button, relx=0.85, rely=0.93, anchor="center")
+
+                                back_button = self._create_button("Back",
+                                                                  command=self.show_view_generate_secret)
+                                self._place_later(back_button, relx=0.65, rely=0.93, anchor="center")
+
+                                logger.log(SUCCESS, "084 Generate login/password content created successfully")
                         except Exception as e:
                             logger.error(f"085 Error creating generate login/password content: {e}", exc_info=True)
                             raise UIElementError(f"086 Failed to create generate login/password content: {e}") from e
@@ -4136,28 +4334,53 @@ class View(customtkinter.CTk):
                                 raise ValueError("The label field is mandatory.")
 
                             if password:
-                                id, fingerprint = self.controller.import_password(label, login, password, url)
-                                self.show("SUCCESS",
-                                          f"Password saved successfully\nID: {id}\nFingerlogger.debug: {fingerprint}",
-                                          "Ok", self.show_view_my_secrets, "./pictures_db/generate_icon_ws.png")
-                                logger.log(SUCCESS, "Password saved to card successfully")
+                                # The card import runs on the card worker; the popups are shown from the Tk loop
+                                self._run_card_task(
+                                    self.generate_save_button,
+                                    functools.partial(self.controller.import_password, label, login, password, url),
+                                    _on_password_saved, _on_password_save_error)
                             else:
                                 logger.warning("No password to save")
                                 raise ValueError("No password generated")
-                        except ValueError as e:
+                        except Exception as e:
+                            _on_password_save_error(e)
+
+                    def _on_password_saved(result):
+                        id, fingerprint = result
+                        self.show("SUCCESS",
+                                  f"Password saved successfully\nID: {id}\nFingerlogger.debug: {fingerprint}",
+                                  "Ok", self.show_view_my_secrets, "./pictures_db/generate_icon_ws.png")
+                        logger.log(SUCCESS, "Password saved to card successfully")
+
+                    def _on_password_save_error(e):
+                        if isinstance(e, ValueError):
                             logger.error(f"Error saving login/password to card: {e}", exc_info=True)
                             self.show("ERROR", str(e), "Ok", None, "./pictures_db/generate_icon_ws.png")
-                            raise UIElementError(f"Failed to save login/password to card: {e}") from e
-                        except Exception as e:
+                        else:
                             logger.error(f"Unexpected error saving login/password to card: {e}", exc_info=True)
-                            raise UIElementError(f"Unexpected error saving login/password to card: {e}") from e
+                            self.show("ERROR", f"Failed to save login/password: {e}", "Ok", None,
+                                      "./pictures_db/generate_icon_ws.png")
+
+                    @log_method
+                    def _reset_generate_password_fields():
+                        # on_hide hook: the generated password does not outlive the view;
+                        # the slider keeps its length, colour and label, so slider_moved is kept as well
+                        for entry in (self.generate_label_name, self.generate_login_name, self.generate_url_name):
+                            entry.delete(0, "end")
+                        for variable in (self.var_abc, self.var_ABC, self.var_numeric, self.var_symbolic):
+                            variable.set("")
+                        self.password_text_box.configure(state='normal')
+                        self.password_text_box.delete("1.0", customtkinter.END)
+                        self.password_text_box.configure(state='disabled')
 
                     self._clear_current_frame()
-                    _create_generate_password_frame()
-                    _create_generate_password_header()
-                    _create_generate_password_content()
+                    if not self._show_cached_view("generate_password"):
+                        _create_generate_password_frame()
+                        _create_generate_password_header()
+                        _create_generate_password_content()
+                        self._cache_current_view("generate_password", _GENERATE_PASSWORD_ATTRS,
+                                                 on_hide=_reset_generate_password_fields)
                     self.create_seedkeeper_menu()
-                    self.password_text_box_active = True
 
                     logger.log(SUCCESS, "095 _show_generate_password completed successfully")
                 except Exception as e:
@@ -4469,10 +4692,7 @@ class View(customtkinter.CTk):
                                                                               border_color=BG_BUTTON, border_width=1,
                                                                               width=500, height=83,
                                                                               text_color="black",
-                                                                              font=customtkinter.CTkFont(
-                                                                                  family="Outfit",
-                                                                                  size=13,
-                                                                                  weight="normal"))
+                                                                              font=_font("Outfit", 13, "normal"))
                             self.password_text_box.place(relx=0.28, rely=0.7, anchor="w")
 
                             save_button = self._create_button("Save on card", command=_save_password_to_import_on_card)
@@ -4788,64 +5008,92 @@ class View(customtkinter.CTk):
             @log_method
             def _create_logs_table(logs_details):
                 try:
-                    logger.info("010 Creating logs table")
-
-                    def _on_mouse_on_log(event, buttons):
-                        for button in buttons:
-                            button.configure(fg_color=HIGHLIGHT_COLOR, cursor="hand2")
-
-                    def _on_mouse_out_log(event, buttons):
-                        for button in buttons:
-                            button.configure(fg_color=button.default_color)
-
-                    label_text = self._create_label(text="Find what had been done in your Seedkeeper card:")
-                    label_text.place(relx=0.05, rely=0.25, anchor="w")
-
-                    headers = ['Operation', 'ID1', 'ID2', 'Result']
-                    header_widths = [300, 75, 75, 300]
-
-                    header_frame = customtkinter.CTkFrame(self.current_frame, width=750, bg_color=DEFAULT_BG_COLOR,
-                                                          corner_radius=0, fg_color=DEFAULT_BG_COLOR)
-                    header_frame.place(relx=0.04, rely=0.3, relwidth=0.9, anchor="w")
-
-                    for col, width in zip(headers, header_widths):
-                        header_button = customtkinter.CTkButton(header_frame, text=col,
-                                                                font=customtkinter.CTkFont(size=14, family='Outfit',
-                                                                                           weight="bold"),
-                                                                corner_radius=0, state='disabled', text_color='white',
-                                                                fg_color=BG_MAIN_MENU, width=width)
-                        header_button.pack(side="left", expand=True, fill="both")
-
-                    logger.debug("011 Table headers created")
-
-                    table_frame = self._create_scrollable_frame(self.current_frame, width=700, height=400, x=26, y=200)
-
-                    for i, log in enumerate(logs_details):
-                        row_frame = customtkinter.CTkFrame(table_frame, width=750, bg_color=DEFAULT_BG_COLOR,
-                                                           fg_color=DEFAULT_BG_COLOR)
-                        row_frame.pack(pady=2, fill="x")
-
-                        fg_color = DEFAULT_BG_COLOR if i % 2 == 0 else BG_HOVER_BUTTON
-                        text_color = TEXT_COLOR if i % 2 == 0 else BUTTON_TEXT_COLOR
-
-                        buttons = []
-                        values = [log['Operation'], log['ID1'], log['ID2'], log['Result']]
-                        for value, width in zip(values, header_widths):
-                            cell_button = customtkinter.CTkButton(row_frame, text=value, text_color=text_color,
-                                                                  fg_color=fg_color,
-                                                                  font=customtkinter.CTkFont(size=14, family='Outfit'),
-                                                                  hover_color=HIGHLIGHT_COLOR, width=width,
-                                                                  corner_radius=0)
-                            cell_button.default_color = fg_color
-                            cell_button.pack(side='left', expand=True, fill="both")
-                            buttons.append(cell_button)
-
-                        for button in buttons:
-                            button.bind("<Enter>", lambda event, btns=buttons: _on_mouse_on_log(event, btns))
-                            button.bind("<Leave>", lambda event, btns=buttons: _on_mouse_out_log(event, btns))
-
-                        logger.debug(
-                            f"012 Row created for log: {log['Operation'], log['ID1'], log['ID2'], log['Result']}")
+                    with self._defer_geometry():
+                        logger.info("010 Creating logs table")
+
+                        # Rows indexed by their Tk path, resolved from event.widget by the class bindings below
+                        rows_by_path = {}
+
+                        def _on_mouse_on_log(event):
+                            row = rows_by_path.get(str(event.widget))
+                            if row is None or row["highlighted"]:
+                                return
+                            row["highlighted"] = True
+                            for button in row["buttons"]:
+                                button.configure(fg_color=HIGHLIGHT_COLOR)
+
+                        def _on_mouse_out_log(event):
+                            row = rows_by_path.get(str(event.widget))
+                            if row is None:
+                                return
+                            # Pointer moved onto one of the row's own cells: still hovering the row
+                            hovered = event.widget.winfo_containing(event.x_root, event.y_root)
+                            if hovered is not None and (str(hovered) + ".").startswith(row["path"]):
+                                return
+                            if not row["highlighted"]:
+                                return
+                            row["highlighted"] = False
+                            for button in row["buttons"]:
+                                button.configure(fg_color=button.default_color)
+
+                        label_text = self._create_label(text="Find what had been done in your Seedkeeper card:")
+                        self._place_later(label_text, relx=0.05, rely=0.25, anchor="w")
+
+                        headers = ['Operation', 'ID1', 'ID2', 'Result']
+                        header_widths = [300, 75, 75, 300]
+
+                        header_frame = customtkinter.CTkFrame(self.current_frame, width=750, bg_color=DEFAULT_BG_COLOR,
+                                                              corner_radius=0, fg_color=DEFAULT_BG_COLOR)
+                        self._place_later(header_frame, relx=0.04, rely=0.3, relwidth=0.9, anchor="w")
+
+                        def _configure_columns(frame):
+                            # Header and rows share the same weighted columns so the cells stay aligned
+                            for col, width in enumerate(header_widths):
+                                frame.grid_columnconfigure(col, weight=width, uniform="log_cols")
+
+                        _configure_columns(header_frame)
+                        for col, (header, width) in enumerate(zip(headers, header_widths)):
+                            header_button = customtkinter.CTkButton(header_frame, text=header,
+                                                                    font=_font("Outfit", 14, "bold"),
+                                                                    corner_radius=0, state='disabled', text_color='white',
+                                                                    fg_color=BG_MAIN_MENU, width=width)
+                            self._grid_later(header_button, row=0, column=col, sticky="nsew")
+
+                        logger.debug("011 Table headers created")
+
+                        table_frame = self._create_scrollable_frame(self.current_frame, width=700, height=400, x=26, y=200)
+
+                        # Options shared by every cell, bound once (the font needs the Tk root)
+                        make_cell = functools.partial(customtkinter.CTkButton, font=_font("Outfit", 14, "normal"),
+                                                      cursor="hand2", hover_color=HIGHLIGHT_COLOR, corner_radius=0)
+                        for i, log in enumerate(logs_details):
+                            row_frame = customtkinter.CTkFrame(table_frame, width=750, bg_color=DEFAULT_BG_COLOR,
+                                                               fg_color=DEFAULT_BG_COLOR)
+                            self._pack_later(row_frame, pady=2, fill="x")
+
+                            _configure_columns(row_frame)
+                            fg_color, text_color = _ROW_STYLES[i & 1]
+
+                            buttons = []
+                            values = [log['Operation'], log['ID1'], log['ID2'], log['Result']]
+                            for col, (value, width) in enumerate(zip(values, header_widths)):
+                                cell_button = make_cell(row_frame, text=value, text_color=text_color,
+                                                        fg_color=fg_color, width=width)
+                                cell_button.default_color = fg_color
+                                self._grid_later(cell_button, row=0, column=col, sticky="nsew")
+                                buttons.append(cell_button)
+
+                            # Tagged on the Tk frame itself (CTkFrame.bind targets its background canvas):
+                            # crossing events of the cells reach their parent row, dispatched by the LogRow class
+                            path = str(row_frame)
+                            rows_by_path[path] = {"buttons": buttons, "path": path + ".", "highlighted": False}
+                            tkinter.Misc.bindtags(row_frame, tkinter.Misc.bindtags(row_frame) + ("LogRow",))
+
+                            logger.debug("012 Row created for log: %s", values)
+
+                        # Two class bindings for the whole table, replaced on each rebuild of the view
+                        self.bind_class("LogRow", "<Enter>", _on_mouse_on_log)
+                        self.bind_class("LogRow", "<Leave>", _on_mouse_out_log)
 
                     logger.log(SUCCESS, "013 Logs table created successfully")
                 except Exception as e:
@@ -4914,8 +5162,7 @@ class View(customtkinter.CTk):
                 for text, value, rel_x in radio_buttons:
                     radio = customtkinter.CTkRadioButton(self.current_frame, text=text,
                                                          variable=self.language_radio_value, value=value,
-                                                         font=customtkinter.CTkFont(family="Outfit", size=14,
-                                                                                    weight="normal"),
+                                                         font=_font("Outfit", 14, "normal"),
                                                          bg_color="whitesmoke", fg_color="green", hover_color="green",
                                                          command=_update_radio_selection)
                     radio.place(relx=rel_x, rely=0.28, anchor="w")
@@ -4930,8 +5177,7 @@ class View(customtkinter.CTk):
                                                          border_color=BG_BUTTON, border_width=0,
                                                          width=700, height=280,
                                                          text_color="grey",
-                                                         font=customtkinter.CTkFont(family="Outfit", size=13,
-                                                                                    weight="normal"))
+                                                         font=_font("Outfit", 13, "normal"))
                 self.text_box.place(relx=0.04, rely=0.35, anchor="nw")
 
             @log_method
@@ -4985,7 +5231,6 @@ class View(customtkinter.CTk):
                 _create_help_header()
                 _create_help_content()
                 _create_back_button()
-                self.create_seedkeeper_menu()
 
                 logger.log(SUCCESS, "024 view_help completed successfully")
             except Exception as e:
@@ -4996,6 +5241,3 @@ class View(customtkinter.CTk):
             logger.error(f"027 Unexpected error in view_help: {e}", exc_info=True)
             self.view.show("ERROR", "An unexpected error occurred while displaying help", "Ok", None,
                            "./pictures_db/help_icon.png")
-
-
-